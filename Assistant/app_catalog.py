@@ -0,0 +1,356 @@
+import os
+import platform
+import re
+import shlex
+import stat
+import threading
+import time
+from bisect import bisect_left
+from collections import namedtuple
+
+# command is a ready argv whose first item is an absolute path; origin is the
+# executable, .desktop file or .app bundle the entry was read from
+AppEntry = namedtuple("AppEntry", ["name", "command", "source", "origin"])
+
+# Exec= field codes for files, URLs and icons; launching without arguments drops them
+_FIELD_CODES = {"%f", "%F", "%u", "%U", "%d", "%D", "%n", "%N", "%i", "%c", "%k", "%v", "%m"}
+
+# Launchers come before bare executables when both match equally well
+_SOURCE_RANK = {"desktop": 0, "bundle": 0, "path": 1}
+
+_WORD_START = re.compile(r"(?<=[\s\-_.])\w")
+
+
+def path_dirs():
+    """Directories on PATH in lookup order, without duplicates"""
+    dirs = []
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        directory = os.path.abspath(directory) if directory else None
+        if directory and directory not in dirs:
+            dirs.append(directory)
+    return dirs
+
+
+def desktop_dirs():
+    """XDG ``applications`` folders, the user's own first"""
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    data_dirs = os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share"
+    return [os.path.join(directory, "applications") for directory in [data_home] + data_dirs.split(":") if directory]
+
+
+def bundle_dirs():
+    """macOS application folders and the folders directly inside them, such as /Applications/Utilities"""
+    if platform.system() != "Darwin":
+        return []
+    dirs = []
+    for directory in ["/Applications", "/System/Applications", os.path.expanduser("~/Applications")]:
+        dirs.append(directory)
+        try:
+            with os.scandir(directory) as it:
+                dirs.extend(sorted(dir_entry.path for dir_entry in it
+                                   if not dir_entry.name.endswith(".app") and dir_entry.is_dir()))
+        except OSError:
+            pass
+    return dirs
+
+
+def scan_executables(directory):
+    """Map command name -> absolute path for the executables directly inside ``directory``"""
+    found = {}
+    if platform.system() == "Windows":
+        extensions = [ext.lower() for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(";") if ext]
+        with os.scandir(directory) as it:
+            for dir_entry in it:
+                stem, ext = os.path.splitext(dir_entry.name)
+                if ext.lower() in extensions:
+                    found.setdefault(stem.lower(), dir_entry.path)
+        return found
+    with os.scandir(directory) as it:
+        for dir_entry in it:
+            if dir_entry.name.startswith("."):
+                continue
+            try:
+                mode = dir_entry.stat().st_mode
+            except OSError:
+                continue
+            if stat.S_ISREG(mode) and mode & 0o111:
+                found[dir_entry.name] = dir_entry.path
+    return found
+
+
+def parse_desktop_file(path):
+    """Return ``(name, argv)`` for a launchable application .desktop file, or None"""
+    fields = {}
+    in_entry = False
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    if in_entry:
+                        break
+                    in_entry = line == "[Desktop Entry]"
+                elif in_entry and "=" in line:
+                    key, _, value = line.partition("=")
+                    fields.setdefault(key.strip(), value.strip())
+    except OSError:
+        return None
+    # Hidden launchers and terminal programs are not something to open from here
+    if (fields.get("Type") != "Application" or not fields.get("Name") or not fields.get("Exec")
+            or "true" in (fields.get("NoDisplay"), fields.get("Hidden"), fields.get("Terminal"))):
+        return None
+    try:
+        argv = [arg.replace("%%", "%") for arg in shlex.split(fields["Exec"]) if arg not in _FIELD_CODES]
+    except ValueError:
+        return None
+    return (fields["Name"], argv) if argv else None
+
+
+def scan_desktop_files(directory):
+    """Map desktop file id -> (name, argv, path) for the .desktop files in ``directory``"""
+    found = {}
+    with os.scandir(directory) as it:
+        for dir_entry in it:
+            if dir_entry.name.endswith(".desktop"):
+                parsed = parse_desktop_file(dir_entry.path)
+                if parsed is not None:
+                    found[dir_entry.name] = parsed + (dir_entry.path,)
+    return found
+
+
+def scan_bundles(directory):
+    """Map name -> path for the macOS .app bundles in ``directory``"""
+    with os.scandir(directory) as it:
+        return {dir_entry.name[:-4]: dir_entry.path for dir_entry in it if dir_entry.name.endswith(".app")}
+
+
+SCANNERS = {
+    "path": scan_executables,
+    "desktop": scan_desktop_files,
+    "bundle": scan_bundles
+}
+
+
+class _DirScan:
+    __slots__ = ("mtime_ns", "items")
+
+    def __init__(self, mtime_ns, items):
+        self.mtime_ns = mtime_ns
+        self.items = items
+
+
+def _entries(scans):
+    """Turn per-directory scans into AppEntries, resolving every program to an absolute path"""
+    executables = {}
+    for (kind, _), scan in scans.items():
+        if kind == "path":
+            for name, path in scan.items.items():
+                executables.setdefault(name, path)  # earlier PATH directories win, as in a shell
+
+    entries = []
+    desktop_ids = set()
+    for (kind, _), scan in scans.items():
+        if kind == "desktop":
+            for desktop_id, (name, argv, origin) in scan.items.items():
+                # The user's own launchers shadow system ones with the same id
+                if desktop_id in desktop_ids:
+                    continue
+                desktop_ids.add(desktop_id)
+                program = argv[0] if os.path.isabs(argv[0]) else executables.get(argv[0])
+                if program is not None:
+                    entries.append(AppEntry(name, (program,) + tuple(argv[1:]), "desktop", origin))
+        elif kind == "bundle" and "open" in executables:
+            for name, origin in scan.items.items():
+                entries.append(AppEntry(name, (executables["open"], "-a", origin), "bundle", origin))
+    entries.extend(AppEntry(name, (path,), "path", path) for name, path in executables.items())
+    return entries
+
+
+class _Snapshot:
+    """Search structures for one set of entries, replaced whole so readers need no lock"""
+    __slots__ = ("keys", "targets", "by_name", "ordered")
+
+    def __init__(self, entries=()):
+        self.by_name = {}
+        pairs = []
+        for entry in entries:
+            lowered = entry.name.lower()
+            self.by_name.setdefault(lowered, entry)
+            # The whole name plus every tail starting at a word, so "web" finds "Firefox Web Browser"
+            pairs.append((lowered, entry))
+            pairs.extend((lowered[match.start():], entry) for match in _WORD_START.finditer(lowered))
+        pairs.sort()
+        self.keys = [key for key, _ in pairs]
+        self.targets = [entry for _, entry in pairs]
+        self.ordered = sorted(self.by_name.values(), key=lambda entry: (_SOURCE_RANK[entry.source],
+                                                                        entry.name.lower()))
+
+
+class AppCatalog:
+    """Installed applications, resolved to absolute paths once and searched by prefix
+
+    A background thread reads the PATH directories and the XDG
+    ``applications`` folders (and .app bundles on macOS). Each directory's
+    listing is cached with its mtime and only read again once that changes,
+    so a rescan costs one stat per directory. Every entry carries an argv
+    whose program is already an absolute path, so launching it needs no
+    shell and no PATH search. A .desktop file edited in place is picked up
+    the next time its folder changes.
+    """
+
+    def __init__(self, interval=60):
+        self.interval = interval
+        self._dirs = {}  # (kind, directory) -> _DirScan, in lookup order
+        self._snapshot = _Snapshot()
+        self._scan_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self.last_scan = None  # stats of the last completed update()
+
+    # Background scanning
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="app-catalog", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def refresh(self):
+        """Ask the background thread to rescan now instead of waiting for the interval"""
+        self._wakeup.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.update()
+            except Exception:
+                pass
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+    @property
+    def ready(self):
+        """True once the first scan has finished"""
+        return self._ready.is_set()
+
+    def wait_ready(self, timeout=None):
+        return self._ready.wait(timeout)
+
+    # Scanning
+    def update(self):
+        """Rescan the directories whose mtime has changed and return scan statistics"""
+        with self._scan_lock:
+            started = time.perf_counter()
+            sources = ([("path", directory) for directory in path_dirs()]
+                       + [("desktop", directory) for directory in desktop_dirs()]
+                       + [("bundle", directory) for directory in bundle_dirs()])
+            scans = {}
+            rescanned = 0
+            for source in sources:
+                scan = self._dirs.get(source)
+                try:
+                    mtime_ns = os.stat(source[1]).st_mtime_ns
+                except OSError:
+                    mtime_ns = None
+                if scan is None or scan.mtime_ns != mtime_ns:
+                    scan = _DirScan(mtime_ns, self._scan(*source) if mtime_ns is not None else {})
+                    rescanned += 1
+                scans[source] = scan
+            # PATH reordered or shortened also changes which program a name resolves to
+            if rescanned or list(scans) != list(self._dirs) or not self._ready.is_set():
+                self._snapshot = _Snapshot(_entries(scans))
+            self._dirs = scans
+            self._ready.set()
+            self.last_scan = {
+                "directories": len(scans),
+                "rescanned": rescanned,
+                "apps": len(self._snapshot.by_name),
+                "seconds": time.perf_counter() - started
+            }
+            return self.last_scan
+
+    def _scan(self, kind, directory):
+        try:
+            return SCANNERS[kind](directory)
+        except OSError:
+            return {}
+
+    def _stale(self, entry):
+        scan = self._dirs.get((entry.source, os.path.dirname(entry.origin)))
+        try:
+            return scan is None or os.stat(os.path.dirname(entry.origin)).st_mtime_ns != scan.mtime_ns
+        except OSError:
+            return True
+
+    # Lookups
+    def resolve(self, name, timeout=None):
+        """Return the AppEntry called ``name`` (case-insensitive), or None
+
+        Waits up to ``timeout`` seconds for the first scan. The folder the
+        entry came from is checked with a single stat; if it has changed, or
+        nothing matched, the catalog is brought up to date first, so a stale
+        path is never returned and newly installed programs are found.
+        """
+        if not self._ready.wait(timeout):
+            return None
+        key = name.strip().lower()
+        entry = self._snapshot.by_name.get(key)
+        if entry is None or self._stale(entry):
+            self.update()
+            entry = self._snapshot.by_name.get(key)
+        return entry
+
+    def contains(self, name):
+        """Whether the catalog lists an app called ``name`` (case-insensitive); never waits for a scan"""
+        return name.strip().lower() in self._snapshot.by_name
+
+    def search(self, prefix, limit=20, candidates=500):
+        """Entries whose name, or a word in it, starts with ``prefix``; everything when it is empty
+
+        Whole-name matches rank before word matches, launchers before bare
+        executables, then shorter names first.
+        """
+        snapshot = self._snapshot
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return snapshot.ordered[:limit]
+        keys = snapshot.keys
+        matches = {}
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and len(matches) < candidates and keys[i].startswith(prefix):
+            entry = snapshot.targets[i]
+            whole = keys[i] == entry.name.lower()
+            matches[entry] = matches.get(entry, False) or whole
+            i += 1
+
+        def rank(entry):
+            return not matches[entry], _SOURCE_RANK[entry.source], len(entry.name), entry.name.lower()
+
+        return sorted(matches, key=rank)[:limit]
+
+    def count(self):
+        return len(self._snapshot.by_name)
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_app_catalog():
+    """Return the process-wide AppCatalog, scanning in the background from first use"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = AppCatalog().start()
+    return _catalog
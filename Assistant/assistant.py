@@ -1,81 +1,156 @@
-import requests
-import json
-import platform
-import os
-import subprocess
-import smtplib
-from email.mime.text import MIMEText
-import speech_recognition as sr
-import pyttsx3
+from .metrics import instrument, record_error
+
+# Each assistant imports its backend on first use, so loading this module
+# does not pull in requests, smtplib or the audio stack. Calls are timed
+# under their function name and show up on the Diagnostics page.
 
 # Weather Assistant
+@instrument("get_weather")
 def get_weather(city):
+    from .weather import WeatherError, get_client as get_weather_client
     try:
-        # Using wttr.in service which doesn't require an API key
-        url = f"https://wttr.in/{city}?format=j1"
-        response = requests.get(url)
-        data = response.json()
-        
-        if response.status_code == 200:
-            current_condition = data["current_condition"][0]
-            weather_data = {
-                "temperature": current_condition["temp_C"],
-                "condition": current_condition["weatherDesc"][0]["value"],
-                "humidity": current_condition["humidity"],
-                "wind_speed": current_condition["windspeedKmph"],
-                "pressure": current_condition["pressure"],
-                "visibility": current_condition["visibility"],
-                "feels_like": current_condition["FeelsLikeC"],
-                "precipitation": current_condition["precipMM"],
-                "cloud_cover": current_condition["cloudcover"]
-            }
-            return weather_data
-        else:
-            return f"Error: Could not fetch weather data for {city}"
+        # Using wttr.in service which doesn't require an API key; the shared
+        # client pools connections and caches results per city
+        return get_weather_client().get(city)
+    except WeatherError as e:
+        record_error("get_weather", e)
+        return f"Error: Could not fetch weather data for {city}"
     except Exception as e:
+        record_error("get_weather", e)
         return f"Weather service is unavailable. Error: {str(e)}"
 
 # App Launcher Assistant
+@instrument("open_app")
 def open_app(app_name):
-    try:
-        if platform.system() == "Windows":
-            os.system(f"start {app_name}")
-        elif platform.system() == "Darwin":
-            subprocess.call(["open", "-a", app_name])
-        else:
-            subprocess.call([app_name])
-        return f"{app_name} launched successfully!"
-    except Exception as e:
-        return str(e)
+    from .app_catalog import get_app_catalog
+    from .launcher import FAILED, TIMEOUT, get_launcher
+    launcher = get_launcher()
+    # Resolved to an absolute path by the catalog, so the launch needs no shell or PATH search
+    app = get_app_catalog().resolve(app_name, timeout=launcher.start_timeout)
+    # Started detached on the launcher's worker pool; only waits until the app is up, never until it exits
+    if app is not None:
+        record = launcher.launch(app.command, name=app.name)
+    else:
+        # Absolute paths and apps the catalog does not list are left to the platform (open -a on macOS)
+        record = launcher.launch(app_name, name=app_name)
+    record.started.wait(launcher.start_timeout)
+    if record.status == FAILED and app is None:
+        return f"Could not find an application called {app_name}"
+    if record.status in (FAILED, TIMEOUT):
+        return record.error or f"{app_name} exited with code {record.returncode}"
+    return f"{app_name} launched successfully!"
 
 # Email Assistant
+@instrument("send_email")
 def send_email(to, subject, body):
+    from .mailer import build_message, get_sender as get_mail_sender
     try:
-        msg = MIMEText(body)
-        msg['Subject'] = subject
-        msg['From'] = os.getenv("EMAIL_USER")
-        msg['To'] = to
-
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(os.getenv("EMAIL_USER"), os.getenv("EMAIL_PASS"))
-            server.send_message(msg)
+        # Reuses the shared authenticated SMTP session instead of logging in per message
+        get_mail_sender().send(build_message(to, subject, body))
         return "Email sent successfully!"
     except Exception as e:
+        record_error("send_email", e)
         return f"Failed to send email: {str(e)}"
 
+def queue_email(to, subject, body):
+    """Hand the email to the background outbox and return a Future for the delivery result"""
+    from .mailer import build_message, get_sender as get_mail_sender
+    return get_mail_sender().submit(build_message(to, subject, body))
+
+# AI Chat Assistant
+_conversation = None
+
+def chat_with_gpt(prompt):
+    """Answer ``prompt`` in one ongoing conversation, trimmed to the chat client's token budget"""
+    global _conversation
+    from .chat import Conversation, get_chat_client
+    if _conversation is None:
+        _conversation = Conversation()
+    try:
+        return get_chat_client().ask(_conversation, prompt)
+    except Exception as e:
+        return f"Chat service is unavailable. Error: {str(e)}"
+
+# Voice Commands
+def handle_command(text):
+    """Route a recognized phrase to get_weather, open_app or send_email and return the reply to speak
+
+    Returns None when the phrase is not a known command.
+    """
+    from .intents import get_router
+    match, result = get_router().dispatch(text)
+    if match is None:
+        return None
+    if match.intent == "get_weather" and isinstance(result, dict):
+        return f"It's {result['temperature']}°C and {result['condition'].lower()} in {match.slots['city'].title()}"
+    return result
+
 # Voice Assistant
+@instrument("speak")
 def speak(text):
-    engine = pyttsx3.init()
-    engine.say(text)
-    engine.runAndWait()
+    from .speech import get_speech_service
+    # One long-lived engine on the speech thread instead of pyttsx3.init() per call
+    get_speech_service().speak(text)
+
+def speak_async(text, interrupt=False):
+    """Queue text for speaking and return a Future instead of blocking"""
+    from .speech import get_speech_service
+    return get_speech_service().speak_async(text, interrupt=interrupt)
+
+# One recognizer for the process, calibrated for ambient noise on first use
+_recognizer = None
+_recognition_backend = None
+_calibrated = False
+
+def _get_recognizer():
+    global _recognizer, _recognition_backend
+    if _recognizer is None:
+        import speech_recognition as sr
+        from .recognition import AutoBackend
+        _recognizer = sr.Recognizer()
+        # Uses Google when online and falls back to an installed offline engine
+        _recognition_backend = AutoBackend()
+    return _recognizer, _recognition_backend
 
+@instrument("listen")
 def listen():
-    r = sr.Recognizer()
+    global _calibrated
+    import speech_recognition as sr
+    recognizer, recognition_backend = _get_recognizer()
     with sr.Microphone() as source:
+        if not _calibrated:
+            recognizer.adjust_for_ambient_noise(source, duration=1)
+            _calibrated = True
         print("Listening...")
-        audio = r.listen(source)
+        audio = recognizer.listen(source)
     try:
-        query = r.recognize_google(audio)
+        query = recognition_backend(recognizer, audio)
         return query
     except:
-        return "Sorry, I could not understand." 
\ No newline at end of file
+        return "Sorry, I could not understand."
+
+def listen_continuously(**kwargs):
+    """Listen in the background and yield each recognized phrase as text"""
+    from .listener import VoiceListener
+    recognizer, recognition_backend = _get_recognizer()
+    kwargs.setdefault("recognize", recognition_backend)
+    listener = VoiceListener(recognizer=recognizer, calibration_duration=0 if _calibrated else 1, **kwargs)
+    listener.start()
+    try:
+        for phrase in listener.phrases():
+            yield phrase.text
+    finally:
+        listener.stop(wait=False)
+
+def start_voice_session(respond=None, **kwargs):
+    """Start the hands-free loop in the background and return the VoiceSession
+
+    Commands go to get_weather, open_app or send_email and anything else to
+    the chat model; replies are spoken sentence by sentence as they arrive.
+    """
+    from .listener import VoiceListener
+    from .voice_session import VoiceSession
+    recognizer, recognition_backend = _get_recognizer()
+    kwargs.setdefault("recognize", recognition_backend)
+    listener = VoiceListener(recognizer=recognizer, calibration_duration=0 if _calibrated else 1, **kwargs)
+    return VoiceSession(listener, respond).start()
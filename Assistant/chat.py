@@ -0,0 +1,263 @@
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque, namedtuple
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used);
+"""
+
+SYSTEM_PROMPT = "You are JeevaAI, a friendly voice and desktop assistant. Keep answers short and clear."
+
+# Tokens the chat format adds around every message
+MESSAGE_OVERHEAD = 4
+
+# Rough BPE stand-in when tiktoken is not installed: about four characters per token
+_TOKEN_PIECES = re.compile(r"\w{1,4}|[^\w\s]")
+
+# ttft and seconds are measured from the request; tokens counts the reply
+ChatStats = namedtuple("ChatStats", ["ttft", "seconds", "tokens", "tokens_per_second", "cached"])
+
+
+class TokenCounter:
+    """Count tokens with tiktoken when it is installed, otherwise estimate them"""
+
+    def __init__(self, model="gpt-4o-mini"):
+        self.exact = importlib.util.find_spec("tiktoken") is not None
+        self._encoding = None
+        if self.exact:
+            import tiktoken
+            try:
+                self._encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("o200k_base")
+
+    def count(self, text):
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return len(_TOKEN_PIECES.findall(text))
+
+
+class Conversation:
+    """Chat history that keeps a running token total
+
+    Each message is counted once, when it is added, so trimming to a budget
+    only subtracts the counts of the messages it drops instead of counting
+    the whole history again every turn. ``last_stats`` holds the ChatStats
+    of the latest reply in this conversation.
+    """
+
+    def __init__(self, system_prompt=SYSTEM_PROMPT, counter=None):
+        self.counter = counter or TokenCounter()
+        self.system = {"role": "system", "content": system_prompt}
+        self.system_tokens = self.counter.count(system_prompt) + MESSAGE_OVERHEAD
+        self._messages = deque()  # (message dict, tokens)
+        self.tokens = self.system_tokens
+        self.trimmed = 0  # messages dropped to stay within budget
+        self.last_stats = None
+
+    def add(self, role, content):
+        tokens = self.counter.count(content) + MESSAGE_OVERHEAD
+        self._messages.append(({"role": role, "content": content}, tokens))
+        self.tokens += tokens
+        return tokens
+
+    def pop(self):
+        """Remove and return the latest message"""
+        message, tokens = self._messages.pop()
+        self.tokens -= tokens
+        return message
+
+    def trim(self, budget):
+        """Drop the oldest messages until the conversation fits in ``budget`` tokens; the latest is always kept"""
+        while self.tokens > budget and len(self._messages) > 1:
+            _, tokens = self._messages.popleft()
+            self.tokens -= tokens
+            self.trimmed += 1
+
+    def messages(self):
+        return [self.system] + [message for message, _ in self._messages]
+
+    def history(self):
+        """User and assistant messages, oldest first"""
+        return [message for message, _ in self._messages]
+
+    def clear(self):
+        self._messages.clear()
+        self.tokens = self.system_tokens
+        self.trimmed = 0
+        self.last_stats = None
+
+    def __len__(self):
+        return len(self._messages)
+
+
+class ResponseCache:
+    """On-disk LRU of replies keyed by model, settings and the exact messages sent"""
+
+    def __init__(self, path="chat_cache.db", max_entries=500):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(CACHE_SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def key(model, messages, **settings):
+        payload = json.dumps({"model": model, "messages": messages, "settings": settings}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key):
+        with self._connect() as conn:
+            row = conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+        return None if row is None else row[0]
+
+    def put(self, key, response):
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO responses (key, response, last_used) VALUES (?, ?, ?)",
+                         (key, response, time.time()))
+            excess = conn.execute("SELECT count(*) FROM responses").fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute("DELETE FROM responses WHERE key IN "
+                             "(SELECT key FROM responses ORDER BY last_used LIMIT ?)", (excess,))
+
+    def __len__(self):
+        return self._connect().execute("SELECT count(*) FROM responses").fetchone()[0]
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+
+class ChatClient:
+    """Streaming chat completions with a reply cache and a context budget
+
+    ``stream`` adds the prompt to a Conversation, trims the history to
+    ``context_tokens`` and yields the reply as it arrives. A reply for the
+    same model, settings and trimmed messages is served from the cache
+    without a request. Timing of each reply is kept on its conversation,
+    in ``Conversation.last_stats``, so sessions sharing the client do not
+    overwrite each other's.
+    """
+
+    def __init__(self, model="gpt-4o-mini", base_url=None, api_key=None, context_tokens=3000, max_tokens=512,
+                 temperature=0.7, timeout=60, cache=None):
+        self.model = model
+        self.base_url = base_url
+        self.api_key = api_key
+        self.context_tokens = context_tokens
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.timeout = timeout
+        self.cache = cache
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _openai(self):
+        with self._lock:
+            if self._client is None:
+                from openai import OpenAI
+                # base_url and api_key fall back to OPENAI_BASE_URL and OPENAI_API_KEY
+                self._client = OpenAI(base_url=self.base_url, api_key=self.api_key, timeout=self.timeout)
+        return self._client
+
+    def stream(self, conversation, prompt):
+        """Yield the reply to ``prompt`` in pieces; it is added to ``conversation`` once complete
+
+        If the request fails or the caller stops reading early, the prompt is
+        taken out of the conversation again, so the next turn does not send
+        two user messages in a row.
+        """
+        started = time.perf_counter()
+        conversation.add("user", prompt)
+        answered = False
+        try:
+            yield from self._reply(conversation, started)
+            answered = True
+        finally:
+            if not answered:
+                conversation.pop()
+
+    def _reply(self, conversation, started):
+        conversation.trim(self.context_tokens - self.max_tokens)
+        messages = conversation.messages()
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(self.model, messages, temperature=self.temperature, max_tokens=self.max_tokens)
+            reply = self.cache.get(key)
+            if reply is not None:
+                ttft = time.perf_counter() - started
+                yield reply
+                self._finish(conversation, reply, started, ttft, cached=True)
+                return
+
+        response = self._openai().chat.completions.create(model=self.model, messages=messages, stream=True,
+                                                          temperature=self.temperature, max_tokens=self.max_tokens)
+        pieces = []
+        ttft = None
+        try:
+            for chunk in response:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    if ttft is None:
+                        ttft = time.perf_counter() - started
+                    pieces.append(text)
+                    yield text
+        finally:
+            # Also reached when the caller stops reading early; the partial reply is not kept
+            response.close()
+        reply = "".join(pieces)
+        if key is not None:
+            self.cache.put(key, reply)
+        self._finish(conversation, reply, started, ttft, cached=False)
+
+    def _finish(self, conversation, reply, started, ttft, cached):
+        tokens = conversation.add("assistant", reply) - MESSAGE_OVERHEAD
+        seconds = time.perf_counter() - started
+        # Rate of generation after the first token; a cached reply arrives all at once
+        generating = seconds if cached or ttft is None else seconds - ttft
+        conversation.last_stats = ChatStats(ttft, seconds, tokens, tokens / generating if generating > 0 else 0.0, cached)
+
+    def ask(self, conversation, prompt):
+        """Return the whole reply to ``prompt`` as one string"""
+        return "".join(self.stream(conversation, prompt))
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_chat_client():
+    """Return the process-wide ChatClient
+
+    JEEVA_CHAT_MODEL picks the model (default gpt-4o-mini) and
+    JEEVA_CHAT_CACHE the reply cache file (default chat_cache.db). The
+    endpoint and key come from OPENAI_BASE_URL and OPENAI_API_KEY.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = ChatClient(os.getenv("JEEVA_CHAT_MODEL", "gpt-4o-mini"),
+                                 cache=ResponseCache(os.getenv("JEEVA_CHAT_CACHE", "chat_cache.db")))
+    return _client
@@ -0,0 +1,133 @@
+import socket
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
+
+from .metrics import instrument
+
+# Endpoints probed by the monitor
+INTERNET_ENDPOINTS = [
+    ("8.8.8.8", 53),  # Google DNS
+    ("1.1.1.1", 53),  # Cloudflare DNS
+    ("208.67.222.222", 53)  # OpenDNS
+]
+LOCAL_ENDPOINTS = [
+    ("localhost", 8501),  # Common Streamlit ports
+    ("localhost", 8502),
+    ("localhost", 8503)
+]
+
+# local / internet are None until the first probe has finished
+ConnectionStatus = namedtuple("ConnectionStatus", ["local", "internet", "checked_at", "stale"])
+
+_probe_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="connectivity-probe")
+
+
+def _try_connect(endpoint, timeout):
+    try:
+        with socket.create_connection(endpoint, timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _submit_probes(endpoints, timeout):
+    return [_probe_pool.submit(_try_connect, endpoint, timeout) for endpoint in endpoints]
+
+
+def _first_success(futures, timeout):
+    try:
+        for future in as_completed(futures, timeout=timeout + 1):
+            if future.result():
+                return True
+    except TimeoutError:
+        pass
+    return False
+
+
+def probe_endpoints(endpoints, timeout=5):
+    """Probe all endpoints concurrently and return True as soon as one accepts a connection"""
+    return _first_success(_submit_probes(endpoints, timeout), timeout)
+
+
+class ConnectivityMonitor:
+    """Probe local and internet connectivity in a background thread and cache the last result"""
+
+    def __init__(self, interval=30, ttl=None, internet_endpoints=None, local_endpoints=None,
+                 internet_timeout=5, local_timeout=2):
+        self.interval = interval
+        self.ttl = ttl if ttl is not None else interval * 2
+        self.internet_endpoints = internet_endpoints or INTERNET_ENDPOINTS
+        self.local_endpoints = local_endpoints or LOCAL_ENDPOINTS
+        self.internet_timeout = internet_timeout
+        self.local_timeout = local_timeout
+        # Replaced as a whole so readers never need a lock
+        self._state = (None, None, 0.0)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="connectivity-monitor", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def set_interval(self, interval):
+        self.interval = interval
+        self._wakeup.set()
+
+    @instrument("connectivity_check")
+    def refresh(self):
+        """Run both probes now (blocking) and update the cached state"""
+        local_probes = _submit_probes(self.local_endpoints, self.local_timeout)
+        internet_probes = _submit_probes(self.internet_endpoints, self.internet_timeout)
+        local_connected = _first_success(local_probes, self.local_timeout)
+        internet_connected = _first_success(internet_probes, self.internet_timeout)
+        self._state = (local_connected, internet_connected, time.time())
+        return self.get_status()
+
+    def get_status(self):
+        """Return the last known state without doing any I/O"""
+        local_connected, internet_connected, checked_at = self._state
+        stale = checked_at == 0.0 or time.time() - checked_at > self.ttl
+        return ConnectionStatus(local_connected, internet_connected, checked_at, stale)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                pass
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+
+_monitor = None
+_monitor_lock = threading.Lock()
+
+
+def get_monitor(interval=None):
+    """Return the process-wide monitor, starting it on first use"""
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = ConnectivityMonitor(interval=interval or 30).start()
+        elif interval is not None and _monitor.interval != interval:
+            _monitor.set_interval(interval)
+    return _monitor
+
+
+def get_status():
+    return get_monitor().get_status()
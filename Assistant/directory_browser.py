@@ -0,0 +1,190 @@
+import heapq
+import itertools
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
+
+# size is 0 for folders; mtime is seconds since the epoch
+Entry = namedtuple("Entry", ["name", "path", "is_dir", "size", "mtime"])
+
+# Where a page starts: the listing is resumed from ``position`` in scandir order
+# as long as the directory's mtime_ns is unchanged
+Cursor = namedtuple("Cursor", ["path", "mtime_ns", "position"])
+
+TOP_KEYS = {
+    "size": attrgetter("size"),
+    "mtime": attrgetter("mtime")
+}
+
+
+def iter_entries(path):
+    """Yield an Entry per item of ``path`` as os.scandir produces them"""
+    with os.scandir(path) as it:
+        for dir_entry in it:
+            entry = _stat_entry(dir_entry)
+            if entry is not None:
+                yield entry
+
+
+def _stat_entry(dir_entry):
+    try:
+        is_dir = dir_entry.is_dir(follow_symlinks=False)
+        st = dir_entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+    return Entry(dir_entry.name, dir_entry.path, is_dir, 0 if is_dir else st.st_size, st.st_mtime)
+
+
+class _DirCache:
+    __slots__ = ("mtime_ns", "entries", "views", "pages", "paged")
+
+    def __init__(self, mtime_ns):
+        self.mtime_ns = mtime_ns
+        self.entries = {}  # name -> Entry for entries that have been stat'ed
+        self.views = {}  # (key, n) -> finished top-n list
+        self.pages = {}  # (position, page_size) -> (entries, more pages follow)
+        self.paged = 0  # entries held in pages
+
+
+class DirectoryBrowser:
+    """Page through huge directories without reading them whole
+
+    Pages are served from live ``os.scandir`` iterators that are kept open
+    between calls, so fetching the next page only reads ``page_size`` more
+    entries. A cursor whose iterator has been evicted is resumed by skipping
+    entries without stat'ing them. Pages already read, stat results and
+    largest/newest views are cached per directory, so paging back does not
+    touch the disk, and are dropped as soon as the directory's mtime
+    changes. Largest/newest views stream the whole directory through a
+    bounded heap on a worker thread and are returned as Futures.
+    """
+
+    def __init__(self, max_dirs=32, max_cached_entries=10000, max_cursors=16, workers=2):
+        self.max_dirs = max_dirs
+        self.max_cached_entries = max_cached_entries  # per directory
+        self.max_cursors = max_cursors
+        self._dirs = OrderedDict()  # path -> _DirCache
+        self._cursors = OrderedDict()  # (path, mtime_ns, position) -> open scandir iterator
+        self._inflight = {}  # (path, mtime_ns, key, n) -> Future
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dir-browser")
+
+    def _dir_cache(self, path):
+        """Return the cache for ``path``, starting a fresh one if the directory has changed"""
+        mtime_ns = os.stat(path).st_mtime_ns
+        with self._lock:
+            cache = self._dirs.get(path)
+            if cache is None or cache.mtime_ns != mtime_ns:
+                cache = self._dirs[path] = _DirCache(mtime_ns)
+            self._dirs.move_to_end(path)
+            while len(self._dirs) > self.max_dirs:
+                self._dirs.popitem(last=False)
+        return cache
+
+    def _cached_entry(self, cache, dir_entry):
+        entry = cache.entries.get(dir_entry.name)
+        if entry is None:
+            entry = _stat_entry(dir_entry)
+            if entry is not None and len(cache.entries) < self.max_cached_entries:
+                cache.entries[dir_entry.name] = entry
+        return entry
+
+    # Paging
+    def first_page(self, path, page_size=100):
+        return self.page(Cursor(os.path.abspath(path), None, 0), page_size)
+
+    def page(self, cursor, page_size=100):
+        """Return ``(entries, next_cursor)``; next_cursor is None after the last page
+
+        If the directory changed since ``cursor`` was issued the listing
+        restarts from the current contents at the same position.
+        """
+        cache = self._dir_cache(cursor.path)
+        page_key = (cursor.position, page_size)
+        with self._lock:
+            served = cache.pages.get(page_key)
+            if served is None:
+                it = self._cursors.pop((cursor.path, cache.mtime_ns, cursor.position), None)
+        if served is not None:
+            entries, more = served
+            return entries, Cursor(cursor.path, cache.mtime_ns, cursor.position + page_size) if more else None
+
+        position = cursor.position
+        if it is None:
+            it = os.scandir(cursor.path)
+            position = sum(1 for _ in itertools.islice(it, cursor.position))
+
+        entries = []
+        read = 0
+        for dir_entry in itertools.islice(it, page_size):
+            read += 1
+            entry = self._cached_entry(cache, dir_entry)
+            if entry is not None:
+                entries.append(entry)
+        position += read
+        more = read == page_size
+        with self._lock:
+            if cache.paged + len(entries) <= self.max_cached_entries:
+                cache.pages[page_key] = (entries, more)
+                cache.paged += len(entries)
+            if more:
+                self._cursors[(cursor.path, cache.mtime_ns, position)] = it
+                while len(self._cursors) > self.max_cursors:
+                    self._cursors.popitem(last=False)[1].close()
+        if not more:
+            it.close()
+            return entries, None
+        return entries, Cursor(cursor.path, cache.mtime_ns, position)
+
+    # Largest / newest
+    def top(self, path, by="size", n=20):
+        """Return a Future for the ``n`` largest (by="size") or newest (by="mtime") entries of ``path``"""
+        key = TOP_KEYS[by]
+        path = os.path.abspath(path)
+        cache = self._dir_cache(path)
+        with self._lock:
+            result = cache.views.get((by, n))
+            if result is not None:
+                future = Future()
+                future.set_result(result)
+                return future
+            inflight_key = (path, cache.mtime_ns, by, n)
+            future = self._inflight.get(inflight_key)
+            if future is not None:
+                return future
+            future = self._inflight[inflight_key] = self._executor.submit(self._top, path, cache, key, by, n)
+        # Outside the lock: the callback runs immediately if the scan has already finished
+        future.add_done_callback(lambda _: self._forget(inflight_key))
+        return future
+
+    def _top(self, path, cache, key, by, n):
+        result = heapq.nlargest(n, iter_entries(path), key=key)
+        with self._lock:
+            cache.views[(by, n)] = result
+        return result
+
+    def _forget(self, inflight_key):
+        with self._lock:
+            self._inflight.pop(inflight_key, None)
+
+    def close(self):
+        with self._lock:
+            for it in self._cursors.values():
+                it.close()
+            self._cursors.clear()
+        self._executor.shutdown(wait=False)
+
+
+_browser = None
+_browser_lock = threading.Lock()
+
+
+def get_browser():
+    """Return the process-wide DirectoryBrowser"""
+    global _browser
+    with _browser_lock:
+        if _browser is None:
+            _browser = DirectoryBrowser()
+    return _browser
@@ -0,0 +1,108 @@
+import queue
+import threading
+import time
+from collections import namedtuple
+
+import psutil
+
+# status is "ok", "timeout" or "error"; usage is a psutil sdiskusage or None
+DiskResult = namedtuple("DiskResult", ["device", "mountpoint", "fstype", "usage", "status", "error", "elapsed"])
+
+
+class PsutilProvider:
+    """Partition source backed by psutil"""
+
+    def partitions(self):
+        return psutil.disk_partitions()
+
+    def usage(self, mountpoint):
+        return psutil.disk_usage(mountpoint)
+
+
+class PartitionScanner:
+    """Query disk usage for every mount concurrently with a per-mount timeout
+
+    Each query runs on its own daemon thread, so a hung network or optical
+    drive holds only that thread and never keeps other mounts waiting for a
+    worker. Every mount gets ``timeout`` seconds from the moment its query
+    starts. Results are cached for ``ttl`` seconds. A mount whose previous
+    query is still hanging is reported as a timeout straight away and is not
+    queried again until that query returns.
+    """
+
+    def __init__(self, provider=None, timeout=2.0, ttl=30):
+        self.provider = provider or PsutilProvider()
+        self.timeout = timeout
+        self.ttl = ttl
+        self._cache = {}  # mountpoint -> (checked_at, DiskResult)
+        self._inflight = set()  # mountpoints with a query still running
+        self._lock = threading.Lock()
+
+    def _query(self, partition, results):
+        started = time.perf_counter()
+        try:
+            usage = self.provider.usage(partition.mountpoint)
+            result = DiskResult(partition.device, partition.mountpoint, partition.fstype, usage, "ok", None,
+                                time.perf_counter() - started)
+        except Exception as e:
+            result = DiskResult(partition.device, partition.mountpoint, partition.fstype, None, "error", str(e),
+                                time.perf_counter() - started)
+        # Kept even when the scan has given up on this mount, so the next scan can use it
+        with self._lock:
+            self._cache[partition.mountpoint] = (time.monotonic(), result)
+            self._inflight.discard(partition.mountpoint)
+        results.put(result)
+
+    def scan(self):
+        """Yield a DiskResult per partition, fastest mounts first"""
+        now = time.monotonic()
+        immediate = []
+        to_query = []
+        with self._lock:
+            for partition in self.provider.partitions():
+                cached = self._cache.get(partition.mountpoint)
+                if cached is not None and now - cached[0] < self.ttl:
+                    immediate.append(cached[1])
+                elif partition.mountpoint in self._inflight:
+                    immediate.append(DiskResult(partition.device, partition.mountpoint, partition.fstype, None,
+                                                "timeout", "previous query has not returned yet", None))
+                else:
+                    self._inflight.add(partition.mountpoint)
+                    to_query.append(partition)
+
+        results = queue.Queue()
+        pending = {}  # mountpoint -> (partition, deadline)
+        for partition in to_query:
+            threading.Thread(target=self._query, args=(partition, results), name="disk-scan", daemon=True).start()
+            pending[partition.mountpoint] = (partition, time.monotonic() + self.timeout)
+
+        yield from immediate
+        while pending:
+            deadline = min(deadline for _, deadline in pending.values())
+            try:
+                result = results.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                now = time.monotonic()
+                for mountpoint, (partition, deadline) in list(pending.items()):
+                    if deadline <= now:
+                        del pending[mountpoint]
+                        yield DiskResult(partition.device, partition.mountpoint, partition.fstype, None, "timeout",
+                                         f"no response within {self.timeout:.1f}s", self.timeout)
+                continue
+            if pending.pop(result.mountpoint, None) is not None:
+                yield result
+
+    def scan_all(self):
+        return list(self.scan())
+
+_scanner = None
+_scanner_lock = threading.Lock()
+
+
+def get_scanner():
+    """Return the process-wide PartitionScanner"""
+    global _scanner
+    with _scanner_lock:
+        if _scanner is None:
+            _scanner = PartitionScanner()
+    return _scanner
@@ -0,0 +1,109 @@
+import importlib
+import threading
+import time
+from types import SimpleNamespace
+
+# What each sidebar feature needs, as name -> "module:attribute" or just
+# "module". Relative module names resolve inside this package. Nothing here is
+# imported until the feature is first opened.
+FEATURE_EXPORTS = {
+    "Task Manager": {
+        "get_store": ".task_store:get_store",
+        "TaskIndex": ".task_index:TaskIndex"
+    },
+    "Weather": {
+        "get_weather": ".assistant:get_weather",
+        "weather": ".weather"
+    },
+    "Email Sender": {
+        "queue_email": ".assistant:queue_email",
+        "mailer": ".mailer"
+    },
+    "File Explorer": {
+        "get_file_index": ".file_index:get_file_index",
+        "get_browser": ".directory_browser:get_browser",
+        "Cursor": ".directory_browser:Cursor",
+        "get_preview": ".file_preview:get_preview"
+    },
+    "System Info": {
+        "psutil": "psutil",
+        "get_sampler": ".system_metrics:get_sampler",
+        "METRIC_COLUMN": ".system_metrics:COLUMN",
+        "get_scanner": ".disk_scanner:get_scanner",
+        "get_process_sampler": ".processes:get_process_sampler"
+    },
+    "App Launcher": {
+        "get_launcher": ".launcher:get_launcher",
+        "get_app_catalog": ".app_catalog:get_app_catalog"
+    },
+    "AI Chat": {
+        "get_chat_client": ".chat:get_chat_client",
+        "Conversation": ".chat:Conversation"
+    },
+    "Diagnostics": {
+        "metrics": ".metrics",
+        "load_times": ".features:load_times"
+    }
+}
+
+# Streamlit page module for each feature, each with a ``render()`` function
+FEATURE_PAGES = {
+    "Task Manager": ".ui.task_manager",
+    "Weather": ".ui.weather",
+    "Email Sender": ".ui.email_sender",
+    "File Explorer": ".ui.file_explorer",
+    "System Info": ".ui.system_info",
+    "App Launcher": ".ui.app_launcher",
+    "AI Chat": ".ui.chat",
+    "Diagnostics": ".ui.diagnostics"
+}
+
+_loaded = {}  # feature -> SimpleNamespace of its exports
+_load_seconds = {}  # feature -> time the first (cold) load took
+_lock = threading.Lock()
+
+
+def _resolve(spec):
+    module_name, _, attribute = spec.partition(":")
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, attribute) if attribute else module
+
+
+def load_feature(feature):
+    """Import everything ``feature`` needs on first use and return it as a namespace
+
+    The namespace is cached for the life of the process, so later calls are
+    a dictionary lookup.
+    """
+    exports = _loaded.get(feature)
+    if exports is not None:
+        return exports
+    with _lock:
+        exports = _loaded.get(feature)
+        if exports is None:
+            try:
+                specs = FEATURE_EXPORTS[feature]
+            except KeyError:
+                raise ValueError(f"Unknown feature: {feature}") from None
+            started = time.perf_counter()
+            exports = SimpleNamespace(**{name: _resolve(spec) for name, spec in specs.items()})
+            _load_seconds[feature] = time.perf_counter() - started
+            _loaded[feature] = exports
+    return exports
+
+
+def load_page(feature):
+    """Import the page module for ``feature``; the import system caches it after the first call"""
+    try:
+        return importlib.import_module(FEATURE_PAGES[feature], __package__)
+    except KeyError:
+        raise ValueError(f"Unknown feature: {feature}") from None
+
+
+def is_loaded(feature):
+    return feature in _loaded
+
+
+def load_times():
+    """Seconds each loaded feature took to import, keyed by feature name"""
+    return dict(_load_seconds)
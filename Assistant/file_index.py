@@ -0,0 +1,418 @@
+import heapq
+import os
+import platform
+import re
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from difflib import SequenceMatcher
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER,
+    path TEXT NOT NULL UNIQUE,
+    mtime REAL
+);
+CREATE INDEX IF NOT EXISTS idx_dirs_parent ON dirs (parent_id);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    dir_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    is_dir INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_files_dir ON files (dir_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS names USING fts5(name, content='files', content_rowid='id', tokenize='trigram');
+CREATE TRIGGER IF NOT EXISTS files_insert AFTER INSERT ON files BEGIN
+    INSERT INTO names (rowid, name) VALUES (new.id, new.name);
+END;
+CREATE TRIGGER IF NOT EXISTS files_delete AFTER DELETE ON files BEGIN
+    INSERT INTO names (names, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+"""
+
+SELECT_RESULTS = """
+SELECT d.path, f.name, f.size, f.mtime, f.is_dir
+FROM names JOIN files f ON f.id = names.rowid JOIN dirs d ON d.id = f.dir_id
+"""
+
+SUBTREE = """
+WITH RECURSIVE subtree(id) AS (
+    SELECT id FROM dirs WHERE path = ?
+    UNION ALL
+    SELECT dirs.id FROM dirs JOIN subtree ON dirs.parent_id = subtree.id
+)
+SELECT id FROM subtree
+"""
+
+# The trigram tokenizer cannot index shorter terms; they only narrow down matches of longer ones
+MIN_INDEXED_TERM = 3
+
+# How close a word of a name must be to each query word for a typo-tolerant match
+FUZZY_CUTOFF = 0.75
+
+# Virtual filesystems whose entries are kernel state or devices rather than files
+PSEUDO_FILESYSTEMS = {
+    "proc", "sysfs", "devtmpfs", "devfs", "devpts", "debugfs", "tracefs", "securityfs", "cgroup", "cgroup2",
+    "pstore", "bpf", "configfs", "fusectl", "mqueue", "hugetlbfs", "binfmt_misc", "autofs", "efivarfs",
+    "rpc_pipefs", "nsfs"
+}
+
+SearchResult = namedtuple("SearchResult", ["path", "name", "size", "mtime", "is_dir"])
+
+
+def _escape_like(term):
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _phrase(term):
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _within(path, root):
+    return path == root or path.startswith(os.path.join(root, ""))
+
+
+def _words(text):
+    return [word for word in re.split(r"[\W_]+", text) if word]
+
+
+def similarity(term, name):
+    """Best SequenceMatcher ratio between ``term`` and a word of ``name``, both lower case"""
+    return max((SequenceMatcher(None, term, word).ratio() for word in _words(name)), default=0.0)
+
+
+def pseudo_mounts():
+    """Mount points of virtual filesystems, which the walker never descends into"""
+    mounts = {"/proc", "/sys", "/dev"} if platform.system() == "Linux" else set()
+    try:
+        import psutil
+        mounts.update(partition.mountpoint for partition in psutil.disk_partitions(all=True)
+                      if partition.fstype in PSEUDO_FILESYSTEMS)
+    except Exception:
+        pass
+    return mounts
+
+
+def default_index_path():
+    """JEEVA_INDEX_PATH, or file_index.db in the user's cache folder for this platform"""
+    path = os.getenv("JEEVA_INDEX_PATH")
+    if path:
+        return path
+    system = platform.system()
+    if system == "Windows":
+        cache_home = os.getenv("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+        folder = os.path.join(cache_home, "JeevaAI")
+    elif system == "Darwin":
+        folder = os.path.join(os.path.expanduser("~"), "Library", "Caches", "JeevaAI")
+    else:
+        cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        folder = os.path.join(cache_home, "jeeva")
+    return os.path.join(folder, "file_index.db")
+
+
+class FileIndex:
+    """Searchable on-disk index of file names under a set of root folders
+
+    Directories and file entries live in SQLite, with file names in an FTS5
+    trigram table so substring searches stay fast over millions of entries.
+    Rescans are incremental: a directory is only listed again when its mtime
+    has changed, otherwise the walk just descends into its known
+    subdirectories. Size and mtime of files that are rewritten in place are
+    refreshed the next time their directory changes or on a full rescan.
+    Roots can be added while the index runs with ``add_root``. Folders in
+    ``skip`` (by default the mount points of virtual filesystems such as
+    /proc and /sys) are never walked.
+    """
+
+    def __init__(self, path="file_index.db", roots=None, interval=300, batch_size=500, skip=None):
+        self.path = path
+        self.roots = [os.path.abspath(root) for root in (roots or [])]
+        self.skip = pseudo_mounts() if skip is None else {os.path.abspath(path) for path in skip}
+        self.interval = interval
+        self.batch_size = batch_size  # directories written per transaction
+        self._local = threading.local()
+        self._scan_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self.last_scan = None  # stats of the last completed update()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # Background indexing
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="file-indexer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def refresh(self):
+        """Ask the background thread to rescan now instead of waiting for the interval"""
+        self._wakeup.set()
+
+    def covers(self, path):
+        """Whether ``path`` is inside one of the roots"""
+        path = os.path.abspath(path)
+        with self._lock:
+            return any(_within(path, root) for root in self.roots)
+
+    def add_root(self, path):
+        """Index ``path`` as well unless a root already covers it; True if it was added
+
+        Roots inside ``path`` are folded into it, and the background thread
+        is asked to scan right away.
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            if any(_within(path, root) for root in self.roots):
+                return False
+            self.roots = [root for root in self.roots if not _within(root, path)] + [path]
+        self.refresh()
+        return True
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.update()
+            except Exception:
+                pass
+            self._wakeup.wait(self.interval)
+
+    @property
+    def scanning(self):
+        """True while a scan is running or has been asked for with ``refresh``"""
+        return self._scan_lock.locked() or (self._wakeup.is_set() and not self._stopped.is_set())
+
+    # Scanning
+    def update(self, full=False):
+        """Bring the index up to date with the roots and return scan statistics
+
+        With ``full=True`` every directory is listed again even if its mtime
+        has not changed.
+        """
+        with self._scan_lock:
+            # Cleared once the scan holds the lock, so a refresh is never reported as idle in between
+            self._wakeup.clear()
+            started = time.perf_counter()
+            stats = {"listed": 0, "skipped": 0, "added": 0, "removed": 0, "changed": 0}
+            conn = self._connect()
+            pending = 0
+            with self._lock:
+                roots = list(self.roots)
+            for root in roots:
+                stack = [(root, None)] if root not in self.skip else []
+                while stack:
+                    path, parent_id = stack.pop()
+                    for child in self._update_dir(conn, path, parent_id, full, stats):
+                        if child[0] in self.skip:
+                            # Drops anything indexed there before the folder was skipped
+                            self._remove_subtree(conn, child[0], stats)
+                        else:
+                            stack.append(child)
+                    pending += 1
+                    if pending >= self.batch_size:
+                        conn.commit()
+                        pending = 0
+            conn.commit()
+            stats["seconds"] = time.perf_counter() - started
+            self.last_scan = stats
+            return stats
+
+    def _update_dir(self, conn, path, parent_id, full, stats):
+        """Sync one directory and return its subdirectories as (path, dir_id) pairs"""
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            self._remove_subtree(conn, path, stats)
+            return []
+        row = conn.execute("SELECT id, mtime, parent_id FROM dirs WHERE path = ?", [path]).fetchone()
+        if row is not None and parent_id is not None and row[2] != parent_id:
+            # A former root now reached from a root above it
+            conn.execute("UPDATE dirs SET parent_id = ? WHERE id = ?", [parent_id, row[0]])
+        if row is not None and row[1] == mtime and not full:
+            stats["skipped"] += 1
+            children = conn.execute("SELECT path, id FROM dirs WHERE parent_id = ?", [row[0]]).fetchall()
+            return [(child_path, row[0]) for child_path, _ in children]
+
+        if row is None:
+            dir_id = conn.execute("INSERT INTO dirs (parent_id, path, mtime) VALUES (?, ?, NULL)",
+                                  [parent_id, path]).lastrowid
+        else:
+            dir_id = row[0]
+
+        entries = {}
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries[entry.name] = (0 if is_dir else st.st_size, st.st_mtime, int(is_dir))
+        except OSError:
+            return []
+        stats["listed"] += 1
+
+        known = {name: (file_id, size, file_mtime, is_dir) for file_id, name, size, file_mtime, is_dir in
+                 conn.execute("SELECT id, name, size, mtime, is_dir FROM files WHERE dir_id = ?", [dir_id])}
+        removed = [name for name in known if name not in entries]
+        for name in removed:
+            file_id, _, _, is_dir = known[name]
+            if is_dir:
+                self._remove_subtree(conn, os.path.join(path, name), stats)
+        conn.executemany("DELETE FROM files WHERE id = ?", [[known[name][0]] for name in removed])
+        stats["removed"] += len(removed)
+
+        added, changed = [], []
+        for name, (size, file_mtime, is_dir) in entries.items():
+            previous = known.get(name)
+            if previous is None:
+                added.append([dir_id, name, size, file_mtime, is_dir])
+            elif previous[3] != is_dir:
+                # Replaced by an entry of the other kind: index it afresh
+                if previous[3]:
+                    self._remove_subtree(conn, os.path.join(path, name), stats)
+                conn.execute("DELETE FROM files WHERE id = ?", [previous[0]])
+                added.append([dir_id, name, size, file_mtime, is_dir])
+            elif previous[1] != size or previous[2] != file_mtime:
+                changed.append([size, file_mtime, previous[0]])
+        conn.executemany("INSERT INTO files (dir_id, name, size, mtime, is_dir) VALUES (?, ?, ?, ?, ?)", added)
+        conn.executemany("UPDATE files SET size = ?, mtime = ? WHERE id = ?", changed)
+        stats["added"] += len(added)
+        stats["changed"] += len(changed)
+
+        conn.execute("UPDATE dirs SET mtime = ? WHERE id = ?", [mtime, dir_id])
+        return [(os.path.join(path, name), dir_id) for name, (_, _, is_dir) in entries.items() if is_dir]
+
+    def _remove_subtree(self, conn, path, stats):
+        dir_ids = [[dir_id] for dir_id, in conn.execute(SUBTREE, [path])]
+        if not dir_ids:
+            return
+        cursor = conn.executemany("DELETE FROM files WHERE dir_id = ?", dir_ids)
+        stats["removed"] += cursor.rowcount
+        conn.executemany("DELETE FROM dirs WHERE id = ?", dir_ids)
+
+    # Queries
+    def search(self, query, limit=50, candidates=2000, under=None, fuzzy=True):
+        """Return up to ``limit`` entries whose name contains every word of ``query``
+
+        Matching is case-insensitive and word order does not matter. At most
+        ``candidates`` matches are read from the index and ranked in Python:
+        exact names first, then names starting with the first word, then
+        shorter names. At least one word must be ``MIN_INDEXED_TERM``
+        characters long, otherwise nothing is returned rather than scanning
+        every name. ``under`` keeps results to one folder and its subfolders.
+
+        When no name contains every word and ``fuzzy`` is true, names that
+        share trigrams with the query are ranked by how closely their words
+        match each query word instead, so a typo such as "reprot" still finds
+        "report".
+        """
+        terms = query.lower().split()
+        indexed = [term for term in terms if len(term) >= MIN_INDEXED_TERM]
+        if not indexed:
+            return []
+        clauses = ["names MATCH ?"]
+        params = [" AND ".join(_phrase(term) for term in indexed)]
+        for term in terms:
+            if len(term) < MIN_INDEXED_TERM:
+                clauses.append("names.name LIKE ? ESCAPE '\\'")
+                params.append(f"%{_escape_like(term)}%")
+        rows = self._select(clauses, params, under, candidates)
+        if not rows and fuzzy:
+            return self._similar(terms, indexed, under, limit, candidates)
+
+        phrase, first = " ".join(terms), terms[0]
+
+        def rank(row):
+            name = row[1].lower()
+            return name != phrase, not name.startswith(first), len(name), name
+
+        return [SearchResult(os.path.join(path, name), name, size, mtime, bool(is_dir))
+                for path, name, size, mtime, is_dir in heapq.nsmallest(limit, rows, key=rank)]
+
+    def _select(self, clauses, params, under, limit, order=""):
+        if under is not None:
+            prefix = os.path.join(os.path.abspath(under), "")
+            clauses = clauses + ["(d.path = ? OR substr(d.path, 1, ?) = ?)"]
+            params = params + [prefix[:-1] or prefix, len(prefix), prefix]
+        sql = f"{SELECT_RESULTS} WHERE {' AND '.join(clauses)} {order} LIMIT ?"
+        return self._connect().execute(sql, params + [limit]).fetchall()
+
+    def _similar(self, terms, indexed, under, limit, candidates):
+        words = [word for term in terms for word in _words(term)]
+        if not words:
+            return []
+        # Names sharing the most trigrams with the query come first; a typo only breaks the trigrams around it
+        grams = sorted({term[i:i + MIN_INDEXED_TERM] for term in indexed
+                        for i in range(len(term) - MIN_INDEXED_TERM + 1)})
+        rows = self._select(["names MATCH ?"], [" OR ".join(_phrase(gram) for gram in grams)], under, candidates,
+                            order="ORDER BY rank")
+        scored = []
+        for path, name, size, mtime, is_dir in rows:
+            lowered = name.lower()
+            scores = [similarity(word, lowered) for word in words]
+            if min(scores) >= FUZZY_CUTOFF:
+                scored.append((-sum(scores), len(name), name,
+                               SearchResult(os.path.join(path, name), name, size, mtime, bool(is_dir))))
+        return [result for *_, result in heapq.nsmallest(limit, scored)]
+
+    def count(self):
+        """Return (directories, entries) currently in the index"""
+        conn = self._connect()
+        dirs = conn.execute("SELECT count(*) FROM dirs").fetchone()[0]
+        files = conn.execute("SELECT count(*) FROM files").fetchone()[0]
+        return dirs, files
+
+    def close(self):
+        self.stop()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.execute("PRAGMA optimize")
+            conn.close()
+            self._local.conn = None
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_file_index():
+    """Return the process-wide FileIndex, indexing in the background from first use
+
+    Roots come from JEEVA_INDEX_ROOTS (separated by os.pathsep); without it
+    nothing is indexed until folders are added with ``add_root``. The
+    database is kept in the user's cache folder (see default_index_path).
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            roots = [root for root in os.getenv("JEEVA_INDEX_ROOTS", "").split(os.pathsep) if root]
+            path = default_index_path()
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            _index = FileIndex(path, roots, interval=float(os.getenv("JEEVA_INDEX_INTERVAL", "300"))).start()
+    return _index
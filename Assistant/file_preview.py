@@ -0,0 +1,244 @@
+import errno
+import mmap
+import os
+import stat
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+
+# Bytes counted per step while extending the line index; one checkpoint is kept per step
+INDEX_CHUNK = 1 << 18
+# Bytes sniffed to tell text from binary
+SAMPLE_SIZE = 8192
+# Longer lines are cut short in the preview
+MAX_LINE_BYTES = 4096
+
+_TEXT_BYTES = bytes(range(32, 127)) + b"\n\r\t\f\b\x1b"
+
+
+def looks_binary(sample):
+    """Guess whether ``sample`` comes from a binary file: NUL bytes or mostly non-text bytes"""
+    if not sample:
+        return False
+    if b"\x00" in sample:
+        return True
+    try:
+        sample.decode("utf-8")
+        return False
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off at the end of the sample is still text
+        if e.start >= len(sample) - 3 and e.reason == "unexpected end of data":
+            return False
+    non_text = len(sample.translate(None, _TEXT_BYTES))
+    return non_text / len(sample) > 0.3
+
+
+def _regular_file_error(path):
+    return OSError(errno.EINVAL, "Not a regular file", path)
+
+
+def hex_dump(data, offset=0, width=16):
+    """Format ``data`` as classic hex dump lines starting at ``offset``"""
+    lines = []
+    for start in range(0, len(data), width):
+        row = data[start:start + width]
+        hex_part = " ".join(f"{byte:02x}" for byte in row)
+        text_part = "".join(chr(byte) if 32 <= byte < 127 else "." for byte in row)
+        lines.append(f"{offset + start:08x}  {hex_part:<{width * 3 - 1}}  |{text_part}|")
+    return "\n".join(lines)
+
+
+class FilePreview:
+    """Read windows of a file through a memory map without loading it
+
+    Line positions come from a sparse index: one (line number, offset)
+    checkpoint per ``INDEX_CHUNK`` bytes, built lazily only as far as the
+    deepest line requested. Jumping to a line is a bisect plus a short scan
+    from the nearest checkpoint, so memory stays flat and seeking into a
+    multi-GB log is quick once the index has passed that point.
+
+    Only regular files are mapped: opening a FIFO would block and device
+    files have no size. Every read first checks that the file has not
+    shrunk below the mapped size, since touching pages past the new end of
+    a truncated file kills the process with SIGBUS; it raises OSError
+    instead. Previews handed out by ``get_preview`` are shared and
+    reference counted, and are only closed once no caller holds them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Checked before opening, since open() on a FIFO blocks until a writer appears
+        if not stat.S_ISREG(os.stat(path).st_mode):
+            raise _regular_file_error(path)
+        self._file = open(path, "rb")
+        st = os.fstat(self._file.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            self._file.close()
+            raise _regular_file_error(path)
+        self.size = st.st_size
+        self.mtime = st.st_mtime
+        # Empty files cannot be mapped
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        self.binary = looks_binary(self._mm[:SAMPLE_SIZE])
+        self._lines = array("Q", [0])  # line number at each checkpoint
+        self._offsets = array("Q", [0])  # byte offset of that line
+        self._scanned = 0  # bytes of the file already counted
+        self._scanned_lines = 0
+        self._lock = threading.Lock()
+        self._refs = 0  # callers of get_preview still using it
+        self._retired = False  # dropped from the shared cache; closed once unreferenced
+
+    def close(self):
+        if self.size:
+            self._mm.close()
+        self._file.close()
+
+    def release(self):
+        """Give back a preview obtained from ``get_preview``"""
+        with _previews_lock:
+            self._refs -= 1
+            unused = self._retired and self._refs <= 0
+        if unused:
+            self.close()
+
+    def _check(self):
+        # Pages past the end of a truncated file raise SIGBUS when touched
+        if self.size and os.fstat(self._file.fileno()).st_size < self.size:
+            raise OSError(errno.ESTALE, "File shrank while it was being previewed", self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Line index
+    @property
+    def indexed_lines(self):
+        """Lines counted so far; the exact line count once ``index_complete`` is True"""
+        return self._scanned_lines + (1 if self.index_complete and self.size and self._mm[-1:] != b"\n" else 0)
+
+    @property
+    def index_complete(self):
+        return self._scanned >= self.size
+
+    def _extend_index(self, line=None):
+        """Count newlines until ``line`` is covered by a checkpoint, or to the end of the file"""
+        mm = self._mm
+        self._check()
+        with self._lock:
+            while self._scanned < self.size and (line is None or self._scanned_lines <= line):
+                end = min(self.size, self._scanned + INDEX_CHUNK)
+                newlines = mm[self._scanned:end].count(b"\n")
+                self._scanned = end
+                self._scanned_lines += newlines
+                if newlines:
+                    last_newline = mm.rfind(b"\n", 0, end)
+                    self._lines.append(self._scanned_lines)
+                    self._offsets.append(last_newline + 1)
+
+    def build_index(self):
+        self._extend_index()
+        return self.indexed_lines
+
+    def line_offset(self, line):
+        """Byte offset where ``line`` (0-based) starts, or None past the end of the file"""
+        self._extend_index(line)
+        i = bisect_right(self._lines, line) - 1
+        current, offset = self._lines[i], self._offsets[i]
+        while current < line:
+            newline = self._mm.find(b"\n", offset)
+            if newline == -1 or newline + 1 >= self.size:
+                return None
+            offset = newline + 1
+            current += 1
+        return offset if offset < self.size or line == 0 else None
+
+    # Reading windows
+    def read(self, offset, length):
+        self._check()
+        return self._mm[max(0, offset):max(0, offset) + length]
+
+    def _read_lines(self, offset, count):
+        self._check()
+        lines = []
+        while offset < self.size and len(lines) < count:
+            newline = self._mm.find(b"\n", offset)
+            end = self.size if newline == -1 else newline
+            raw = self._mm[offset:min(end, offset + MAX_LINE_BYTES)]
+            text = raw.decode("utf-8", errors="replace").rstrip("\r")
+            lines.append(text + ("…" if end - offset > MAX_LINE_BYTES else ""))
+            offset = end + 1
+        return lines
+
+    def lines(self, start, count=50):
+        """Return up to ``count`` lines starting at line ``start`` (0-based)"""
+        offset = self.line_offset(start)
+        return [] if offset is None else self._read_lines(offset, count)
+
+    def head(self, count=50):
+        return self._read_lines(0, count)
+
+    def tail(self, count=50):
+        self._check()
+        end = self.size
+        if self._mm[end - 1:end] == b"\n":
+            end -= 1
+        start = end
+        for _ in range(count):
+            newline = self._mm.rfind(b"\n", 0, start)
+            if newline == -1:
+                return self._read_lines(0, count)
+            start = newline
+        return self._read_lines(start + 1, count)
+
+    def at_offset(self, offset, count=50):
+        """Return ``count`` lines starting with the line that contains byte ``offset``"""
+        offset = min(max(0, offset), self.size)
+        self._check()
+        start = self._mm.rfind(b"\n", 0, offset) + 1
+        return self._read_lines(start, count)
+
+    def hex(self, offset=0, length=512):
+        offset = min(max(0, offset), self.size)
+        return hex_dump(self.read(offset, length), offset)
+
+
+_previews = OrderedDict()  # path -> FilePreview
+_previews_lock = threading.Lock()
+MAX_OPEN_PREVIEWS = 8
+
+
+def _retire(preview):
+    # Called with _previews_lock held; returns the preview if nobody is using it and it can be closed
+    preview._retired = True
+    return preview if preview._refs <= 0 else None
+
+
+def get_preview(path):
+    """Return a shared FilePreview for ``path``, reopened if the file has changed since it was mapped
+
+    The caller holds a reference until it calls ``release()``; previews
+    dropped from the cache meanwhile stay open until then.
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    if not stat.S_ISREG(st.st_mode):
+        raise _regular_file_error(path)
+    unused = []
+    with _previews_lock:
+        preview = _previews.get(path)
+        if preview is not None and (preview.size != st.st_size or preview.mtime != st.st_mtime):
+            unused.append(_retire(_previews.pop(path)))
+            preview = None
+        if preview is None:
+            preview = _previews[path] = FilePreview(path)
+        preview._refs += 1
+        _previews.move_to_end(path)
+        while len(_previews) > MAX_OPEN_PREVIEWS:
+            unused.append(_retire(_previews.popitem(last=False)[1]))
+    for stale in unused:
+        if stale is not None:
+            stale.close()
+    return preview
@@ -0,0 +1,194 @@
+import importlib
+import re
+import threading
+from collections import namedtuple
+
+# Intent name -> command templates. Templates are lowercase regular
+# expressions in which {slot} captures part of the utterance; slots are passed
+# to the intent's handler as keyword arguments.
+INTENTS = {
+    "get_weather": [
+        r"(?:what(?:'s| is) the |how(?:'s| is) the )?weather (?:like )?(?:in|at|for) {city}",
+        r"(?:what(?:'s| is) the )?(?:temperature|forecast) (?:in|at|for) {city}",
+        r"(?:is it|will it be) (?:raining|sunny|cold|hot|windy) in {city}",
+        r"{city} weather"
+    ],
+    "open_app": [
+        r"(?:open|launch|start|run) (?:the )?{app_name}(?: app| application)?"
+    ],
+    "send_email": [
+        r"(?:send|write) (?:an? )?(?:e-?mail|mail|message) to {to}"
+        r"(?: (?:about|with subject) {subject})?(?: (?:saying|that says) {body})?",
+        r"e-?mail {to} (?:saying|that says) {body}"
+    ]
+}
+
+# Intent name -> "module:function" it dispatches to; relative modules resolve inside this package
+HANDLERS = {
+    "get_weather": ".assistant:get_weather",
+    "open_app": ".assistant:open_app",
+    "send_email": ".assistant:send_email"
+}
+
+# Arguments a handler needs that a command may leave out
+DEFAULTS = {
+    "send_email": {"subject": "Message from JeevaAI"}
+}
+
+# Wake words and politeness around any command
+COMMAND_PREFIX = r"(?:(?:hey |ok )?jeeva )?(?:please |can you |could you )?"
+COMMAND_SUFFIX = r"(?: please| now| today| for me)?"
+
+IntentMatch = namedtuple("IntentMatch", ["intent", "slots", "text"])
+
+_SLOT = re.compile(r"\{(\w+)\}")
+_PUNCTUATION = re.compile(r"[^\w\s'@.\-]+|\.(?=\s|$)")
+
+
+def normalize_utterance(text):
+    """Lowercase ``text`` and drop punctuation the recognizer may add, keeping apostrophes and email addresses"""
+    text = text.lower().replace("’", "'")
+    return " ".join(_PUNCTUATION.sub(" ", text).split())
+
+
+def spoken_email(text):
+    """Turn "rahul at example dot com" into "rahul@example.com"; other text is returned unchanged"""
+    address = re.sub(r"\s+at\s+", "@", text)
+    address = re.sub(r"\s+dot\s+", ".", address)
+    return address.replace(" ", "") if "@" in address else text
+
+
+# Slot name -> function applied to its captured text
+SLOT_NORMALIZERS = {
+    "to": spoken_email
+}
+
+# One short word, the only kind of app name accepted without a catalog entry
+_APP_WORD = re.compile(r"[\w.+\-]{1,24}")
+EMAIL_ADDRESS = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s.]+")
+
+
+def plausible_app_name(name):
+    """A single short word, or a name the app catalog lists; keeps "start the day right" out of open_app"""
+    if _APP_WORD.fullmatch(name):
+        return True
+    from .app_catalog import get_app_catalog
+    return get_app_catalog().contains(name)
+
+
+def email_question(arguments):
+    """What to ask before sending, or None once there is a full address and something to say"""
+    to = arguments["to"]
+    if not EMAIL_ADDRESS.fullmatch(to):
+        return f"What is {to}'s full email address? Say it like name at example dot com."
+    if not arguments.get("body"):
+        return f"What should the email to {to} say? Try: email {to} saying, followed by the message."
+    return None
+
+
+# Slot name -> check of its normalized value; a command with a slot that fails is not matched, so it
+# falls through to chat
+SLOT_VALIDATORS = {
+    "app_name": plausible_app_name
+}
+
+# Intent -> function of the handler's arguments returning a question to ask instead of dispatching,
+# or None when the command is complete
+CLARIFICATIONS = {
+    "send_email": email_question
+}
+
+
+class IntentRouter:
+    """Match utterances against every command template at once and dispatch them
+
+    All templates are joined into one precompiled regex, so routing is a
+    single ``fullmatch`` however many intents there are. Each alternative
+    ends in an empty named group that identifies the template, and with it
+    the intent and slot groups. Alternatives are not wrapped in groups
+    because that stops the regex engine from skipping branches by their
+    first literal character. Earlier templates win when several match.
+    """
+
+    def __init__(self, intents=None, handlers=None, defaults=None, validators=None, clarifications=None):
+        self.handlers = dict(HANDLERS if handlers is None else handlers)
+        self.defaults = DEFAULTS if defaults is None else defaults
+        self.validators = SLOT_VALIDATORS if validators is None else validators
+        self.clarifications = CLARIFICATIONS if clarifications is None else clarifications
+        self._resolved = {}  # intent -> handler callable
+        self._lock = threading.Lock()
+        alternatives = []
+        self._templates = {}  # group name -> (intent, [(slot, group name)])
+        for intent, templates in (INTENTS if intents is None else intents).items():
+            for template in templates:
+                group = f"t{len(self._templates)}"
+                slots = []
+
+                def slot_group(match):
+                    slots.append((match.group(1), f"{group}_{match.group(1)}"))
+                    return f"(?P<{slots[-1][1]}>.+?)"
+
+                alternatives.append(f"{_SLOT.sub(slot_group, template)}(?P<{group}>)")
+                self._templates[group] = (intent, slots)
+        self._pattern = re.compile(f"{COMMAND_PREFIX}(?:{'|'.join(alternatives)}){COMMAND_SUFFIX}")
+
+    @property
+    def intents(self):
+        return sorted({intent for intent, _ in self._templates.values()})
+
+    def match(self, text):
+        """Return the IntentMatch for ``text``, or None if no template covers all of it or a slot is invalid"""
+        text = normalize_utterance(text)
+        match = self._pattern.fullmatch(text)
+        if match is None:
+            return None
+        # The marker group closes after the template's slots, so it is always the last group matched
+        intent, slots = self._templates[match.lastgroup]
+        values = {}
+        for slot, group in slots:
+            value = match.group(group)
+            if value is not None:
+                normalize = SLOT_NORMALIZERS.get(slot)
+                values[slot] = normalize(value) if normalize else value
+                validate = self.validators.get(slot)
+                if validate is not None and not validate(values[slot]):
+                    return None
+        return IntentMatch(intent, values, text)
+
+    def handler(self, intent):
+        handler = self._resolved.get(intent)
+        if handler is None:
+            with self._lock:
+                module_name, _, attribute = self.handlers[intent].partition(":")
+                handler = getattr(importlib.import_module(module_name, __package__), attribute)
+                self._resolved[intent] = handler
+        return handler
+
+    def dispatch(self, text):
+        """Match ``text`` and call its handler; returns ``(IntentMatch, result)``, or ``(None, None)``
+
+        When the command is missing something its intent needs, the result
+        is the question to ask back and the handler is not called.
+        """
+        match = self.match(text)
+        if match is None:
+            return None, None
+        arguments = dict(self.defaults.get(match.intent, {}), **match.slots)
+        clarify = self.clarifications.get(match.intent)
+        question = clarify(arguments) if clarify is not None else None
+        if question is not None:
+            return match, question
+        return match, self.handler(match.intent)(**arguments)
+
+
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_router():
+    """Return the process-wide IntentRouter for the built-in commands"""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = IntentRouter()
+    return _router
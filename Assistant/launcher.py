@@ -0,0 +1,227 @@
+import itertools
+import os
+import platform
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+STARTING = "starting"
+RUNNING = "running"
+EXITED = "exited"
+FAILED = "failed"
+TIMEOUT = "timeout"
+
+FINISHED = (EXITED, FAILED, TIMEOUT)
+
+
+def command_for(app_name):
+    """Turn an app name into an argv list for the current platform"""
+    if platform.system() == "Darwin":
+        return ["open", "-a", app_name]
+    return [app_name]
+
+
+def _detach_options():
+    # Children must not share our console, signals or standard streams
+    options = {"stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL,
+               "close_fds": True}
+    if platform.system() == "Windows":
+        options["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        options["start_new_session"] = True
+    return options
+
+
+class LaunchRecord:
+    __slots__ = ("id", "name", "command", "pid", "requested_at", "started_at", "ended_at", "status", "returncode",
+                 "error", "process", "started")
+
+    def __init__(self, launch_id, name, command):
+        self.id = launch_id
+        self.name = name
+        self.command = command
+        self.pid = None
+        self.requested_at = time.time()
+        self.started_at = None
+        self.ended_at = None
+        self.status = STARTING
+        self.returncode = None
+        self.error = None
+        self.process = None
+        self.started = threading.Event()  # set once the start has succeeded, failed or timed out
+
+    @property
+    def finished(self):
+        return self.status in FINISHED
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "app": self.name,
+            "pid": self.pid,
+            "status": self.status,
+            "started": time.strftime("%H:%M:%S", time.localtime(self.started_at or self.requested_at)),
+            "exit_code": self.returncode,
+            "error": self.error
+        }
+
+
+class AppLauncher:
+    """Start applications as detached processes and keep track of them
+
+    ``launch`` returns a LaunchRecord straight away; the process is started
+    on a worker pool. A launch is "failed" if the executable cannot be
+    started or exits with an error within ``grace`` seconds, and "timeout"
+    if starting it takes longer than ``start_timeout``. A background thread
+    watches running processes and records when they exit, so callers only
+    read the registry.
+    """
+
+    def __init__(self, max_workers=4, start_timeout=5.0, grace=0.5, poll_interval=0.5, max_records=100):
+        self.start_timeout = start_timeout
+        self.grace = grace
+        self.poll_interval = poll_interval
+        self.max_records = max_records
+        self._records = OrderedDict()  # id -> LaunchRecord
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="app-launch")
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._watcher = None
+
+    def launch(self, app, name=None):
+        """Start ``app`` (an app name or an argv list) and return its LaunchRecord without waiting"""
+        command = list(app) if isinstance(app, (list, tuple)) else command_for(app)
+        record = LaunchRecord(next(self._ids), name or os.path.basename(command[0]), command)
+        with self._lock:
+            self._records[record.id] = record
+            self._trim()
+        self._ensure_watcher()
+        self._executor.submit(self._start, record)
+        self._wakeup.set()
+        return record
+
+    def _start(self, record):
+        try:
+            process = subprocess.Popen(record.command, **_detach_options())
+        except OSError as e:
+            self._finish(record, FAILED, error=e.strerror or str(e))
+            return
+        with self._lock:
+            forgotten = self._records.get(record.id) is not record
+            if not forgotten:
+                record.process = process
+                record.pid = process.pid
+                record.started_at = time.time()
+                if record.status == TIMEOUT:
+                    # Popen returned after the watcher gave up on it, so track the process after all
+                    record.ended_at = None
+                    record.error = None
+                    record.started.clear()
+                    self._wakeup.set()
+                record.status = RUNNING
+        if forgotten:
+            # Timed out and cleared from the registry meanwhile; nothing could stop it later
+            process.terminate()
+            return
+        try:
+            returncode = process.wait(self.grace)
+        except subprocess.TimeoutExpired:
+            record.started.set()
+            return
+        # Exited within the grace period: an error code means it never really started
+        self._finish(record, FAILED if returncode else EXITED, returncode)
+
+    def _finish(self, record, status, returncode=None, error=None):
+        with self._lock:
+            if record.ended_at is None:
+                record.status = status
+                record.returncode = returncode
+                record.error = error
+                record.ended_at = time.time()
+        record.started.set()
+
+    def _trim(self):
+        # Forget the oldest finished launches beyond max_records
+        excess = len(self._records) - self.max_records
+        for launch_id in [launch_id for launch_id, record in self._records.items() if record.finished][:excess]:
+            del self._records[launch_id]
+
+    # Watching
+    def _ensure_watcher(self):
+        with self._lock:
+            if self._watcher is None or not self._watcher.is_alive():
+                self._stopped.clear()
+                self._watcher = threading.Thread(target=self._watch, name="app-watcher", daemon=True)
+                self._watcher.start()
+
+    def _watch(self):
+        while not self._stopped.is_set():
+            # Cleared before looking, so a launch that lands meanwhile still wakes the next wait
+            self._wakeup.clear()
+            now = time.time()
+            with self._lock:
+                active = [record for record in self._records.values() if not record.finished]
+            for record in active:
+                if record.status == STARTING and record.process is None:
+                    if now - record.requested_at > self.start_timeout:
+                        self._finish(record, TIMEOUT, error=f"did not start within {self.start_timeout:.0f}s")
+                elif record.started.is_set():
+                    # Past the grace period; earlier exits are judged by _start
+                    returncode = record.process.poll()
+                    if returncode is not None:
+                        self._finish(record, EXITED, returncode)
+            self._wakeup.wait(self.poll_interval if active else None)
+
+    # Registry
+    def get(self, launch_id):
+        with self._lock:
+            return self._records.get(launch_id)
+
+    def records(self):
+        """Snapshot of all tracked launches as dicts, newest first"""
+        with self._lock:
+            return [record.as_dict() for record in reversed(self._records.values())]
+
+    def running(self):
+        with self._lock:
+            return [record for record in self._records.values() if record.status == RUNNING]
+
+    def pending(self):
+        """Whether any launch is still starting"""
+        with self._lock:
+            return any(record.status == STARTING for record in self._records.values())
+
+    def terminate(self, launch_id):
+        record = self.get(launch_id)
+        if record is None or record.process is None or record.finished:
+            return False
+        record.process.terminate()
+        self._wakeup.set()
+        return True
+
+    def clear_finished(self):
+        with self._lock:
+            for launch_id in [launch_id for launch_id, record in self._records.items() if record.finished]:
+                del self._records[launch_id]
+
+    def close(self):
+        self._stopped.set()
+        self._wakeup.set()
+        self._executor.shutdown(wait=False)
+
+
+_launcher = None
+_launcher_lock = threading.Lock()
+
+
+def get_launcher():
+    """Return the process-wide AppLauncher"""
+    global _launcher
+    with _launcher_lock:
+        if _launcher is None:
+            _launcher = AppLauncher()
+    return _launcher
@@ -0,0 +1,202 @@
+import queue
+import threading
+import time
+from collections import namedtuple
+
+import speech_recognition as sr
+
+# captured_at / recognized_at are time.perf_counter() values
+Phrase = namedtuple("Phrase", ["text", "audio", "captured_at", "recognized_at"])
+
+_END = object()
+
+
+class _TrackedStream:
+    """Wrap an audio stream to notice end of input and optionally pace reads in real time"""
+
+    def __init__(self, stream, bytes_per_second, realtime):
+        self.stream = stream
+        self.bytes_per_second = bytes_per_second
+        self.realtime = realtime
+        self.ended = False
+        self._started = time.perf_counter()
+        self._bytes_read = 0
+
+    def read(self, size):
+        data = self.stream.read(size)
+        if not data:
+            self.ended = True
+            return data
+        if self.realtime:
+            self._bytes_read += len(data)
+            delay = self._started + self._bytes_read / self.bytes_per_second - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        return data
+
+
+class WavFileSource(sr.AudioFile):
+    """WAV/AIFF/FLAC file usable in place of the microphone
+
+    With ``realtime=True`` audio is delivered no faster than it would arrive
+    from a microphone, which keeps latency measurements honest.
+    """
+
+    def __init__(self, path, realtime=False):
+        super().__init__(path)
+        self.realtime = realtime
+
+    def __enter__(self):
+        super().__enter__()
+        self.stream = _TrackedStream(self.stream, self.SAMPLE_RATE * self.SAMPLE_WIDTH, self.realtime)
+        return self
+
+
+def google_recognizer(recognizer, audio):
+    return recognizer.recognize_google(audio)
+
+
+class ScriptedRecognizer:
+    """Recognizer stand-in for headless runs: returns ``texts`` in turn, one per phrase
+
+    ``delay`` simulates recognition time. Once the script runs out every
+    phrase is reported as not understood.
+    """
+
+    def __init__(self, texts, delay=0.0):
+        self.delay = delay
+        self._texts = iter(texts)
+        self._lock = threading.Lock()
+
+    def __call__(self, recognizer, audio):
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            text = next(self._texts, None)
+        if text is None:
+            raise sr.UnknownValueError()
+        return text
+
+
+class VoiceListener:
+    """Continuously capture phrases in the background and recognize them off the capture thread
+
+    One Recognizer is kept for the life of the listener and calibrated for
+    ambient noise only once. Capture and recognition run on separate threads,
+    so the next phrase is recorded while the previous one is transcribed.
+    Recognized phrases land in a bounded queue; when consumers fall behind
+    the oldest phrase is dropped. An error while opening or reading the
+    source ends the listener; it is kept in ``error``, counted in ``stats``
+    and passed to ``on_error``.
+    """
+
+    def __init__(self, source_factory=None, recognize=None, recognizer=None, max_phrases=10,
+                 calibration_duration=1.0, phrase_time_limit=None, listen_timeout=1, on_error=None):
+        self.source_factory = source_factory or sr.Microphone
+        self.recognize = recognize or google_recognizer
+        self.recognizer = recognizer or sr.Recognizer()
+        self.calibration_duration = calibration_duration
+        self.phrase_time_limit = phrase_time_limit
+        self.listen_timeout = listen_timeout
+        self.on_error = on_error
+        self.error = None
+        self.calibrated = False
+        self.max_phrases = max_phrases
+        self._audio = queue.Queue(maxsize=max_phrases + 1)
+        self._phrases = queue.Queue(maxsize=max_phrases + 1)
+        self._running = threading.Event()
+        self._threads = []
+        self.stats = {"captured": 0, "recognized": 0, "unrecognized": 0, "dropped": 0, "errors": 0}
+
+    def start(self):
+        if self._running.is_set():
+            return self
+        self._audio = queue.Queue(maxsize=self.max_phrases + 1)
+        self._phrases = queue.Queue(maxsize=self.max_phrases + 1)
+        self.error = None
+        self._running.set()
+        self._threads = [
+            threading.Thread(target=self._capture, name="voice-capture", daemon=True),
+            threading.Thread(target=self._transcribe, name="voice-recognize", daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, wait=True):
+        self._running.clear()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    @property
+    def running(self):
+        return self._running.is_set()
+
+    # Each queue has one producer and a spare slot, so the end marker never evicts an item
+    def _put_dropping_oldest(self, q, item):
+        while q.qsize() >= self.max_phrases:
+            try:
+                q.get_nowait()
+                self.stats["dropped"] += 1
+            except queue.Empty:
+                break
+        q.put_nowait(item)
+
+    def _capture(self):
+        try:
+            with self.source_factory() as source:
+                if not self.calibrated and self.calibration_duration:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=self.calibration_duration)
+                self.calibrated = True
+                while self._running.is_set():
+                    try:
+                        audio = self.recognizer.listen(source, self.listen_timeout, self.phrase_time_limit)
+                    except sr.WaitTimeoutError:
+                        continue
+                    if audio.frame_data:
+                        self.stats["captured"] += 1
+                        self._put_dropping_oldest(self._audio, (audio, time.perf_counter()))
+                    if getattr(source.stream, "ended", False):
+                        break
+        except Exception as e:
+            self.error = e
+            self.stats["errors"] += 1
+            if self.on_error is not None:
+                self.on_error(e)
+        finally:
+            self._audio.put_nowait(_END)
+
+    def _transcribe(self):
+        while True:
+            item = self._audio.get()
+            if item is _END:
+                break
+            audio, captured_at = item
+            try:
+                text = self.recognize(self.recognizer, audio)
+            except (sr.UnknownValueError, sr.RequestError):
+                self.stats["unrecognized"] += 1
+                continue
+            self.stats["recognized"] += 1
+            self._put_dropping_oldest(self._phrases, Phrase(text, audio, captured_at, time.perf_counter()))
+        self._running.clear()
+        self._phrases.put_nowait(_END)
+
+    def phrases(self, timeout=None):
+        """Yield recognized phrases as they arrive until the listener stops
+
+        ``timeout`` bounds the wait for each phrase; when it expires the
+        generator simply ends.
+        """
+        while True:
+            try:
+                phrase = self._phrases.get(timeout=timeout)
+            except queue.Empty:
+                return
+            if phrase is _END:
+                return
+            yield phrase
+
+    def __iter__(self):
+        return self.phrases()
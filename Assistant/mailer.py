@@ -0,0 +1,188 @@
+import os
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import Future
+from email.mime.text import MIMEText
+
+
+def build_message(to, subject, body, sender=None):
+    msg = MIMEText(body)
+    msg['Subject'] = subject
+    msg['From'] = sender or os.getenv("EMAIL_USER")
+    msg['To'] = to
+    return msg
+
+
+class _TrackedData:
+    """Remember whether DATA was sent, so a failed send is only retried when the server cannot have the message"""
+
+    data_started = False
+
+    def data(self, msg):
+        self.data_started = True
+        return super().data(msg)
+
+
+class _SMTP(_TrackedData, smtplib.SMTP):
+    pass
+
+
+class _SMTP_SSL(_TrackedData, smtplib.SMTP_SSL):
+    pass
+
+
+class MailSender:
+    """Keep one authenticated SMTP session alive and reuse it for every message
+
+    The session is checked with NOOP when it has been idle for ``noop_after``
+    seconds, closed after ``idle_timeout`` seconds without traffic and
+    reopened transparently on the next send. ``security`` is "ssl" (SMTP over
+    TLS), "starttls" or "none" (plain, for local test servers).
+    """
+
+    def __init__(self, host="smtp.gmail.com", port=465, security="ssl", username=None, password=None,
+                 idle_timeout=60, noop_after=10, timeout=30, batch_size=50):
+        if security not in ("ssl", "starttls", "none"):
+            raise ValueError(f"Unknown SMTP security mode: {security}")
+        self.host = host
+        self.port = port
+        self.security = security
+        self.username = username if username is not None else os.getenv("EMAIL_USER")
+        self.password = password if password is not None else os.getenv("EMAIL_PASS")
+        self.idle_timeout = idle_timeout
+        self.noop_after = noop_after
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self._server = None
+        self._last_used = 0.0
+        self._lock = threading.RLock()
+        self._outbox = queue.Queue()
+        self._worker = None
+        self.stats = {"connects": 0, "sent": 0, "failed": 0}
+
+    # Connection handling
+    def _connect(self):
+        if self.security == "ssl":
+            server = _SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            server = _SMTP(self.host, self.port, timeout=self.timeout)
+            if self.security == "starttls":
+                server.starttls()
+        if self.username and self.password:
+            server.login(self.username, self.password)
+        self.stats["connects"] += 1
+        return server
+
+    def _is_alive(self):
+        try:
+            return self._server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _connection(self):
+        idle = time.monotonic() - self._last_used
+        if self._server is not None:
+            if idle > self.idle_timeout or (idle > self.noop_after and not self._is_alive()):
+                self._disconnect()
+        if self._server is None:
+            self._server = self._connect()
+            self._last_used = time.monotonic()
+        return self._server
+
+    def _disconnect(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                self._server.close()
+            self._server = None
+
+    def close(self):
+        with self._lock:
+            self._disconnect()
+
+    # Sending
+    def send(self, msg):
+        """Send one message, reconnecting once if the cached session went away before DATA"""
+        with self._lock:
+            server = self._connection()
+            server.data_started = False
+            try:
+                server.send_message(msg)
+            except OSError as e:
+                if isinstance(e, smtplib.SMTPException) and not isinstance(e, smtplib.SMTPServerDisconnected):
+                    # The server answered and refused the message; the session is still usable
+                    raise
+                self._disconnect()
+                if server.data_started:
+                    # The server may already have accepted it, so resending could deliver it twice
+                    raise
+                self._connection().send_message(msg)
+            self._last_used = time.monotonic()
+            self.stats["sent"] += 1
+
+    def send_many(self, messages):
+        """Send messages over one session; returns None or the exception for each message"""
+        results = []
+        with self._lock:
+            for msg in messages:
+                try:
+                    self.send(msg)
+                    results.append(None)
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    results.append(e)
+        return results
+
+    # Background outbox
+    def submit(self, msg):
+        """Queue a message for background delivery and return a Future for the result"""
+        handle = Future()
+        self._outbox.put((msg, handle))
+        self._ensure_worker()
+        return handle
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._drain_outbox, name="mail-outbox", daemon=True)
+                self._worker.start()
+
+    def _drain_outbox(self):
+        while True:
+            try:
+                batch = [self._outbox.get(timeout=self.idle_timeout)]
+            except queue.Empty:
+                self.close()
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._outbox.get_nowait())
+                except queue.Empty:
+                    break
+            pending = [(msg, handle) for msg, handle in batch if handle.set_running_or_notify_cancel()]
+            results = self.send_many([msg for msg, _ in pending])
+            for (_, handle), error in zip(pending, results):
+                if error is None:
+                    handle.set_result("Email sent successfully!")
+                else:
+                    handle.set_exception(error)
+
+
+_sender = None
+_sender_lock = threading.Lock()
+
+
+def get_sender():
+    """Return the process-wide MailSender configured from the environment"""
+    global _sender
+    with _sender_lock:
+        if _sender is None:
+            _sender = MailSender(
+                host=os.getenv("SMTP_HOST", "smtp.gmail.com"),
+                port=int(os.getenv("SMTP_PORT", "465")),
+                security=os.getenv("SMTP_SECURITY", "ssl")
+            )
+    return _sender
@@ -0,0 +1,395 @@
+import functools
+import os
+import threading
+from bisect import bisect_left
+from contextlib import nullcontext
+from time import perf_counter
+
+# Bucket upper bounds in seconds; the last one catches everything slower
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def bucket_quantile(buckets, counts, maximum, q):
+    """Estimate quantile ``q`` by interpolating inside the bucket it falls in"""
+    count = sum(counts)
+    if not count:
+        return 0.0
+    rank = q * count
+    seen = 0
+    for i, bucket_count in enumerate(counts):
+        if bucket_count and seen + bucket_count >= rank:
+            lower = buckets[i - 1] if i else 0.0
+            upper = min(buckets[i], maximum)
+            return lower + (upper - lower) * (rank - seen) / bucket_count
+        seen += bucket_count
+    return maximum
+
+
+class Histogram:
+    """Thread-safe latency histogram with fixed buckets
+
+    Observing is a bisect and a few additions, so it is cheap enough for
+    every request; quantiles are estimated by interpolating inside the
+    bucket they fall in.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        i = bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def quantile(self, q):
+        with self._lock:
+            counts, maximum = list(self.counts), self.max
+        return bucket_quantile(self.buckets, counts, maximum, q)
+
+    def snapshot(self):
+        """Count, mean, p50/p95/p99 and max in seconds"""
+        with self._lock:
+            count, total, maximum = self.count, self.sum, self.max
+        return {
+            "count": count,
+            "mean": total / count if count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": maximum
+        }
+
+
+class CallStats:
+    """Latency buckets, errors and in-flight count of one call name
+
+    Each thread records into its own CallStats, so nothing here is locked;
+    a collector reading it from another thread may see a call half
+    recorded, which only shifts it into the next scrape. ``generation`` is
+    the registry reset the maximum was last cleared for.
+    """
+    __slots__ = ("buckets", "counts", "sum", "max", "in_flight", "errors", "generation")
+
+    def __init__(self, buckets=LATENCY_BUCKETS, generation=0):
+        self.buckets = buckets
+        self.generation = generation
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.max = 0.0
+        self.in_flight = 0
+        self.errors = {}  # exception type name -> count
+
+    def observe(self, seconds):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def error(self, kind):
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def merge(self, other):
+        for i, bucket_count in enumerate(list(other.counts)):
+            self.counts[i] += bucket_count
+        self.sum += other.sum
+        # A maximum from before the last reset no longer counts
+        if other.generation == self.generation:
+            self.max = max(self.max, other.max)
+        self.in_flight += other.in_flight
+        for kind, count in list(other.errors.items()):
+            self.errors[kind] = self.errors.get(kind, 0) + count
+
+    def subtract(self, baseline):
+        """Take away the calls and errors already counted in ``baseline``; in-flight calls stay"""
+        for i, bucket_count in enumerate(baseline.counts):
+            self.counts[i] -= bucket_count
+        self.sum = max(self.sum - baseline.sum, 0.0) if self.count else 0.0
+        for kind, count in baseline.errors.items():
+            remaining = self.errors.get(kind, 0) - count
+            if remaining > 0:
+                self.errors[kind] = remaining
+            else:
+                self.errors.pop(kind, None)
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def quantile(self, q):
+        return bucket_quantile(self.buckets, self.counts, self.max, q)
+
+
+class MetricsRegistry:
+    """Per-call statistics kept in per-thread buffers and merged when read
+
+    Recording a call touches only the calling thread's buffer, so hot paths
+    never wait on a lock; the lock is taken once when a thread records its
+    first call and when the buffers are collected. Buffers of threads that
+    have exited are folded into one retired set whenever a new thread
+    registers, so short-lived threads such as Streamlit's per-rerun script
+    threads never pile up. Resetting never writes to another thread's
+    buffer: it records a baseline that is subtracted when reading.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS, enabled=True):
+        self.buckets = tuple(buckets)
+        self.enabled = enabled
+        self._local = threading.local()
+        self._buffers = []  # (thread, {call name: CallStats})
+        self._retired = {}
+        self._baseline = {}  # live buffers merged at the last reset
+        self._generation = 0  # number of resets
+        self._lock = threading.Lock()
+
+    # Recording
+    def stats(self, name):
+        """The calling thread's CallStats for ``name``"""
+        calls = getattr(self._local, "calls", None)
+        if calls is None:
+            calls = self._local.calls = {}
+            with self._lock:
+                self._retire_dead()
+                self._buffers.append((threading.current_thread(), calls))
+        stats = calls.get(name)
+        if stats is None:
+            stats = calls[name] = CallStats(self.buckets, self._generation)
+        elif stats.generation != self._generation:
+            # Only the owning thread clears its maximum after a reset
+            stats.max = 0.0
+            stats.generation = self._generation
+        return stats
+
+    def record(self, name, seconds, error=None):
+        if self.enabled:
+            stats = self.stats(name)
+            stats.observe(seconds)
+            if error is not None:
+                stats.error(type(error).__name__)
+
+    def record_error(self, name, error):
+        """Count ``error`` against ``name`` for calls that turn exceptions into return values"""
+        if self.enabled:
+            self.stats(name).error(type(error).__name__)
+
+    def reset(self):
+        """Start counting from zero; calls in flight are still reported until they finish"""
+        with self._lock:
+            self._retired = {}
+            self._generation += 1
+            baseline = {}
+            for _, calls in self._buffers:
+                self._fold(baseline, calls)
+            self._baseline = baseline
+
+    # Reading
+    def collect(self):
+        """Merged CallStats of every thread, keyed by call name"""
+        with self._lock:
+            self._retire_dead()
+            merged = {}
+            self._fold(merged, self._retired)
+            for _, calls in self._buffers:
+                self._fold(merged, calls)
+            for name, baseline in self._baseline.items():
+                merged[name].subtract(baseline)
+        return dict(sorted(merged.items()))
+
+    def _retire_dead(self):
+        live = []
+        for thread, calls in self._buffers:
+            if thread.is_alive():
+                live.append((thread, calls))
+            else:
+                self._fold(self._retired, calls)
+        self._buffers = live
+
+    def _fold(self, target, calls):
+        for name, stats in list(calls.items()):
+            if name not in target:
+                target[name] = CallStats(self.buckets, self._generation)
+            target[name].merge(stats)
+
+    def summary(self):
+        """One row per call name with counts and latency quantiles in milliseconds"""
+        rows = []
+        for name, stats in self.collect().items():
+            count = stats.count
+            rows.append({
+                "call": name,
+                "calls": count,
+                "errors": sum(stats.errors.values()),
+                "in_flight": stats.in_flight,
+                "mean_ms": round(stats.sum / count * 1000, 2) if count else 0.0,
+                "p50_ms": round(stats.quantile(0.5) * 1000, 2),
+                "p95_ms": round(stats.quantile(0.95) * 1000, 2),
+                "p99_ms": round(stats.quantile(0.99) * 1000, 2),
+                "max_ms": round(stats.max * 1000, 2)
+            })
+        return rows
+
+    def prometheus(self, prefix="jeeva"):
+        """Everything collected, in the Prometheus text exposition format"""
+        collected = self.collect()
+        lines = [f"# HELP {prefix}_call_duration_seconds Time spent in instrumented calls",
+                 f"# TYPE {prefix}_call_duration_seconds histogram"]
+        for name, stats in collected.items():
+            call = _label(name)
+            cumulative = 0
+            for bucket, bucket_count in zip(self.buckets, stats.counts):
+                cumulative += bucket_count
+                le = "+Inf" if bucket == float("inf") else repr(bucket)
+                lines.append(f'{prefix}_call_duration_seconds_bucket{{call="{call}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_call_duration_seconds_sum{{call="{call}"}} {stats.sum!r}')
+            lines.append(f'{prefix}_call_duration_seconds_count{{call="{call}"}} {cumulative}')
+        lines += [f"# HELP {prefix}_call_errors_total Instrumented calls that failed, by exception type",
+                  f"# TYPE {prefix}_call_errors_total counter"]
+        for name, stats in collected.items():
+            for kind, count in sorted(stats.errors.items()):
+                lines.append(f'{prefix}_call_errors_total{{call="{_label(name)}",error="{_label(kind)}"}} {count}')
+        lines += [f"# HELP {prefix}_calls_in_flight Instrumented calls currently running",
+                  f"# TYPE {prefix}_calls_in_flight gauge"]
+        for name, stats in collected.items():
+            lines.append(f'{prefix}_calls_in_flight{{call="{_label(name)}"}} {stats.in_flight}')
+        return "\n".join(lines) + "\n"
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Timer:
+    __slots__ = ("stats", "started")
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def __enter__(self):
+        self.stats.in_flight += 1
+        self.started = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stats.observe(perf_counter() - self.started)
+        self.stats.in_flight -= 1
+        # Control flow such as Streamlit's rerun and stop is not an Exception and is not counted
+        if exc_type is not None and issubclass(exc_type, Exception):
+            self.stats.error(exc_type.__name__)
+        return False
+
+
+# Off with JEEVA_METRICS=0; disabled instrumentation costs one attribute check per call
+REGISTRY = MetricsRegistry(enabled=os.getenv("JEEVA_METRICS", "1") != "0")
+
+_NOT_TIMED = nullcontext()
+
+
+def enable():
+    REGISTRY.enabled = True
+
+
+def disable():
+    REGISTRY.enabled = False
+
+
+def instrument(name=None):
+    """Decorator recording latency, errors and in-flight calls of a function under ``name``"""
+    def decorate(func):
+        call = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not REGISTRY.enabled:
+                return func(*args, **kwargs)
+            stats = REGISTRY.stats(call)
+            stats.in_flight += 1
+            started = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                stats.error(type(e).__name__)
+                raise
+            finally:
+                stats.observe(perf_counter() - started)
+                stats.in_flight -= 1
+
+        return wrapper
+
+    return decorate
+
+
+def timed(name):
+    """Context manager recording the block it wraps like an instrumented call"""
+    if not REGISTRY.enabled:
+        return _NOT_TIMED
+    return _Timer(REGISTRY.stats(name))
+
+
+def record_error(name, error):
+    REGISTRY.record_error(name, error)
+
+
+# Exporter
+def _handler_class():
+    # http.server is only imported once the endpoint is started
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = REGISTRY.prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MetricsHandler
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port=None, host="127.0.0.1"):
+    """Serve ``/metrics`` from a background thread and return its URL
+
+    JEEVA_METRICS_PORT sets the port (default 9464). Returns None when the
+    port is taken, e.g. by another JeevaAI process already exporting.
+    """
+    global _server
+    from http.server import ThreadingHTTPServer
+    with _server_lock:
+        if _server is None:
+            if port is None:
+                port = int(os.getenv("JEEVA_METRICS_PORT", "9464"))
+            try:
+                _server = ThreadingHTTPServer((host, port), _handler_class())
+            except OSError:
+                return None
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+    return metrics_url()
+
+
+def metrics_url():
+    """URL of this process's metrics endpoint, or None if it is not running"""
+    if _server is None:
+        return None
+    host, port = _server.server_address[:2]
+    return f"http://{host}:{port}/metrics"
@@ -0,0 +1,195 @@
+import heapq
+import threading
+import time
+from collections import deque
+from operator import attrgetter
+
+import psutil
+
+# Only these attributes are read for each process; as_dict rejects any the
+# platform lacks, such as io_counters on macOS
+PROCESS_ATTRS = [attr for attr in ["pid", "name", "username", "create_time", "cpu_times", "memory_info", "io_counters"]
+                 if hasattr(psutil.Process, attr)]
+
+SORT_KEYS = {
+    "cpu": "cpu_percent",
+    "memory": "rss",
+    "io": "io_rate"
+}
+
+
+class PsutilProvider:
+    """Process source backed by psutil, keeping Process objects between ticks"""
+
+    def __init__(self, attrs=None):
+        self.attrs = attrs or PROCESS_ATTRS
+        self._processes = {}
+
+    def pids(self):
+        return psutil.pids()
+
+    def read(self, pid):
+        """Return the whitelisted attributes for ``pid`` as a dict, or None if it is gone"""
+        proc = self._processes.get(pid)
+        try:
+            if proc is None:
+                proc = self._processes[pid] = psutil.Process(pid)
+            return proc.as_dict(attrs=self.attrs, ad_value=None)
+        except psutil.NoSuchProcess:
+            self._processes.pop(pid, None)
+            return None
+
+    def forget(self, pid):
+        self._processes.pop(pid, None)
+
+
+class ProcessStats:
+    __slots__ = ("pid", "name", "username", "create_time", "cpu_time", "cpu_percent", "rss", "io_bytes",
+                 "io_rate", "seen_at")
+
+    def __init__(self, pid, name, username, create_time, cpu_time, rss, io_bytes, seen_at):
+        self.pid = pid
+        self.name = name
+        self.username = username
+        self.create_time = create_time
+        self.cpu_time = cpu_time
+        self.cpu_percent = 0.0
+        self.rss = rss
+        self.io_bytes = io_bytes
+        self.io_rate = 0.0
+        self.seen_at = seen_at
+
+    def as_dict(self):
+        return {
+            "pid": self.pid,
+            "name": self.name,
+            "user": self.username,
+            "cpu_percent": round(self.cpu_percent, 1),
+            "memory_mb": round(self.rss / (1024**2), 1),
+            "io_kb_per_s": round(self.io_rate / 1024, 1)
+        }
+
+
+class ProcessSampler:
+    """Track per-process CPU, memory and IO by differencing between ticks
+
+    Each tick continues a sweep over the pid list and stops once the
+    sampling thread has used ``budget`` seconds of CPU time, picking up where
+    it left off on the next tick. CPU% and IO rates come from the change since a process was last
+    read, so no blocking ``cpu_percent(interval=...)`` call is needed.
+    """
+
+    def __init__(self, provider=None, interval=2.0, budget=0.02):
+        self.provider = provider or PsutilProvider()
+        self.interval = interval
+        self.budget = budget
+        self._stats = {}  # pid -> ProcessStats
+        self._pending = deque()
+        self._seen = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self.sweeps = 0
+        self.last_sweep_seconds = None
+        self._sweep_started = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="process-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            try:
+                self.tick()
+            except Exception:
+                pass
+            if self._stopped.wait(self.interval):
+                return
+
+    def tick(self):
+        """Read as many processes as the CPU budget allows; returns how many were read"""
+        # Only this thread's CPU time, so busy threads elsewhere in the app do not cut the tick short
+        started = time.thread_time()
+        if not self._pending:
+            self._pending.extend(self.provider.pids())
+            self._seen = set()
+            self._sweep_started = time.monotonic()
+        read = 0
+        while self._pending:
+            pid = self._pending.popleft()
+            info = self.provider.read(pid)
+            read += 1
+            if info is not None:
+                self._update(pid, info)
+                self._seen.add(pid)
+            if time.thread_time() - started > self.budget:
+                break
+        if not self._pending:
+            self._finish_sweep()
+        return read
+
+    def _update(self, pid, info):
+        now = time.monotonic()
+        cpu_times = info.get("cpu_times")
+        cpu_time = cpu_times.user + cpu_times.system if cpu_times else 0.0
+        memory = info.get("memory_info")
+        rss = memory.rss if memory else 0
+        io = info.get("io_counters")
+        io_bytes = io.read_bytes + io.write_bytes if io else 0
+        with self._lock:
+            previous = self._stats.get(pid)
+            if previous is None or previous.create_time != info.get("create_time"):
+                self._stats[pid] = ProcessStats(pid, info.get("name"), info.get("username"),
+                                                info.get("create_time"), cpu_time, rss, io_bytes, now)
+                return
+            elapsed = now - previous.seen_at
+            if elapsed > 0:
+                previous.cpu_percent = max(0.0, (cpu_time - previous.cpu_time) / elapsed * 100)
+                previous.io_rate = max(0.0, (io_bytes - previous.io_bytes) / elapsed)
+            previous.cpu_time = cpu_time
+            previous.rss = rss
+            previous.io_bytes = io_bytes
+            previous.seen_at = now
+
+    def _finish_sweep(self):
+        with self._lock:
+            for pid in set(self._stats) - self._seen:
+                del self._stats[pid]
+                if hasattr(self.provider, "forget"):
+                    self.provider.forget(pid)
+        self.sweeps += 1
+        if self._sweep_started is not None:
+            self.last_sweep_seconds = time.monotonic() - self._sweep_started
+
+    def __len__(self):
+        return len(self._stats)
+
+    def top(self, n=10, by="cpu"):
+        """Return the top ``n`` processes by "cpu", "memory" or "io" as dicts"""
+        key = attrgetter(SORT_KEYS[by])
+        with self._lock:
+            best = heapq.nlargest(n, self._stats.values(), key=key)
+        return [s.as_dict() for s in best]
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def get_process_sampler():
+    """Return the process-wide ProcessSampler, starting it on first use"""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = ProcessSampler().start()
+    return _sampler
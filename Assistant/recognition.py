@@ -0,0 +1,286 @@
+import importlib.util
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+
+import speech_recognition as sr
+
+try:
+    from speech_recognition.exceptions import SetupError
+except ImportError:  # SpeechRecognition releases before 3.11
+    class SetupError(Exception):
+        """Raised when an engine's model is missing or cannot be loaded"""
+
+AUDIO_EXTENSIONS = (".wav", ".aiff", ".aif", ".flac")
+
+
+class RecognizerBackend(ABC):
+    """A speech-to-text engine usable wherever a ``recognize(recognizer, audio)`` callable is expected"""
+
+    name = None
+    online = False
+    module = None  # optional dependency that has to be importable
+
+    def available(self):
+        return self.module is None or importlib.util.find_spec(self.module) is not None
+
+    @abstractmethod
+    def recognize(self, recognizer, audio):
+        """Return the text spoken in ``audio``; raise sr.UnknownValueError, sr.RequestError or SetupError"""
+
+    def __call__(self, recognizer, audio):
+        return self.recognize(recognizer, audio)
+
+
+class ModelBackend(RecognizerBackend):
+    """A local engine whose model is loaded on first use and kept for the life of the backend"""
+
+    def __init__(self):
+        self._model = None
+        self._model_lock = threading.Lock()
+
+    def available(self):
+        return super().available() and self.model_present()
+
+    @abstractmethod
+    def model_present(self):
+        """True if the model files are on disk, checked without loading them"""
+
+    @abstractmethod
+    def load_model(self):
+        pass
+
+    def model(self):
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    if not self.model_present():
+                        raise SetupError(f"No {self.name} model found")
+                    self._model = self.load_model()
+        return self._model
+
+
+class GoogleBackend(RecognizerBackend):
+    name = "google"
+    online = True
+
+    def __init__(self, language="en-US"):
+        self.language = language
+
+    def recognize(self, recognizer, audio):
+        return recognizer.recognize_google(audio, language=self.language)
+
+
+class SphinxBackend(RecognizerBackend):
+    name = "sphinx"
+    module = "pocketsphinx"
+
+    def __init__(self, language="en-US"):
+        self.language = language
+
+    def recognize(self, recognizer, audio):
+        return recognizer.recognize_sphinx(audio, language=self.language)
+
+
+def default_vosk_model_path():
+    """JEEVA_VOSK_MODEL, else where ``sprc download vosk`` puts the model"""
+    path = os.getenv("JEEVA_VOSK_MODEL")
+    if path:
+        return path
+    return os.path.join(os.path.dirname(os.path.abspath(sr.__file__)), "models", "vosk")
+
+
+class VoskBackend(ModelBackend):
+    name = "vosk"
+    module = "vosk"
+    sample_rate = 16000
+
+    def __init__(self, model_path=None):
+        super().__init__()
+        self.model_path = model_path or default_vosk_model_path()
+
+    def model_present(self):
+        return os.path.isdir(self.model_path)
+
+    def load_model(self):
+        from vosk import Model
+        return Model(self.model_path)
+
+    def recognize(self, recognizer, audio):
+        from vosk import KaldiRecognizer
+        # The model is shared; a KaldiRecognizer per utterance is cheap
+        kaldi = KaldiRecognizer(self.model(), self.sample_rate)
+        kaldi.AcceptWaveform(audio.get_raw_data(convert_rate=self.sample_rate, convert_width=2))
+        text = json.loads(kaldi.FinalResult()).get("text", "")
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+# Checkpoint file each whisper model name downloads to, where it differs from "<name>.pt"
+_WHISPER_FILES = {"large": "large-v3.pt", "turbo": "large-v3-turbo.pt"}
+
+
+class WhisperBackend(ModelBackend):
+    name = "whisper"
+    module = "whisper"
+
+    def __init__(self, model="base", download_root=None):
+        super().__init__()
+        self.model_name = model
+        cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        self.download_root = download_root or os.path.join(cache_home, "whisper")
+
+    def model_present(self):
+        if os.path.isfile(self.model_name):
+            return True
+        filename = _WHISPER_FILES.get(self.model_name, f"{self.model_name}.pt")
+        return os.path.isfile(os.path.join(self.download_root, filename))
+
+    def load_model(self):
+        import whisper
+        return whisper.load_model(self.model_name, download_root=self.download_root)
+
+    def recognize(self, recognizer, audio):
+        import numpy as np
+        import torch
+        samples = np.frombuffer(audio.get_raw_data(convert_rate=16000, convert_width=2), np.int16)
+        result = self.model().transcribe(samples.astype(np.float32) / 32768.0, fp16=torch.cuda.is_available())
+        text = result["text"].strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+BACKENDS = {
+    "google": GoogleBackend,
+    "sphinx": SphinxBackend,
+    "vosk": VoskBackend,
+    "whisper": WhisperBackend
+}
+
+# Offline engines in order of preference
+OFFLINE_PREFERENCE = ["vosk", "whisper", "sphinx"]
+
+
+def get_backend(name, **options):
+    try:
+        return BACKENDS[name](**options)
+    except KeyError:
+        raise ValueError(f"Unknown speech recognition backend: {name}") from None
+
+
+def available_offline_backends():
+    backends = [get_backend(name) for name in OFFLINE_PREFERENCE]
+    return [backend for backend in backends if backend.available()]
+
+
+def select_backend(internet_connected=None, prefer=None):
+    """Pick a backend: ``prefer`` if given, the online engine when connected, otherwise a local one"""
+    if prefer:
+        return get_backend(prefer)
+    if internet_connected is None:
+        from .connectivity import get_status
+        internet_connected = get_status().internet is not False
+    if internet_connected:
+        return GoogleBackend()
+    offline = available_offline_backends()
+    if not offline:
+        raise RuntimeError("No offline speech recognition engine is installed (try vosk or pocketsphinx)")
+    return offline[0]
+
+
+class AutoBackend(RecognizerBackend):
+    """Choose per utterance between the online engine and a local one based on connectivity
+
+    If the online engine fails with a request error the utterance is retried
+    on the local engines. A local engine that cannot be set up is dropped and
+    the next one is tried; when none is left the failure is reported as a
+    request error, which callers such as VoiceListener already skip.
+    """
+
+    name = "auto"
+
+    def __init__(self, status=None, online_backend=None, offline_backends=None):
+        if status is None:
+            from .connectivity import get_status as status
+        self.status = status
+        self.online_backend = online_backend or GoogleBackend()
+        self.offline_backends = list(available_offline_backends() if offline_backends is None else offline_backends)
+
+    @property
+    def offline_backend(self):
+        return self.offline_backends[0] if self.offline_backends else None
+
+    def recognize(self, recognizer, audio):
+        if self.offline_backends and self.status().internet is False:
+            return self._recognize_offline(recognizer, audio)
+        try:
+            return self.online_backend.recognize(recognizer, audio)
+        except sr.RequestError:
+            if not self.offline_backends:
+                raise
+            return self._recognize_offline(recognizer, audio)
+
+    def _recognize_offline(self, recognizer, audio):
+        while self.offline_backends:
+            backend = self.offline_backends[0]
+            try:
+                return backend.recognize(recognizer, audio)
+            except SetupError:
+                # Not retried on later utterances
+                if self.offline_backends and self.offline_backends[0] is backend:
+                    self.offline_backends.pop(0)
+        raise sr.RequestError("No offline speech recognition engine could be set up")
+
+
+# Batch transcription
+_worker_backends = {}  # backend name -> backend, one per worker process so models load once
+
+
+def _transcribe_file(path, backend_name):
+    recognizer = sr.Recognizer()
+    backend = _worker_backends.get(backend_name)
+    if backend is None:
+        backend = _worker_backends[backend_name] = get_backend(backend_name)
+    try:
+        with sr.AudioFile(path) as source:
+            duration = source.DURATION
+            audio = recognizer.record(source)
+    except (OSError, ValueError, EOFError) as e:
+        # A file that cannot be read fails on its own instead of the whole batch
+        return path, None, 0.0, repr(e)
+    try:
+        return path, backend.recognize(recognizer, audio), duration, None
+    except (sr.UnknownValueError, sr.RequestError, SetupError) as e:
+        return path, None, duration, repr(e)
+
+
+def batch_transcribe(directory, backend_name="sphinx", workers=None):
+    """Transcribe every audio file under ``directory`` on a process pool
+
+    Returns ``(results, stats)`` where results is a list of
+    ``(path, text, audio_seconds, error)`` tuples and stats reports throughput
+    in audio-seconds per wall-second.
+    """
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths.extend(os.path.join(root, name) for name in sorted(files) if name.lower().endswith(AUDIO_EXTENSIONS))
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_transcribe_file, paths, [backend_name] * len(paths)))
+    wall_seconds = time.perf_counter() - started
+
+    audio_seconds = sum(duration for _, _, duration, _ in results)
+    stats = {
+        "files": len(results),
+        "failed": sum(1 for result in results if result[3] is not None),
+        "audio_seconds": audio_seconds,
+        "wall_seconds": wall_seconds,
+        "throughput": audio_seconds / wall_seconds if wall_seconds else 0.0
+    }
+    return results, stats
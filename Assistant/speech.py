@@ -0,0 +1,174 @@
+import heapq
+import os
+import itertools
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+
+
+class Pyttsx3Driver:
+    """Speak through pyttsx3; the engine is created lazily on the speech thread"""
+
+    def __init__(self, rate=None, voice=None):
+        self.rate = rate
+        self.voice = voice
+        self._engine = None
+
+    def _get_engine(self):
+        if self._engine is None:
+            import pyttsx3
+            self._engine = pyttsx3.init()
+            if self.rate is not None:
+                self._engine.setProperty("rate", self.rate)
+            if self.voice is not None:
+                self._engine.setProperty("voice", self.voice)
+        return self._engine
+
+    def speak(self, text, cancelled):
+        engine = self._get_engine()
+
+        # pyttsx3 is not thread safe, so stop from its own word callback
+        def on_word(name, location, length):
+            if cancelled.is_set():
+                engine.stop()
+
+        token = engine.connect("started-word", on_word)
+        try:
+            engine.say(text)
+            engine.runAndWait()
+        finally:
+            engine.disconnect(token)
+
+
+class NullDriver:
+    """Driver that produces no audio, for headless runs and tests
+
+    ``seconds_per_char`` simulates speaking time; cancellation is honoured
+    between characters the same way the real driver stops between words.
+    """
+
+    def __init__(self, seconds_per_char=0.0):
+        self.seconds_per_char = seconds_per_char
+        self.spoken = []
+
+    def speak(self, text, cancelled):
+        if self.seconds_per_char:
+            for _ in text:
+                if cancelled.wait(self.seconds_per_char):
+                    return
+        self.spoken.append(text)
+
+
+class SpeechService:
+    """Own one TTS engine on a dedicated thread and speak queued utterances in order
+
+    Pending utterances are ordered by priority and, within a priority, in the
+    order they were queued, so the sentences of a reply are spoken in order.
+    Only ``interrupt=True`` jumps ahead: it cuts off the current utterance and
+    drops everything pending.
+    """
+
+    def __init__(self, driver=None, max_pending=20):
+        self.driver = driver or Pyttsx3Driver()
+        self.max_pending = max_pending
+        self._pending = []  # heap of (-priority, sequence, text, future, queued_at)
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._current_cancel = None
+        self._stopped = False
+        self.stats = {"spoken": 0, "cancelled": 0, "wait_time_total": 0.0, "speak_time_total": 0.0}
+        self._thread = threading.Thread(target=self._run, name="speech-service", daemon=True)
+        self._thread.start()
+
+    def speak_async(self, text, priority=0, interrupt=False):
+        """Queue ``text`` and return a Future that resolves once it has been spoken
+
+        The result is True when the utterance finished and False when it was
+        interrupted part way through.
+        """
+        future = Future()
+        with self._condition:
+            if interrupt:
+                self._cancel_locked()
+            heapq.heappush(self._pending, (-priority, next(self._sequence), text, future, time.perf_counter()))
+            # Drop the lowest priority, oldest utterances when too much piles up
+            while len(self._pending) > self.max_pending:
+                dropped = max(self._pending, key=lambda item: (item[0], -item[1]))
+                self._pending.remove(dropped)
+                heapq.heapify(self._pending)
+                dropped[3].cancel()
+                self.stats["cancelled"] += 1
+            self._condition.notify()
+        return future
+
+    def speak(self, text, timeout=None):
+        """Speak ``text`` and wait; False if it was interrupted or dropped before it was spoken"""
+        try:
+            return self.speak_async(text).result(timeout)
+        except CancelledError:
+            return False
+
+    def cancel(self):
+        """Stop the current utterance and drop everything pending"""
+        with self._condition:
+            self._cancel_locked()
+
+    def _cancel_locked(self):
+        if self._current_cancel is not None:
+            self._current_cancel.set()
+        for item in self._pending:
+            item[3].cancel()
+            self.stats["cancelled"] += 1
+        self._pending = []
+
+    def pending(self):
+        with self._condition:
+            return len(self._pending)
+
+    def close(self):
+        with self._condition:
+            self._stopped = True
+            self._cancel_locked()
+            self._condition.notify()
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                _, _, text, future, queued_at = heapq.heappop(self._pending)
+                if not future.set_running_or_notify_cancel():
+                    continue
+                cancelled = threading.Event()
+                self._current_cancel = cancelled
+
+            started = time.perf_counter()
+            try:
+                self.driver.speak(text, cancelled)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(not cancelled.is_set())
+            finally:
+                with self._condition:
+                    self._current_cancel = None
+                    self.stats["spoken"] += 1
+                    self.stats["wait_time_total"] += started - queued_at
+                    self.stats["speak_time_total"] += time.perf_counter() - started
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_speech_service():
+    """Return the process-wide SpeechService (JEEVA_TTS_DRIVER=null disables audio)"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            driver = NullDriver() if os.getenv("JEEVA_TTS_DRIVER") == "null" else Pyttsx3Driver()
+            _service = SpeechService(driver)
+    return _service
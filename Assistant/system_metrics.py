@@ -0,0 +1,184 @@
+import threading
+import time
+
+import numpy as np
+import psutil
+
+# Columns of the scalar ring buffer
+FIELDS = [
+    "time",
+    "cpu_percent",
+    "cpu_freq",
+    "memory_percent",
+    "memory_total",
+    "memory_used",
+    "memory_available",
+    "net_bytes_sent",
+    "net_bytes_recv",
+    "net_packets_sent",
+    "net_packets_recv",
+    "disk_read_bytes",
+    "disk_write_bytes",
+    "disk_read_count",
+    "disk_write_count"
+]
+COLUMN = {name: i for i, name in enumerate(FIELDS)}
+
+# CPU usage of the first sample is measured over this window after the baseline
+FIRST_SAMPLE_DELAY = 0.1
+
+# Monotonic counters that are turned into per-second rates
+COUNTERS = [
+    "net_bytes_sent",
+    "net_bytes_recv",
+    "net_packets_sent",
+    "net_packets_recv",
+    "disk_read_bytes",
+    "disk_write_bytes",
+    "disk_read_count",
+    "disk_write_count"
+]
+
+
+class MetricsSampler:
+    """Sample CPU, memory, network and disk counters on a background thread into a ring buffer
+
+    The buffers are fixed-size NumPy arrays allocated up front, and readers
+    get a time-ordered copy of the last ``capacity`` samples.
+    """
+
+    def __init__(self, interval=1.0, capacity=300):
+        self.interval = interval
+        self.capacity = capacity
+        self.cores = psutil.cpu_count() or 1
+        self._data = np.full((capacity, len(FIELDS)), np.nan)
+        self._per_core = np.full((capacity, self.cores), np.nan)
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            # The first cpu_percent(interval=None) call only sets the baseline
+            psutil.cpu_percent(percpu=True)
+            psutil.cpu_percent()
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="metrics-sampler", daemon=True)
+            self._thread.start()
+        # Sample once right away so readers have data before the first interval passes
+        time.sleep(FIRST_SAMPLE_DELAY)
+        try:
+            self.sample()
+        except Exception:
+            pass
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                pass
+
+    def sample(self):
+        """Take one sample now and append it to the buffer"""
+        row = np.full(len(FIELDS), np.nan)
+        row[COLUMN["time"]] = time.time()
+        row[COLUMN["cpu_percent"]] = psutil.cpu_percent()
+        per_core = psutil.cpu_percent(percpu=True)
+        freq = psutil.cpu_freq()
+        if freq is not None:
+            row[COLUMN["cpu_freq"]] = freq.current
+        memory = psutil.virtual_memory()
+        row[COLUMN["memory_percent"]] = memory.percent
+        row[COLUMN["memory_total"]] = memory.total
+        row[COLUMN["memory_used"]] = memory.used
+        row[COLUMN["memory_available"]] = memory.available
+        net = psutil.net_io_counters()
+        if net is not None:
+            row[COLUMN["net_bytes_sent"]] = net.bytes_sent
+            row[COLUMN["net_bytes_recv"]] = net.bytes_recv
+            row[COLUMN["net_packets_sent"]] = net.packets_sent
+            row[COLUMN["net_packets_recv"]] = net.packets_recv
+        disk = psutil.disk_io_counters()
+        if disk is not None:
+            row[COLUMN["disk_read_bytes"]] = disk.read_bytes
+            row[COLUMN["disk_write_bytes"]] = disk.write_bytes
+            row[COLUMN["disk_read_count"]] = disk.read_count
+            row[COLUMN["disk_write_count"]] = disk.write_count
+
+        with self._lock:
+            self._data[self._next] = row
+            self._per_core[self._next, :len(per_core)] = per_core[:self.cores]
+            self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def __len__(self):
+        return self._count
+
+    def _ordered(self, array):
+        if self._count < self.capacity:
+            return array[:self._count].copy()
+        return np.concatenate((array[self._next:], array[:self._next]))
+
+    def history(self):
+        """Return (samples, per_core): time-ordered copies, oldest first"""
+        with self._lock:
+            return self._ordered(self._data), self._ordered(self._per_core)
+
+    def series(self, name):
+        samples, _ = self.history()
+        return samples[:, COLUMN[name]]
+
+    def latest(self):
+        """Return the newest sample as a dict plus per-core CPU, or None before the first sample"""
+        with self._lock:
+            if not self._count:
+                return None
+            last = (self._next - 1) % self.capacity
+            row = self._data[last].copy()
+            per_core = self._per_core[last].copy()
+        latest = {name: row[i] for i, name in enumerate(FIELDS)}
+        latest["per_core"] = per_core
+        return latest
+
+    def rates(self):
+        """Per-second rates of the counters between consecutive samples
+
+        Returns a dict of arrays aligned with ``times`` (one shorter than the
+        history). Counter resets (negative deltas) come out as NaN.
+        """
+        samples, _ = self.history()
+        if len(samples) < 2:
+            return {"times": np.empty(0), **{name: np.empty(0) for name in COUNTERS}}
+        elapsed = np.diff(samples[:, COLUMN["time"]])
+        columns = [COLUMN[name] for name in COUNTERS]
+        deltas = np.diff(samples[:, columns], axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            per_second = deltas / elapsed[:, None]
+        per_second[deltas < 0] = np.nan
+        rates = {name: per_second[:, i] for i, name in enumerate(COUNTERS)}
+        rates["times"] = samples[1:, COLUMN["time"]]
+        return rates
+
+
+_sampler = None
+_sampler_lock = threading.Lock()
+
+
+def get_sampler(interval=1.0, capacity=300):
+    """Return the process-wide sampler shared by all sessions, starting it on first use"""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = MetricsSampler(interval, capacity).start()
+    return _sampler
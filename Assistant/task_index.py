@@ -0,0 +1,175 @@
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+
+from .task_model import Task, encode_datetime
+
+
+class TaskIndex:
+    """In-memory index over the task list for the Task Manager filters
+
+    Tasks are bucketed into id sets per category, priority and status, and
+    kept in a due-date index of (due minute, id) pairs so the date strings are
+    parsed once when a task is added instead of on every rerun. A second
+    due-date index holds only active tasks, so overdue lookups never walk
+    completed ones. Tasks are held
+    as compact Task records and handed out as dicts. Results are always
+    ordered by (due date, id), which keeps the order stable.
+    """
+
+    def __init__(self, tasks=()):
+        self._tasks = {}  # id -> Task
+        self._by_category = {}
+        self._by_priority = {}
+        self._by_status = {"Active": set(), "Completed": set()}
+        self._due_index = []  # sorted (due minute, id)
+        self._active_due = []  # sorted (due minute, id) of active tasks only
+        self._lock = threading.RLock()
+        self.add_many(tasks)
+
+    @classmethod
+    def from_store(cls, store, batch_size=10000):
+        index = cls()
+        offset = 0
+        while True:
+            batch = store.query(limit=batch_size, offset=offset, order_by="id")
+            index.add_many(batch)
+            if len(batch) < batch_size:
+                return index
+            offset += batch_size
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def _insert(self, data):
+        task = Task.from_dict(data)
+        task_id = task.id
+        if task_id in self._tasks:
+            self.remove(task_id)
+        self._tasks[task_id] = task
+        self._by_category.setdefault(data["category"], set()).add(task_id)
+        self._by_priority.setdefault(data["priority"], set()).add(task_id)
+        self._by_status["Completed" if task.completed else "Active"].add(task_id)
+        return task.due, task_id
+
+    def add(self, task):
+        """Index a task dict that already carries its store ``id``"""
+        with self._lock:
+            entry = self._insert(task)
+            insort(self._due_index, entry)
+            if not self._tasks[entry[1]].completed:
+                insort(self._active_due, entry)
+
+    def add_many(self, tasks):
+        with self._lock:
+            entries = [self._insert(task) for task in tasks]
+            self._due_index.extend(entries)
+            self._due_index.sort()
+            self._active_due.extend(entry for entry in entries if not self._tasks[entry[1]].completed)
+            self._active_due.sort()
+
+    def remove(self, task_id):
+        with self._lock:
+            task = self._tasks.pop(task_id, None)
+            if task is None:
+                return False
+            self._by_category[task.category].discard(task_id)
+            self._by_priority[task.priority].discard(task_id)
+            self._by_status["Completed" if task.completed else "Active"].discard(task_id)
+            position = bisect_left(self._due_index, (task.due, task_id))
+            del self._due_index[position]
+            if not task.completed:
+                del self._active_due[bisect_left(self._active_due, (task.due, task_id))]
+            return True
+
+    def set_completed(self, task_id, completed=True):
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return False
+            if task.completed != completed:
+                self._by_status["Completed" if task.completed else "Active"].discard(task_id)
+                self._by_status["Completed" if completed else "Active"].add(task_id)
+                task.completed = completed
+                if completed:
+                    del self._active_due[bisect_left(self._active_due, (task.due, task_id))]
+                else:
+                    insort(self._active_due, (task.due, task_id))
+            return True
+
+    def get(self, task_id):
+        task = self._tasks.get(task_id)
+        return task.to_dict() if task is not None else None
+
+    def _matching_ids(self, category=None, priority=None, status=None):
+        """Return the matching id set, or None when no filter is active"""
+        candidates = []
+        if category and category != "All":
+            candidates.append(self._by_category.get(category, set()))
+        if priority and priority != "All":
+            candidates.append(self._by_priority.get(priority, set()))
+        if status and status != "All":
+            candidates.append(self._by_status[status])
+        if not candidates:
+            return None
+        candidates.sort(key=len)
+        return candidates[0].intersection(*candidates[1:])
+
+    def _ordered(self, ids, due_index, end):
+        """The first ``end`` ids of ``ids`` (all when None) in (due date, id) order"""
+        # Walking the due index visits about end * len(due_index) / len(ids) entries
+        # before it has enough, sorting touches every id; take the cheaper one
+        if end is not None and end * len(due_index) < len(ids) * len(ids):
+            ordered = []
+            for _, task_id in due_index:
+                if task_id in ids:
+                    ordered.append(task_id)
+                    if len(ordered) == end:
+                        break
+            return ordered
+        tasks = self._tasks
+        return sorted(ids, key=lambda task_id: (tasks[task_id].due, task_id))[:end]
+
+    def filter(self, category=None, priority=None, status=None, limit=None, offset=0):
+        """Return tasks matching the filters ("All" means no filter) ordered by due date"""
+        with self._lock:
+            ids = self._matching_ids(category, priority, status)
+            end = None if limit is None else offset + limit
+            if ids is None:
+                ordered = [task_id for _, task_id in self._due_index[offset:end]]
+            else:
+                # Active matches are all in the smaller active-only index
+                due_index = self._active_due if status == "Active" else self._due_index
+                ordered = self._ordered(ids, due_index, end)[offset:]
+            return [self._tasks[task_id].to_dict() for task_id in ordered]
+
+    def count(self, category=None, priority=None, status=None):
+        with self._lock:
+            ids = self._matching_ids(category, priority, status)
+            return len(self._tasks) if ids is None else len(ids)
+
+    def due_between(self, start, end, status="Active"):
+        """Return tasks due in [start, end) ordered by due date; start/end are datetimes"""
+        with self._lock:
+            lo = bisect_left(self._due_index, (encode_datetime(start), float("-inf")))
+            hi = bisect_left(self._due_index, (encode_datetime(end), float("-inf")))
+            wanted = self._by_status[status] if status and status != "All" else None
+            return [self._tasks[task_id].to_dict() for _, task_id in self._due_index[lo:hi]
+                    if wanted is None or task_id in wanted]
+
+    def _overdue_end(self, now):
+        return bisect_left(self._active_due, (encode_datetime(now or datetime.now()), float("-inf")))
+
+    def overdue(self, now=None):
+        """Return active tasks due before ``now`` ordered by due date"""
+        with self._lock:
+            return [self._tasks[task_id].to_dict() for _, task_id in self._active_due[:self._overdue_end(now)]]
+
+    def overdue_count(self, now=None):
+        """Number of active tasks due before ``now``, found with one bisect"""
+        with self._lock:
+            return self._overdue_end(now)
+
+    def due_within(self, hours, now=None):
+        now = now or datetime.now()
+        return self.due_between(now, now + timedelta(hours=hours))
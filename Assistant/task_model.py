@@ -0,0 +1,186 @@
+import re
+import sys
+from array import array
+from datetime import datetime, timedelta
+
+DATE_FORMAT = "%Y-%m-%d %H:%M"
+_DATE_SHAPE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}")
+EPOCH = datetime(1970, 1, 1)
+
+PRIORITIES = ["High", "Medium", "Low"]
+CATEGORIES = ["Work", "Personal", "Shopping", "Health", "Education", "Other"]
+
+
+class CodeTable:
+    """Map repeated strings such as priorities to small integer codes
+
+    Unknown values get the next free code so conversions stay lossless.
+    """
+
+    def __init__(self, values):
+        self.values = list(values)
+        self.codes = {value: code for code, value in enumerate(self.values)}
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            if code > 127:
+                raise ValueError(f"Too many distinct values, cannot encode {value!r}")
+            self.values.append(value)
+            self.codes[value] = code
+        return code
+
+    def decode(self, code):
+        return self.values[code]
+
+
+PRIORITY_CODES = CodeTable(PRIORITIES)
+CATEGORY_CODES = CodeTable(CATEGORIES)
+
+
+def encode_date(value):
+    """Convert a "%Y-%m-%d %H:%M" string to whole minutes since 1970 (no timezone involved)
+
+    Anything else, such as a time with seconds or an offset, raises
+    ValueError rather than being cut down to the minute.
+    """
+    if not _DATE_SHAPE.fullmatch(value):
+        raise ValueError(f"Task dates must be written as YYYY-MM-DD HH:MM, got {value!r}")
+    return (datetime.fromisoformat(value) - EPOCH) // timedelta(minutes=1)
+
+
+def decode_date(minutes):
+    return (EPOCH + timedelta(minutes=minutes)).strftime(DATE_FORMAT)
+
+
+def encode_datetime(value):
+    return (value.replace(tzinfo=None) - EPOCH) // timedelta(minutes=1)
+
+
+class Task:
+    """Compact task record: dates as minute counts, priority/category as codes"""
+
+    __slots__ = ("id", "task", "priority_code", "category_code", "due", "created", "completed")
+
+    def __init__(self, task, priority_code, category_code, due, created, completed=False, id=None):
+        self.id = id
+        self.task = task
+        self.priority_code = priority_code
+        self.category_code = category_code
+        self.due = due
+        self.created = created
+        self.completed = completed
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["task"],
+            PRIORITY_CODES.encode(data["priority"]),
+            CATEGORY_CODES.encode(data["category"]),
+            encode_date(data["due_date"]),
+            encode_date(data["date"]),
+            bool(data.get("completed", False)),
+            data.get("id")
+        )
+
+    def to_dict(self):
+        data = {
+            "task": self.task,
+            "priority": self.priority,
+            "category": self.category,
+            "due_date": decode_date(self.due),
+            "date": decode_date(self.created),
+            "completed": self.completed
+        }
+        if self.id is not None:
+            data = dict(id=self.id, **data)
+        return data
+
+    @property
+    def priority(self):
+        return PRIORITY_CODES.decode(self.priority_code)
+
+    @property
+    def category(self):
+        return CATEGORY_CODES.decode(self.category_code)
+
+    def __repr__(self):
+        return f"Task({self.to_dict()!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Task):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+
+class TaskTable:
+    """Column-oriented task list backed by typed arrays for bulk operations
+
+    Ids of -1 stand for tasks that have no store id.
+    """
+
+    def __init__(self, tasks=()):
+        self.ids = array("q")
+        self.texts = []
+        self.priorities = array("b")
+        self.categories = array("b")
+        self.due = array("q")
+        self.created = array("q")
+        self.completed = array("b")
+        self.extend(tasks)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def append(self, data):
+        self.ids.append(-1 if data.get("id") is None else data["id"])
+        self.texts.append(data["task"])
+        self.priorities.append(PRIORITY_CODES.encode(data["priority"]))
+        self.categories.append(CATEGORY_CODES.encode(data["category"]))
+        self.due.append(encode_date(data["due_date"]))
+        self.created.append(encode_date(data["date"]))
+        self.completed.append(1 if data.get("completed", False) else 0)
+
+    def extend(self, tasks):
+        for data in tasks:
+            self.append(data)
+
+    def row(self, i):
+        return Task(self.texts[i], self.priorities[i], self.categories[i], self.due[i], self.created[i],
+                    bool(self.completed[i]), None if self.ids[i] == -1 else self.ids[i])
+
+    def to_dicts(self):
+        return [self.row(i).to_dict() for i in range(len(self))]
+
+    def set_completed(self, i, completed=True):
+        self.completed[i] = 1 if completed else 0
+
+    def select(self, category=None, priority=None, status=None):
+        """Return row numbers matching the Task Manager filters ("All" means no filter)"""
+        rows = range(len(self))
+        if category and category != "All":
+            code = CATEGORY_CODES.codes.get(category)
+            column = self.categories
+            rows = [i for i in rows if column[i] == code]
+        if priority and priority != "All":
+            code = PRIORITY_CODES.codes.get(priority)
+            column = self.priorities
+            rows = [i for i in rows if column[i] == code]
+        if status and status != "All":
+            wanted = 1 if status == "Completed" else 0
+            column = self.completed
+            rows = [i for i in rows if column[i] == wanted]
+        return list(rows)
+
+    def due_before(self, when):
+        limit = encode_datetime(when)
+        due, completed = self.due, self.completed
+        return [i for i in range(len(self)) if due[i] < limit and not completed[i]]
+
+    def nbytes(self):
+        """Approximate memory held by the table, including the task strings"""
+        columns = (self.ids, self.priorities, self.categories, self.due, self.created, self.completed)
+        total = sum(column.itemsize * len(column) for column in columns)
+        total += sys.getsizeof(self.texts) + sum(sys.getsizeof(text) for text in self.texts)
+        return total
@@ -0,0 +1,167 @@
+import os
+import pickle
+import sqlite3
+import threading
+
+TASK_FIELDS = ["task", "priority", "category", "due_date", "date", "completed"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    category TEXT NOT NULL,
+    due_date TEXT NOT NULL,
+    date TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_category ON tasks (category, due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority, due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed, due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+INSERT_TASK = "INSERT INTO tasks (task, priority, category, due_date, date, completed) VALUES (?, ?, ?, ?, ?, ?)"
+SELECT_TASKS = "SELECT id, task, priority, category, due_date, date, completed FROM tasks"
+
+# Status filter values used by the Task Manager page
+STATUS_COMPLETED = {"Active": 0, "Completed": 1}
+
+
+def _task_params(task):
+    return [task["task"], task["priority"], task["category"], task["due_date"], task["date"],
+            int(bool(task.get("completed", False)))]
+
+
+def _row_to_task(row):
+    task = dict(zip(["id"] + TASK_FIELDS, row))
+    task["completed"] = bool(task["completed"])
+    return task
+
+
+class TaskStore:
+    """SQLite backed task storage with one row per task
+
+    Dates are kept in the "%Y-%m-%d %H:%M" strings the Task Manager already
+    uses, which sort correctly as text. Each thread gets its own connection and
+    the database runs in WAL mode so several sessions can read while one writes.
+    """
+
+    def __init__(self, path="tasks.db"):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def add(self, task):
+        """Insert one task dict and return its id"""
+        with self._connect() as conn:
+            cursor = conn.execute(INSERT_TASK, _task_params(task))
+        return cursor.lastrowid
+
+    def add_many(self, tasks):
+        with self._connect() as conn:
+            conn.executemany(INSERT_TASK, (_task_params(task) for task in tasks))
+
+    def update(self, task_id, **fields):
+        unknown = set(fields) - set(TASK_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown task fields: {', '.join(sorted(unknown))}")
+        if not fields:
+            return False
+        if "completed" in fields:
+            fields["completed"] = int(bool(fields["completed"]))
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as conn:
+            cursor = conn.execute(f"UPDATE tasks SET {assignments} WHERE id = ?", list(fields.values()) + [task_id])
+        return cursor.rowcount == 1
+
+    def set_completed(self, task_id, completed=True):
+        return self.update(task_id, completed=completed)
+
+    def delete(self, task_id):
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM tasks WHERE id = ?", [task_id])
+        return cursor.rowcount == 1
+
+    def get(self, task_id):
+        row = self._connect().execute(f"{SELECT_TASKS} WHERE id = ?", [task_id]).fetchone()
+        return _row_to_task(row) if row else None
+
+    def _where(self, category=None, priority=None, status=None):
+        clauses, params = [], []
+        if category and category != "All":
+            clauses.append("category = ?")
+            params.append(category)
+        if priority and priority != "All":
+            clauses.append("priority = ?")
+            params.append(priority)
+        if status and status != "All":
+            clauses.append("completed = ?")
+            params.append(STATUS_COMPLETED[status])
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, category=None, priority=None, status=None, limit=50, offset=0, order_by="due_date"):
+        """Return one page of tasks matching the Task Manager filters ("All" means no filter)"""
+        if order_by not in ("due_date", "date", "id"):
+            raise ValueError(f"Cannot order tasks by {order_by}")
+        where, params = self._where(category, priority, status)
+        rows = self._connect().execute(
+            f"{SELECT_TASKS}{where} ORDER BY {order_by}, id LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        ).fetchall()
+        return [_row_to_task(row) for row in rows]
+
+    def count(self, category=None, priority=None, status=None):
+        where, params = self._where(category, priority, status)
+        return self._connect().execute(f"SELECT COUNT(*) FROM tasks{where}", params).fetchone()[0]
+
+    def migrate_from_pickle(self, pickle_path="tasks.pkl"):
+        """Import the old pickled task list once and return the number of tasks imported"""
+        if not os.path.exists(pickle_path):
+            return 0
+        conn = self._connect()
+        if conn.execute("SELECT value FROM meta WHERE key = 'pickle_migrated'").fetchone():
+            return 0
+        with open(pickle_path, "rb") as f:
+            tasks = pickle.load(f)
+        with conn:
+            conn.executemany(INSERT_TASK, (_task_params(task) for task in tasks))
+            conn.execute("INSERT INTO meta (key, value) VALUES ('pickle_migrated', ?)", [pickle_path])
+        conn.execute("ANALYZE")
+        os.replace(pickle_path, pickle_path + ".migrated")
+        return len(tasks)
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.execute("PRAGMA optimize")
+            conn.close()
+            self._local.conn = None
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store(path="tasks.db"):
+    """Return the process-wide TaskStore, migrating tasks.pkl on first use"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TaskStore(path)
+            _store.migrate_from_pickle()
+    return _store
@@ -0,0 +1,74 @@
+import streamlit as st
+
+from ..features import load_feature
+from .common import feature_header
+
+
+# How often the launch table polls the launcher registry
+STATUS_REFRESH_SECONDS = 2
+# Matches offered for the current search
+APP_RESULTS = 50
+
+
+def render():
+    feature_header("🚀", "App Launcher",
+                   "Launch your favorite applications quickly. Access frequently used programs with a single click.")
+
+    with st.spinner("Loading App Launcher..."):
+        launcher()
+    # The launch table polls the registry only while a launch is still starting
+    polling = load_feature("App Launcher").get_launcher().pending()
+    st.fragment(launched_apps, run_every=STATUS_REFRESH_SECONDS if polling else None)(polling)
+
+
+def open_selected_app(app):
+    # Returns as soon as the launch is queued; the table below follows its progress
+    load_feature("App Launcher").get_launcher().launch(app.command, name=app.name)
+
+
+def app_label(app):
+    return f"{app.name}  ({app.command[0]})"
+
+
+@st.fragment
+def launcher():
+    catalog = load_feature("App Launcher").get_app_catalog()
+    with st.container():
+        if not catalog.ready:
+            st.info("💡 Looking for installed applications...")
+        else:
+            st.info(f"💡 **{catalog.count():,} applications found.** Type the start of a name or a word in it.")
+
+        query = st.text_input("Search applications:", key="launcher_query", placeholder="e.g. calc, text editor")
+        apps = catalog.search(query, limit=APP_RESULTS)
+        if query and not apps and catalog.ready:
+            st.warning(f"No application matches '{query}'.")
+        selected_app = st.selectbox("Select an application to open:", apps, format_func=app_label)
+        if st.button("Open Application", disabled=selected_app is None):
+            open_selected_app(selected_app)
+            # Rerun the whole page so the launch table starts polling
+            st.rerun()
+
+
+# Only reads the launcher's registry, so polling it never waits on a process
+def launched_apps(polling):
+    app_launcher = load_feature("App Launcher").get_launcher()
+    if polling and not app_launcher.pending():
+        # Every launch has settled; rerun the page to stop polling
+        st.rerun()
+    records = app_launcher.records()
+    if not records:
+        return
+
+    st.write("### Launched Apps")
+    st.dataframe(records, width="stretch", hide_index=True)
+    latest = records[0]
+    if latest["status"] in ("failed", "timeout"):
+        st.error(f"Failed to open {latest['app']}: {latest['error'] or 'exit code ' + str(latest['exit_code'])}")
+        st.info("""
+        Troubleshooting steps:
+        1. Make sure the application is installed on your system
+        2. Check if you have permission to open the application
+        3. Try running the application manually first
+        """)
+    st.button("Clear finished", key="launcher_clear", on_click=app_launcher.clear_finished)
@@ -0,0 +1,65 @@
+import streamlit as st
+
+from ..features import load_feature
+from .common import feature_header
+
+
+def render():
+    feature_header("💬", "AI Chat",
+                   "Ask JeevaAI anything. Answers appear as they are written, and repeated questions are answered "
+                   "instantly.")
+
+    with st.spinner("Loading AI Chat..."):
+        chat()
+
+
+def clear_chat():
+    st.session_state.chat_conversation.clear()
+    st.session_state.chat_transcript = []
+
+
+def stats_caption(stats):
+    if stats.cached:
+        return f"Answered from cache in {stats.seconds * 1000:.0f} ms"
+    first_token = f"first token in {stats.ttft * 1000:.0f} ms · " if stats.ttft is not None else ""
+    return f"{first_token}{stats.tokens} tokens at {stats.tokens_per_second:.0f} tokens/s"
+
+
+@st.fragment
+def chat():
+    exports = load_feature("AI Chat")
+    client = exports.get_chat_client()
+    # The conversation is what the model sees and gets trimmed; the transcript is everything shown
+    if "chat_conversation" not in st.session_state:
+        st.session_state.chat_conversation = exports.Conversation()
+        st.session_state.chat_transcript = []
+    conversation = st.session_state.chat_conversation
+    transcript = st.session_state.chat_transcript
+
+    with st.container():
+        for role, content, caption in transcript:
+            with st.chat_message(role):
+                st.markdown(content)
+                if caption:
+                    st.caption(caption)
+
+        prompt = st.chat_input("Ask me anything")
+        if prompt:
+            transcript.append(("user", prompt, None))
+            with st.chat_message("user"):
+                st.markdown(prompt)
+            with st.chat_message("assistant"):
+                try:
+                    reply = st.write_stream(client.stream(conversation, prompt))
+                except Exception as e:
+                    st.error(f"Chat service is unavailable. Error: {str(e)}")
+                else:
+                    caption = stats_caption(conversation.last_stats)
+                    st.caption(caption)
+                    transcript.append(("assistant", reply, caption))
+
+        if transcript:
+            if conversation.trimmed:
+                st.caption(f"{conversation.trimmed} earlier messages are no longer sent to keep within "
+                           f"{client.context_tokens} tokens.")
+            st.button("Clear conversation", key="chat_clear", on_click=clear_chat)
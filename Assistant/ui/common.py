@@ -0,0 +1,34 @@
+import os
+
+import streamlit as st
+
+STYLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.css")
+
+# Task categories
+CATEGORIES = ["Work", "Personal", "Shopping", "Health", "Education", "Other"]
+
+
+@st.cache_resource
+def load_css():
+    """Read the stylesheet once per process and wrap it for st.markdown"""
+    with open(STYLE_PATH, encoding="utf-8") as f:
+        return f"<style>\n{f.read()}</style>"
+
+
+@st.cache_resource
+def header_html(icon, title, description):
+    return f"""
+    <div style='background-color: #2d2d2d; padding: 20px; border-radius: 10px; margin: 20px 0;'>
+        <h2 style='color: #ffffff; margin-bottom: 15px;'>{icon} {title}</h2>
+        <p style='color: #ffffff;'>{description}</p>
+    </div>
+    """
+
+
+def feature_header(icon, title, description):
+    st.markdown(header_html(icon, title, description), unsafe_allow_html=True)
+
+
+@st.cache_data
+def task_categories():
+    return list(CATEGORIES)
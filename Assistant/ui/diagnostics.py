@@ -0,0 +1,58 @@
+import streamlit as st
+
+from ..features import load_feature
+from .common import feature_header
+
+# How often the call table is rebuilt from the metric buffers
+METRICS_REFRESH_SECONDS = 5
+
+
+def render():
+    feature_header("🩺", "Diagnostics",
+                   "See how long each assistant call takes, how often it fails and what is running right now.")
+
+    call_metrics()
+    feature_load_times()
+
+
+def set_enabled(enabled):
+    metrics = load_feature("Diagnostics").metrics
+    if enabled:
+        metrics.enable()
+    else:
+        metrics.disable()
+
+
+@st.fragment(run_every=METRICS_REFRESH_SECONDS)
+def call_metrics():
+    metrics = load_feature("Diagnostics").metrics
+    url = metrics.metrics_url()
+    if url:
+        st.info(f"💡 Prometheus metrics are served at **{url}**")
+    else:
+        st.info("💡 The metrics endpoint is not running in this process; set JEEVA_METRICS_PORT to a free port.")
+
+    enabled = metrics.REGISTRY.enabled
+    st.toggle("Record call metrics", value=enabled, on_change=set_enabled, args=(not enabled,))
+    rows = metrics.REGISTRY.summary()
+    if not rows:
+        st.write("No calls recorded yet. Use a feature and come back here.")
+        return
+
+    st.write("### Calls")
+    st.dataframe(rows, width="stretch", hide_index=True)
+    busy = [row["call"] for row in rows if row["in_flight"]]
+    if busy:
+        st.caption(f"Running now: {', '.join(busy)}")
+    with st.expander("Raw Prometheus output"):
+        st.code(metrics.REGISTRY.prometheus(), language="text")
+    st.button("Reset metrics", key="diagnostics_reset", on_click=metrics.REGISTRY.reset)
+
+
+def feature_load_times():
+    load_times = load_feature("Diagnostics").load_times()
+    if load_times:
+        st.write("### Feature Load Times")
+        st.dataframe([{"feature": feature, "first_load_ms": round(seconds * 1000, 1)}
+                      for feature, seconds in sorted(load_times.items())],
+                     width="stretch", hide_index=True)
@@ -0,0 +1,54 @@
+import streamlit as st
+
+from ..features import load_feature
+from .common import feature_header
+
+
+# How often the delivery list polls the outbox
+STATUS_REFRESH_SECONDS = 2
+
+
+def render():
+    feature_header("📧", "Email Sender",
+                   "Send emails quickly and efficiently. Compose and send messages to any email address with just "
+                   "a few clicks.")
+
+    if 'email_outbox' not in st.session_state:
+        st.session_state.email_outbox = []
+    with st.spinner("Loading Email Sender..."):
+        compose()
+    # The delivery list polls only while an email is still on its way
+    polling = any(not handle.done() for _, _, handle in st.session_state.email_outbox)
+    st.fragment(outbox_status, run_every=STATUS_REFRESH_SECONDS if polling else None)(polling)
+
+
+@st.fragment
+def compose():
+    queue_email = load_feature("Email Sender").queue_email
+    with st.container():
+        to = st.text_input("To")
+        subject = st.text_input("Subject")
+        body = st.text_area("Message")
+        if st.button("Send Email"):
+            # Delivery happens on the outbox thread, the page only keeps the handle
+            handle = queue_email(to, subject, body)
+            st.session_state.email_outbox.append((to, subject, handle))
+            # Rerun the whole page so the delivery list starts polling
+            st.rerun()
+
+
+# Only reads the handles, so polling never waits on the SMTP server
+def outbox_status(polling):
+    outbox = st.session_state.email_outbox
+    if polling and all(handle.done() for _, _, handle in outbox):
+        # Every email has settled; rerun the page to stop polling
+        st.rerun()
+
+    # Delivery status of recently queued emails
+    for to_address, email_subject, handle in reversed(outbox[-5:]):
+        if not handle.done():
+            st.write(f"⏳ Sending \"{email_subject}\" to {to_address}...")
+        elif handle.exception() is not None:
+            st.error(f"Failed to send \"{email_subject}\" to {to_address}: {handle.exception()}")
+        else:
+            st.success(f"Email \"{email_subject}\" sent to {to_address}")
@@ -0,0 +1,289 @@
+import os
+import platform
+import subprocess
+from concurrent.futures import TimeoutError
+from datetime import datetime
+
+import streamlit as st
+
+from ..features import load_feature
+from .common import feature_header
+
+SEARCH_RESULTS = 50
+BROWSE_PAGE_SIZE = 100
+BROWSE_TOP_N = 20
+PREVIEW_LINES = 50
+PREVIEW_HEX_BYTES = 512
+# How often search results are refreshed while the index is scanning (seconds)
+INDEX_REFRESH_SECONDS = 2
+
+
+def render():
+    feature_header("📂", "File Explorer",
+                   "Browse and manage your files with ease. Open files and folders directly from the application.")
+
+    if "browse_path" not in st.session_state:
+        browse(os.path.expanduser("~"))
+    with st.spinner("Loading File Explorer..."):
+        # Search results refresh themselves only while the index is scanning
+        polling = load_feature("File Explorer").get_file_index().scanning
+        st.fragment(file_search, run_every=INDEX_REFRESH_SECONDS if polling else None)(polling)
+        folder_browser()
+        file_preview()
+        open_path()
+
+
+# Searching only reruns the search box and its results
+def file_search(polling):
+    file_index = load_feature("File Explorer").get_file_index()
+    if polling and not file_index.scanning:
+        # The scan has finished; rerun the page to stop polling
+        st.rerun()
+    # Searches cover the folder being browsed, once it has been indexed
+    path = st.session_state.browse_path
+    st.write("### Search Files")
+    if not file_index.covers(path):
+        st.info(f"💡 `{path}` is not indexed yet. Indexing reads every folder below it in the background.")
+        if st.button("Index this folder", key="file_index_add"):
+            file_index.add_root(path)
+            # Rerun the whole page so the results follow the scan
+            st.rerun()
+    query = st.text_input(f"Search by name in {path}:", key="file_search_query",
+                          placeholder="e.g. report 2024 (words of 3+ letters, any order, typos allowed)")
+    if query and file_index.covers(path):
+        results = file_index.search(query, limit=SEARCH_RESULTS, under=path)
+        if results:
+            st.dataframe([{
+                "name": result.name,
+                "folder": os.path.dirname(result.path),
+                "size_kb": None if result.is_dir else round(result.size / 1024, 1),
+                "type": "folder" if result.is_dir else "file"
+            } for result in results], width="stretch", hide_index=True)
+        else:
+            st.info("No matching files indexed yet; results update as the scan goes." if file_index.scanning
+                    else "No matching files in the index.")
+    dirs, entries = file_index.count()
+    if file_index.roots:
+        status = "indexing..." if file_index.scanning else "up to date"
+        st.caption(f"{entries:,} entries in {dirs:,} folders indexed under {', '.join(file_index.roots)} ({status})")
+
+
+def browse(path):
+    """Point the folder browser at ``path``, starting from its first page"""
+    cursor_type = load_feature("File Explorer").Cursor
+    st.session_state.browse_path = path
+    st.session_state.browse_starts = [cursor_type(path, None, 0)]
+    st.session_state.browse_index = 0
+    st.session_state.browse_page = None
+
+
+def turn_page(step):
+    st.session_state.browse_index += step
+    st.session_state.browse_page = None
+
+
+def open_selected_folder():
+    browse(os.path.join(st.session_state.browse_path, st.session_state.browse_folder))
+
+
+def entry_rows(entries):
+    return [{
+        "name": f"📁 {entry.name}" if entry.is_dir else entry.name,
+        "size_kb": None if entry.is_dir else round(entry.size / 1024, 1),
+        "modified": datetime.fromtimestamp(entry.mtime).strftime("%Y-%m-%d %H:%M")
+    } for entry in entries]
+
+
+# Paging and navigating folders only reruns the browser
+@st.fragment
+def folder_browser():
+    browser = load_feature("File Explorer").get_browser()
+    path = st.session_state.browse_path
+
+    st.write("### Browse Folder")
+    col1, col2, col3 = st.columns([6, 1, 1])
+    with col1:
+        st.write(f"📁 `{path}`")
+    with col2:
+        st.button("⬆ Up", key="browse_up", disabled=os.path.dirname(path) == path,
+                  on_click=browse, args=(os.path.dirname(path),))
+    with col3:
+        st.button("🔄 Refresh", key="browse_refresh", on_click=browse, args=(path,))
+
+    view = st.radio("Show", ["Folder order", "Largest", "Newest"], horizontal=True, key="browse_view")
+    try:
+        if view == "Folder order":
+            folder_page(browser)
+        else:
+            top_entries(browser, path, "size" if view == "Largest" else "mtime")
+    except OSError as e:
+        st.error(f"Cannot read {path}: {e.strerror or e}")
+
+
+def folder_page(browser):
+    # The page is kept in session state so reruns do not touch the disk
+    starts = st.session_state.browse_starts
+    index = st.session_state.browse_index
+    if st.session_state.browse_page is None:
+        entries, next_cursor = browser.page(starts[index], BROWSE_PAGE_SIZE)
+        if next_cursor is not None:
+            del starts[index + 1:]
+            starts.append(next_cursor)
+        st.session_state.browse_page = (entries, next_cursor is not None)
+    entries, has_next = st.session_state.browse_page
+
+    if entries:
+        st.dataframe(entry_rows(entries), width="stretch", hide_index=True)
+    else:
+        st.info("This folder is empty.")
+
+    col1, col2, col3 = st.columns([1, 1, 4])
+    with col1:
+        st.button("◀ Previous", key="browse_previous", disabled=index == 0, on_click=turn_page, args=(-1,))
+    with col2:
+        st.button("Next ▶", key="browse_next", disabled=not has_next, on_click=turn_page, args=(1,))
+    with col3:
+        st.caption(f"Page {index + 1}, {BROWSE_PAGE_SIZE} entries per page")
+
+    folders = [entry for entry in entries if entry.is_dir]
+    if folders:
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.selectbox("Folder on this page", [entry.name for entry in folders], key="browse_folder")
+        with col2:
+            st.button("Open folder", key="browse_open", on_click=open_selected_folder)
+
+    files = [entry for entry in entries if not entry.is_dir]
+    if files:
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            name = st.selectbox("File on this page", [entry.name for entry in files], key="browse_file")
+        with col2:
+            if st.button("Preview", key="browse_preview"):
+                # The preview is outside this fragment, so rerun the whole page
+                st.session_state.preview_path = os.path.join(st.session_state.browse_path, name)
+                st.rerun()
+
+
+def top_entries(browser, path, by):
+    # The scan streams through a bounded heap on a worker thread
+    result = browser.top(path, by, BROWSE_TOP_N)
+    try:
+        entries = result.result(timeout=0.5)
+    except TimeoutError:
+        st.info("Scanning folder... press Refresh to check again.")
+        return
+    st.dataframe(entry_rows(entries), width="stretch", hide_index=True)
+
+
+def open_with_default_app(path):
+    if platform.system() == "Windows":
+        os.startfile(path)
+    else:
+        subprocess.call(["open", path])
+
+
+# Moving through a file only reruns the preview
+@st.fragment
+def file_preview():
+    path = st.session_state.get("preview_path")
+    if not path:
+        return
+    st.write("### Preview")
+    try:
+        preview = load_feature("File Explorer").get_preview(path)
+    except OSError as e:
+        st.error(f"Cannot open {path}: {e.strerror or e}")
+        return
+    try:
+        preview_window(path, preview)
+    except OSError as e:
+        st.error(f"Cannot read {path}: {e.strerror or e}")
+    finally:
+        # Other sessions may share the preview; it is closed once none of them holds it
+        preview.release()
+
+    if st.button("Open with default app", key="preview_open_external"):
+        try:
+            open_with_default_app(path)
+            st.success(f"Opened file: {path}")
+        except Exception as e:
+            st.error(f"Error: {str(e)}")
+
+
+def preview_window(path, preview):
+    kind = "binary" if preview.binary else "text"
+    st.caption(f"`{path}` · {preview.size / 1024:,.1f} KB · {kind}")
+
+    if preview.binary:
+        offset = st.number_input("Offset (bytes)", min_value=0, max_value=max(0, preview.size - 1), value=0,
+                                 step=PREVIEW_HEX_BYTES, key="preview_hex_offset")
+        st.code(preview.hex(int(offset), PREVIEW_HEX_BYTES), language=None)
+    else:
+        # Only the visible window is read from the memory-mapped file
+        mode = st.radio("Show", ["Head", "Tail", "Go to line", "Go to offset"], horizontal=True, key="preview_mode")
+        if mode == "Head":
+            lines = preview.head(PREVIEW_LINES)
+        elif mode == "Tail":
+            lines = preview.tail(PREVIEW_LINES)
+        elif mode == "Go to line":
+            line = st.number_input("Line", min_value=1, value=1, step=PREVIEW_LINES, key="preview_line")
+            lines = preview.lines(int(line) - 1, PREVIEW_LINES)
+        else:
+            offset = st.number_input("Byte offset", min_value=0, max_value=preview.size, value=0,
+                                     step=PREVIEW_LINES * 100, key="preview_offset")
+            lines = preview.at_offset(int(offset), PREVIEW_LINES)
+        st.code("\n".join(lines) if lines else "(no lines here)", language=None)
+
+
+@st.fragment
+def open_path():
+    with st.container():
+        st.info("""
+        💡 **Path Format Tips:**
+        - Use double backslashes: `C:\\Users\\parag\\OneDrive\\Documents\\shivani bio.pdf`
+        - Or use forward slashes: `C:/Users/parag/OneDrive/Documents/shivani bio.pdf`
+        - Make sure the file exists at the specified path
+        """)
+
+        path = st.text_input("Enter a file or folder path:")
+        if st.button("Open", key="open_file_explorer"):
+            if path:
+                try:
+                    # Convert forward slashes to backslashes for Windows
+                    if platform.system() == "Windows":
+                        path = path.replace('/', '\\')
+
+                    # Normalize the path
+                    normalized_path = os.path.normpath(path)
+
+                    # Check if path exists
+                    if not os.path.exists(normalized_path):
+                        st.error(f"Path not found: {normalized_path}")
+                        st.info("""
+                        Common issues:
+                        1. Check if the file/folder exists
+                        2. Verify the path is correct
+                        3. Try copying the path from File Explorer
+                        4. Make sure you have permission to access the file/folder
+                        """)
+                    else:
+                        if os.path.isfile(normalized_path):
+                            # Files are shown in the preview above; it can still hand them to the default app
+                            st.session_state.preview_path = os.path.abspath(normalized_path)
+                            st.rerun()
+                        elif os.path.isdir(normalized_path):
+                            # Folders are listed in the browser above, which also works on a headless server
+                            browse(os.path.abspath(normalized_path))
+                            st.rerun()
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+                    st.info("""
+                    Troubleshooting steps:
+                    1. Try using the full path
+                    2. Check if the file is not in use by another program
+                    3. Make sure you have the necessary permissions
+                    4. Try restarting the application
+                    """)
+            else:
+                st.warning("Please enter a valid path")
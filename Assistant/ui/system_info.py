@@ -0,0 +1,154 @@
+import math
+import os
+import platform
+
+import streamlit as st
+
+from ..features import load_feature
+from .common import feature_header
+
+# System Info samples metrics in the background at this rate (seconds)
+METRICS_SAMPLE_INTERVAL = float(os.getenv("JEEVA_METRICS_INTERVAL", "1.0"))
+PROCESS_TABLE_SIZE = 15
+
+
+def render():
+    feature_header("💻", "System Information",
+                   "Monitor your system's performance and resources. Get detailed information about CPU, memory, "
+                   "disk usage, and more.")
+
+    with st.spinner("Loading System Information..."):
+        system = load_feature("System Info")
+        with st.container():
+            overview(system)
+            disks(system)
+            network(system)
+            top_processes(system)
+            battery(system)
+
+
+def overview(system):
+    # System Overview
+    st.write("### System Overview")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write("**Operating System:**")
+        st.write(f"- System: {platform.system()} {platform.release()}")
+        st.write(f"- Version: {platform.version()}")
+        st.write(f"- Machine: {platform.machine()}")
+        st.write(f"- Processor: {platform.processor()}")
+        st.write(f"- Python Version: {platform.python_version()}")
+        st.write(f"- Architecture: {platform.architecture()[0]}")
+
+    # Everything below is read from the shared background sampler
+    latest = system.get_sampler(METRICS_SAMPLE_INTERVAL).latest()
+
+    with col2:
+        st.write("**System Resources:**")
+        if latest is None:
+            st.info("Collecting the first sample...")
+        else:
+            # CPU Information
+            st.write("**CPU:**")
+            st.write(f"- Usage: {latest['cpu_percent']:.1f}%")
+            st.write(f"- Cores: {system.psutil.cpu_count()} (Physical: {system.psutil.cpu_count(logical=False)})")
+            if not math.isnan(latest['cpu_freq']):
+                st.write(f"- Frequency: {latest['cpu_freq']:.2f} MHz")
+
+            # Memory Information
+            st.write("**Memory:**")
+            st.write(f"- Total: {latest['memory_total'] / (1024**3):.2f} GB")
+            st.write(f"- Available: {latest['memory_available'] / (1024**3):.2f} GB")
+            st.write(f"- Used: {latest['memory_used'] / (1024**3):.2f} GB")
+            st.write(f"- Usage: {latest['memory_percent']:.1f}%")
+
+    # Rolling history from the ring buffer
+    if latest is not None:
+        st.write("### Resource History")
+        samples, per_core = system.get_sampler(METRICS_SAMPLE_INTERVAL).history()
+        st.line_chart({
+            "CPU %": samples[:, system.METRIC_COLUMN["cpu_percent"]],
+            "Memory %": samples[:, system.METRIC_COLUMN["memory_percent"]]
+        })
+        st.write("**CPU usage per core (%):**")
+        st.bar_chart({"Usage %": latest["per_core"]})
+
+
+def disks(system):
+    # Disk Information
+    st.write("### Disk Information")
+    try:
+        # Mounts are queried concurrently and rendered as they answer
+        for disk in system.get_scanner().scan():
+            if disk.status == "ok":
+                usage = disk.usage
+                st.write(f"**Drive {disk.device}** ({disk.mountpoint}):")
+                st.write(f"- Total: {usage.total / (1024**3):.2f} GB")
+                st.write(f"- Used: {usage.used / (1024**3):.2f} GB")
+                st.write(f"- Free: {usage.free / (1024**3):.2f} GB")
+                st.write(f"- Usage: {usage.percent}%")
+                st.write(f"- File System: {disk.fstype}")
+            elif disk.status == "timeout":
+                st.write(f"**Drive {disk.device}** ({disk.mountpoint}): ⏳ not responding")
+    except Exception as e:
+        st.error(f"Error getting disk information: {str(e)}")
+
+    metrics_sampler = system.get_sampler(METRICS_SAMPLE_INTERVAL)
+    latest = metrics_sampler.latest()
+    rates = metrics_sampler.rates()
+    if latest is not None and not math.isnan(latest['disk_read_count']) and len(rates["times"]):
+        st.write("**Disk I/O (operations/s):**")
+        st.line_chart({
+            "Reads": rates["disk_read_count"],
+            "Writes": rates["disk_write_count"]
+        })
+
+
+def network(system):
+    # Network Information
+    st.write("### Network Information")
+    metrics_sampler = system.get_sampler(METRICS_SAMPLE_INTERVAL)
+    latest = metrics_sampler.latest()
+    if latest is not None and not math.isnan(latest['net_bytes_sent']):
+        rates = metrics_sampler.rates()
+        st.write("**Network Usage:**")
+        st.write(f"- Bytes Sent: {latest['net_bytes_sent'] / (1024**2):.2f} MB")
+        st.write(f"- Bytes Received: {latest['net_bytes_recv'] / (1024**2):.2f} MB")
+        st.write(f"- Packets Sent: {int(latest['net_packets_sent'])}")
+        st.write(f"- Packets Received: {int(latest['net_packets_recv'])}")
+        if len(rates["times"]):
+            st.write("**Network throughput (KB/s):**")
+            st.line_chart({
+                "Sent": rates["net_bytes_sent"] / 1024,
+                "Received": rates["net_bytes_recv"] / 1024
+            })
+    else:
+        st.info("Network counters are not available yet.")
+
+
+# Changing the sort order only redraws the process table
+@st.fragment
+def top_processes(system):
+    # Process Information, sampled incrementally in the background
+    st.write("### Top Processes")
+    process_sampler = system.get_process_sampler()
+    sort_by = st.radio("Sort by", ["CPU", "Memory", "IO"], horizontal=True, key="process_sort")
+    processes = process_sampler.top(PROCESS_TABLE_SIZE, by=sort_by.lower())
+    if processes:
+        st.dataframe(processes, width="stretch", hide_index=True)
+    else:
+        st.info("Collecting process information...")
+
+
+def battery(system):
+    # Battery Information (if available)
+    try:
+        battery = system.psutil.sensors_battery()
+        if battery:
+            st.write("### Battery Information")
+            st.write(f"- Percentage: {battery.percent}%")
+            st.write(f"- Power Plugged: {'Yes' if battery.power_plugged else 'No'}")
+            if battery.secsleft != -1:
+                st.write(f"- Time Left: {battery.secsleft // 3600} hours {(battery.secsleft % 3600) // 60} minutes")
+    except:
+        pass
@@ -0,0 +1,108 @@
+from datetime import datetime
+
+import streamlit as st
+
+from ..features import load_feature
+from .common import feature_header, task_categories
+
+TASKS_PER_PAGE = 50
+
+
+# Task index is built from the store once per process and updated in place
+@st.cache_resource
+def load_task_index():
+    tasks = load_feature("Task Manager")
+    return tasks.TaskIndex.from_store(tasks.get_store())
+
+
+def render():
+    feature_header("📝", "Task Manager",
+                   "Organize and manage your daily tasks efficiently. Add, complete, and track your tasks with ease.")
+
+    with st.spinner("Loading Task Manager..."):
+        task_board()
+
+
+# Filtering, adding and ticking off tasks only reruns this part of the page
+@st.fragment
+def task_board():
+    # Tasks live in a shared SQLite store (tasks.pkl is migrated on first use)
+    try:
+        task_store = load_feature("Task Manager").get_store()
+        task_index = load_task_index()
+    except Exception:
+        task_store = None
+        task_index = None
+        st.warning("Could not open the task database. Tasks will not be saved.")
+
+    categories = task_categories()
+
+    # Task filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        filter_category = st.selectbox("Filter by Category", ["All"] + categories)
+    with col2:
+        filter_priority = st.selectbox("Filter by Priority", ["All", "High", "Medium", "Low"])
+    with col3:
+        filter_status = st.selectbox("Filter by Status", ["All", "Active", "Completed"])
+
+    # Add new task form
+    with st.expander("➕ Add New Task", expanded=True):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            new_task = st.text_input("Task Description:")
+        with col2:
+            priority = st.selectbox("Priority", ["High", "Medium", "Low"], key="priority")
+        with col3:
+            category = st.selectbox("Category", categories, key="category")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            due_date = st.date_input("Due Date", min_value=datetime.now().date())
+        with col2:
+            due_time = st.time_input("Due Time", value=datetime.now().time())
+
+        if st.button("Add Task"):
+            if new_task:
+                task = {
+                    "task": new_task,
+                    "priority": priority,
+                    "category": category,
+                    "due_date": datetime.combine(due_date, due_time).strftime("%Y-%m-%d %H:%M"),
+                    "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                    "completed": False
+                }
+                if task_store is not None:
+                    # Single-row insert instead of re-pickling every task
+                    task_id = task_store.add(task)
+                    task_index.add(dict(task, id=task_id))
+                    st.success("Task added successfully!")
+                else:
+                    st.error("Task database is unavailable.")
+
+    # Task list, served from the in-memory index
+    if task_index is not None:
+        overdue = task_index.overdue_count()
+        if overdue:
+            st.warning(f"⏰ {overdue} overdue task(s)")
+
+        matching = task_index.count(filter_category, filter_priority, filter_status)
+        st.write(f"### Tasks ({matching})")
+        page_count = max(1, -(-matching // TASKS_PER_PAGE))
+        page = 1
+        if page_count > 1:
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1)
+
+        for task in task_index.filter(filter_category, filter_priority, filter_status,
+                                      limit=TASKS_PER_PAGE, offset=(page - 1) * TASKS_PER_PAGE):
+            col1, col2 = st.columns([1, 9])
+            with col1:
+                done = st.checkbox("Done", value=task["completed"], key=f"task_done_{task['id']}",
+                                   label_visibility="collapsed")
+            with col2:
+                st.write(f"**{task['task']}** — {task['category']} · {task['priority']} priority · due {task['due_date']}")
+            if done != task["completed"]:
+                task_store.set_completed(task["id"], done)
+                task_index.set_completed(task["id"], done)
+                # Redraw the counts and the filtered list with the new status
+                st.rerun()
@@ -0,0 +1,111 @@
+import re
+
+import streamlit as st
+
+from ..features import load_feature
+from .common import feature_header
+
+
+def render():
+    feature_header("🌦️", "Weather Updates",
+                   "Get real-time weather information for any location. Check temperature, conditions, and "
+                   "forecasts to plan your day better.")
+
+    mode = st.radio("Mode", ["Single city", "Dashboard"], horizontal=True, key="weather_mode")
+    with st.spinner("Loading Weather..."):
+        if mode == "Single city":
+            weather_lookup()
+        else:
+            weather_dashboard()
+
+
+def split_cities(text):
+    """Cities from a comma or newline separated list, without blanks or repeats"""
+    cities = []
+    for city in re.split(r"[,\n]", text):
+        city = " ".join(city.split())
+        if city and city.casefold() not in (seen.casefold() for seen in cities):
+            cities.append(city)
+    return cities
+
+
+def hourly_chart(hourly):
+    st.write("**Hourly Forecast:**")
+    st.line_chart({
+        "Temperature (°C)": hourly["temperature"],
+        "Chance of Rain (%)": hourly["chance_of_rain"]
+    })
+    st.caption(f"{hourly['time'][0]} to {hourly['time'][-1]}, every 3 hours")
+
+
+@st.fragment
+def weather_lookup():
+    get_weather = load_feature("Weather").get_weather
+    with st.container():
+        city = st.text_input("Enter city name:")
+        if st.button("Get Weather"):
+            if city:
+                with st.spinner("Fetching weather data..."):
+                    weather_data = get_weather(city)
+                if isinstance(weather_data, dict):
+                    st.write(f"### Weather in {city}")
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.write(f"**Temperature:** {weather_data['temperature']}°C")
+                        st.write(f"**Feels Like:** {weather_data['feels_like']}°C")
+                        st.write(f"**Condition:** {weather_data['condition']}")
+                        st.write(f"**Humidity:** {weather_data['humidity']}%")
+                        st.write(f"**Cloud Cover:** {weather_data['cloud_cover']}%")
+                    with col2:
+                        st.write(f"**Wind Speed:** {weather_data['wind_speed']} km/h")
+                        st.write(f"**Pressure:** {weather_data['pressure']} hPa")
+                        st.write(f"**Visibility:** {weather_data['visibility']} km")
+                        st.write(f"**Precipitation:** {weather_data['precipitation']} mm")
+                    if weather_data["hourly"]["time"]:
+                        hourly_chart(weather_data["hourly"])
+                else:
+                    st.error(weather_data)
+            else:
+                st.warning("Please enter a city name")
+
+
+# Results are kept in session state so picking a city for the chart does not fetch again
+@st.fragment
+def weather_dashboard():
+    client = load_feature("Weather").weather.get_client()
+    with st.container():
+        text = st.text_area("Cities (comma or newline separated):", key="weather_cities",
+                            placeholder="London, Paris, Tokyo")
+        if st.button("Get Weather for All"):
+            cities = split_cities(text)
+            if cities:
+                with st.spinner(f"Fetching weather for {len(cities)} cities..."):
+                    st.session_state.weather_dashboard = client.get_many(cities)
+            else:
+                st.warning("Please enter at least one city name")
+
+        results = st.session_state.get("weather_dashboard")
+        if not results:
+            return
+        rows = []
+        failed = []
+        for city, weather_data in results.items():
+            if isinstance(weather_data, dict):
+                rows.append({
+                    "City": city,
+                    "Temperature (°C)": weather_data["temperature"],
+                    "Feels Like (°C)": weather_data["feels_like"],
+                    "Condition": weather_data["condition"],
+                    "Humidity (%)": weather_data["humidity"],
+                    "Wind (km/h)": weather_data["wind_speed"],
+                    "Precipitation (mm)": weather_data["precipitation"]
+                })
+            else:
+                failed.append(city)
+        if rows:
+            st.dataframe(rows, width="stretch", hide_index=True)
+            city = st.selectbox("Hourly forecast for:", [row["City"] for row in rows], key="weather_chart_city")
+            if results[city]["hourly"]["time"]:
+                hourly_chart(results[city]["hourly"])
+        if failed:
+            st.error(f"Could not fetch weather data for {', '.join(failed)}")
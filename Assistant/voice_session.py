@@ -0,0 +1,254 @@
+import itertools
+import queue
+import re
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import CancelledError
+
+from .metrics import Histogram
+
+# Latency histograms kept per stage:
+#   capture    length of each captured phrase
+#   recognize  end of capture -> text
+#   respond    text -> first sentence of the reply ready to speak
+#   speak      time spent speaking each sentence
+#   response   end of capture -> first sentence starts playing, as the user hears it
+STAGES = ("capture", "recognize", "respond", "speak", "response")
+
+# heard is the recognized text; spoken the sentences actually played
+Turn = namedtuple("Turn", ["id", "heard", "spoken", "interrupted"])
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n+")
+_END = object()
+
+
+def iter_sentences(chunks):
+    """Yield complete sentences from a reply given as a string or as streamed text chunks"""
+    if isinstance(chunks, str):
+        chunks = [chunks]
+    buffer = ""
+    try:
+        for chunk in chunks:
+            buffer += chunk
+            parts = _SENTENCE_END.split(buffer)
+            # The last part may still be growing
+            for sentence in parts[:-1]:
+                if sentence.strip():
+                    yield sentence.strip()
+            buffer = parts[-1]
+        if buffer.strip():
+            yield buffer.strip()
+    finally:
+        # Closing the sentences early also ends a streamed reply, such as an open chat request
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+def assistant_responder(chat=True):
+    """Answer commands through the intent router and everything else through the chat model
+
+    Chat replies are returned as a stream, so their first sentence can be
+    spoken while the rest is still being generated.
+    """
+    from .assistant import handle_command
+    conversation = None
+
+    def respond(text):
+        nonlocal conversation
+        reply = handle_command(text)
+        if reply is not None:
+            return reply
+        if not chat:
+            return "Sorry, I can't help with that yet."
+        from .chat import Conversation, get_chat_client
+        if conversation is None:
+            conversation = Conversation()
+        return get_chat_client().stream(conversation, text)
+
+    return respond
+
+
+class VoiceSession:
+    """Hands-free loop: listen, answer and speak as overlapping pipeline stages
+
+    A VoiceListener captures and recognizes phrases on its own threads. A
+    respond thread turns each phrase into a reply and splits it into
+    sentences, and a speak thread plays them through the SpeechService, all
+    joined by bounded queues. The first sentence is spoken while the rest of
+    the reply is still being produced, and the next phrase is captured while
+    the current one is answered. A new phrase arriving while a reply is
+    still playing, or a call to ``barge_in``, cancels that reply.
+    """
+
+    def __init__(self, listener, respond=None, speech=None, max_pending=4, max_sentences=8, max_turns=50):
+        if speech is None:
+            from .speech import get_speech_service
+            speech = get_speech_service()
+        self.listener = listener
+        self.respond = respond or assistant_responder()
+        self.speech = speech
+        self.histograms = {stage: Histogram() for stage in STAGES}
+        self.turns = deque(maxlen=max_turns)
+        self.stats = {"turns": 0, "barge_ins": 0, "errors": 0, "dropped": 0}
+        self._requests = queue.Queue(maxsize=max_pending)
+        self._sentences = queue.Queue(maxsize=max_sentences)
+        self._ids = itertools.count(1)
+        self._latest_id = 0
+        self._cancelled_up_to = 0  # replies of turns with this id or lower are dropped
+        self._busy_turn = None  # turn whose reply has not finished playing
+        self._lock = threading.Lock()
+        self._running = threading.Event()
+        self._threads = []
+
+    def start(self):
+        if self._running.is_set():
+            return self
+        self._running.set()
+        self.listener.start()
+        self._threads = [
+            threading.Thread(target=self._listen, name="voice-session-listen", daemon=True),
+            threading.Thread(target=self._answer, name="voice-session-respond", daemon=True),
+            threading.Thread(target=self._speak, name="voice-session-speak", daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, wait=True):
+        self._running.clear()
+        self.listener.stop(wait=False)
+        self.barge_in()
+        if wait:
+            self.join()
+
+    def join(self, timeout=None):
+        """Wait until the listener has run out of input and every reply has been spoken"""
+        for thread in self._threads:
+            thread.join(timeout)
+
+    @property
+    def running(self):
+        return self._running.is_set()
+
+    def barge_in(self):
+        """Cancel the reply in progress: stop speaking and drop whatever is left of it"""
+        with self._lock:
+            self._cancelled_up_to = self._latest_id
+            interrupted = self._busy_turn is not None
+            if interrupted:
+                self.stats["barge_ins"] += 1
+        self.speech.cancel()
+        return interrupted
+
+    def _cancelled(self, turn_id):
+        return turn_id <= self._cancelled_up_to
+
+    # Stages
+    def _listen(self):
+        try:
+            for phrase in self.listener.phrases():
+                audio = phrase.audio
+                if audio is not None and audio.frame_data:
+                    self.histograms["capture"].observe(
+                        len(audio.frame_data) / (audio.sample_rate * audio.sample_width))
+                self.histograms["recognize"].observe(phrase.recognized_at - phrase.captured_at)
+                # The user talking over a reply is the signal to stop it
+                self.barge_in()
+                with self._lock:
+                    self._latest_id = turn_id = next(self._ids)
+                self._put_dropping_oldest(self._requests, (turn_id, phrase))
+        finally:
+            self._requests.put(_END)
+
+    def _answer(self):
+        while True:
+            item = self._requests.get()
+            if item is _END:
+                break
+            turn_id, phrase = item
+            if not self._cancelled(turn_id):
+                self._answer_turn(turn_id, phrase)
+            # Marks the end of this turn's reply; the speak stage skips cancelled sentences quickly
+            self._sentences.put((turn_id, phrase, None))
+        self._sentences.put(_END)
+
+    def _answer_turn(self, turn_id, phrase):
+        with self._lock:
+            self._busy_turn = turn_id
+        started = time.perf_counter()
+        sentences = None
+        try:
+            sentences = iter_sentences(self.respond(phrase.text))
+            for i, sentence in enumerate(sentences):
+                if i == 0:
+                    self.histograms["respond"].observe(time.perf_counter() - started)
+                if not self._put_unless_cancelled(turn_id, (turn_id, phrase, sentence)):
+                    break
+        except Exception:
+            with self._lock:
+                self.stats["errors"] += 1
+            self._put_unless_cancelled(turn_id, (turn_id, phrase, "Sorry, something went wrong."))
+        finally:
+            # Stops a streamed reply that is no longer wanted
+            if sentences is not None:
+                sentences.close()
+
+    def _speak(self):
+        spoken = {}  # turn id -> sentences played so far
+        while True:
+            item = self._sentences.get()
+            if item is _END:
+                break
+            turn_id, phrase, sentence = item
+            if sentence is None:
+                self._end_turn(turn_id, phrase, spoken.pop(turn_id, []))
+                continue
+            if self._cancelled(turn_id):
+                continue
+            sentences = spoken.setdefault(turn_id, [])
+            if not sentences:
+                self.histograms["response"].observe(time.perf_counter() - phrase.captured_at)
+            started = time.perf_counter()
+            try:
+                finished = self.speech.speak_async(sentence).result()
+            except CancelledError:
+                finished = False
+            self.histograms["speak"].observe(time.perf_counter() - started)
+            if finished:
+                sentences.append(sentence)
+
+    def _end_turn(self, turn_id, phrase, sentences):
+        with self._lock:
+            if self._busy_turn == turn_id:
+                self._busy_turn = None
+            self.stats["turns"] += 1
+            self.turns.append(Turn(turn_id, phrase.text, sentences, self._cancelled(turn_id)))
+
+    # Queues
+    def _put_dropping_oldest(self, q, item):
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                    self.stats["dropped"] += 1
+                except queue.Empty:
+                    pass
+
+    def _put_unless_cancelled(self, turn_id, item):
+        """Block while the speak stage is behind, giving up once the turn is cancelled"""
+        while not self._cancelled(turn_id):
+            try:
+                self._sentences.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def latency(self):
+        """Snapshot of every stage histogram, in seconds"""
+        return {stage: histogram.snapshot() for stage, histogram in self.histograms.items()}
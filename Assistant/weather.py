@@ -0,0 +1,312 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS forecasts (
+    city TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+
+class WeatherError(Exception):
+    """Raised when the weather service returns an unusable response"""
+
+
+def normalize_city(city):
+    return " ".join(city.split()).casefold()
+
+
+def parse_current_conditions(data):
+    """Pick the fields shown on the Weather page out of a wttr.in j1 payload"""
+    current_condition = data["current_condition"][0]
+    return {
+        "temperature": current_condition["temp_C"],
+        "condition": current_condition["weatherDesc"][0]["value"],
+        "humidity": current_condition["humidity"],
+        "wind_speed": current_condition["windspeedKmph"],
+        "pressure": current_condition["pressure"],
+        "visibility": current_condition["visibility"],
+        "feels_like": current_condition["FeelsLikeC"],
+        "precipitation": current_condition["precipMM"],
+        "cloud_cover": current_condition["cloudcover"]
+    }
+
+
+def parse_hourly_forecast(data):
+    """Flatten the j1 multi-day forecast into columns, one value per forecast hour
+
+    Columns rather than one dict per hour keep the cached payload small and
+    can be handed straight to a chart.
+    """
+    hourly = {"time": [], "temperature": [], "feels_like": [], "condition": [], "chance_of_rain": [],
+              "precipitation": [], "wind_speed": []}
+    for day in data.get("weather", []):
+        for hour in day.get("hourly", []):
+            hourly["time"].append(f"{day['date']} {int(hour['time']) // 100:02d}:00")
+            hourly["temperature"].append(int(hour["tempC"]))
+            hourly["feels_like"].append(int(hour["FeelsLikeC"]))
+            hourly["condition"].append(hour["weatherDesc"][0]["value"].strip())
+            hourly["chance_of_rain"].append(int(hour["chanceofrain"]))
+            hourly["precipitation"].append(float(hour["precipMM"]))
+            hourly["wind_speed"].append(int(hour["windspeedKmph"]))
+    return hourly
+
+
+def parse_weather(data):
+    """Everything the Weather page keeps from a j1 payload: current conditions plus the hourly forecast"""
+    weather = parse_current_conditions(data)
+    weather["hourly"] = parse_hourly_forecast(data)
+    return weather
+
+
+class WeatherClient:
+    """wttr.in client with connection pooling, timeouts and a TTL + LRU cache
+
+    Concurrent lookups for the same city share one in-flight request. When a
+    cached entry has expired but is still within ``stale_ttl``, callers wait at
+    most ``stale_wait`` seconds for the refresh before getting the stale value.
+    Parsed results are also written to an SQLite file at ``cache_path`` (None
+    keeps them in memory only), so restarts and other processes start warm.
+    Up to ``pool_size`` cities are fetched at once.
+    """
+
+    def __init__(self, base_url="https://wttr.in", connect_timeout=3.05, read_timeout=10,
+                 ttl=600, max_entries=128, serve_stale=True, stale_ttl=3600, stale_wait=1.0,
+                 pool_size=50, session=None, cache_path=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.serve_stale = serve_stale
+        self.stale_ttl = stale_ttl
+        self.stale_wait = stale_wait
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="weather-fetch")
+        self._cache = OrderedDict()  # key -> (fetched_at, data)
+        self._inflight = {}  # key -> Future
+        self._lock = threading.Lock()
+        self.cache_path = cache_path
+        self._local = threading.local()
+        if cache_path is not None:
+            with self._connect() as conn:
+                conn.executescript(CACHE_SCHEMA)
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stale_hits": 0,
+            "coalesced": 0,
+            "errors": 0,
+            "fetches": 0,
+            "fetch_time_total": 0.0,
+            "fetch_time_max": 0.0,
+            "disk_hits": 0
+        }
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.cache_path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, city):
+        """Return conditions and hourly forecast for ``city``, raising WeatherError or requests errors on failure"""
+        fresh, stale, future = self._lookup(city)
+        if future is None:
+            return fresh
+        if stale is None:
+            return future.result()
+        try:
+            return future.result(timeout=self.stale_wait)
+        except Exception:
+            # Slow or failing upstream: keep the refresh running and answer from cache
+            with self._lock:
+                self._stats["stale_hits"] += 1
+            return stale
+
+    def get_many(self, cities, timeout=15):
+        """Look up several cities at once and return ``{city: data or the exception raised}``
+
+        Cache misses are all fetched concurrently, so the batch takes about
+        as long as the slowest city. Cities still unanswered after
+        ``timeout`` seconds map to a TimeoutError, or to their stale value if
+        one is cached.
+        """
+        deadline = time.monotonic() + timeout
+        results = {}
+        pending = []
+        for city in cities:
+            try:
+                fresh, stale, future = self._lookup(city)
+            except WeatherError as e:
+                results[city] = e
+                continue
+            if future is None:
+                results[city] = fresh
+            else:
+                pending.append((city, stale, future))
+
+        for city, stale, future in pending:
+            wait = max(0.0, deadline - time.monotonic())
+            try:
+                results[city] = future.result(timeout=wait if stale is None else min(wait, self.stale_wait))
+            except Exception as e:
+                if stale is None:
+                    results[city] = e
+                    continue
+                with self._lock:
+                    self._stats["stale_hits"] += 1
+                results[city] = stale
+        return {city: results[city] for city in cities}
+
+    def _lookup(self, city):
+        """Return ``(fresh data, None, None)`` on a cache hit, else ``(None, stale data or None, Future)``"""
+        key = normalize_city(city)
+        if not key:
+            raise WeatherError("City name is empty")
+        if self.cache_path is not None and key not in self._cache:
+            self._load_cached(key)
+
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._cache.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[1], None, None
+            if entry is not None and (not self.serve_stale or now - entry[0] >= self.stale_ttl):
+                entry = None
+            future = self._inflight.get(key)
+            if future is None:
+                self._stats["misses"] += 1
+                future = Future()
+                self._inflight[key] = future
+                self._executor.submit(self._fetch, key, city, future)
+            else:
+                self._stats["coalesced"] += 1
+        return None, None if entry is None else entry[1], future
+
+    # On-disk cache
+    def _load_cached(self, key):
+        """Copy ``key`` from the cache file into memory if it is recent enough to be served"""
+        max_age = self.stale_ttl if self.serve_stale else self.ttl
+        try:
+            row = self._connect().execute("SELECT fetched_at, data FROM forecasts WHERE city = ?",
+                                          (key,)).fetchone()
+        except sqlite3.Error:
+            return
+        if row is None or time.time() - row[0] >= max_age:
+            return
+        data = json.loads(row[1])
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = (row[0], data)
+                self._stats["disk_hits"] += 1
+
+    def _store_cached(self, key, fetched_at, data):
+        # Also drops rows too old to be served, so the file stays small
+        max_age = self.stale_ttl if self.serve_stale else self.ttl
+        try:
+            with self._connect() as conn:
+                conn.execute("INSERT OR REPLACE INTO forecasts (city, fetched_at, data) VALUES (?, ?, ?)",
+                             (key, fetched_at, json.dumps(data, separators=(",", ":"))))
+                conn.execute("DELETE FROM forecasts WHERE fetched_at < ?", (fetched_at - max_age,))
+        except sqlite3.Error:
+            pass
+
+    def _fetch(self, key, city, future):
+        started = time.perf_counter()
+        try:
+            response = self.session.get(f"{self.base_url}/{quote(city.strip())}",
+                                        params={"format": "j1"}, timeout=self.timeout)
+            if response.status_code != 200:
+                raise WeatherError(f"Could not fetch weather data for {city}")
+            data = parse_weather(response.json())
+        except BaseException as e:
+            with self._lock:
+                self._stats["errors"] += 1
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            return
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._stats["fetches"] += 1
+                self._stats["fetch_time_total"] += elapsed
+                self._stats["fetch_time_max"] = max(self._stats["fetch_time_max"], elapsed)
+
+        fetched_at = time.time()
+        if self.cache_path is not None:
+            self._store_cached(key, fetched_at, data)
+        with self._lock:
+            self._cache[key] = (fetched_at, data)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+            self._inflight.pop(key, None)
+        future.set_result(data)
+
+    def invalidate(self, city=None):
+        with self._lock:
+            if city is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(normalize_city(city), None)
+        if self.cache_path is not None:
+            with self._connect() as conn:
+                if city is None:
+                    conn.execute("DELETE FROM forecasts")
+                else:
+                    conn.execute("DELETE FROM forecasts WHERE city = ?", (normalize_city(city),))
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cached"] = len(self._cache)
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["fetch_time_avg"] = stats["fetch_time_total"] / stats["fetches"] if stats["fetches"] else 0.0
+        return stats
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the process-wide WeatherClient
+
+    Forecasts are cached in JEEVA_WEATHER_CACHE (default weather_cache.db);
+    JEEVA_WEATHER_URL points the client at another wttr.in compatible server.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = WeatherClient(os.getenv("JEEVA_WEATHER_URL", "https://wttr.in"),
+                                    cache_path=os.getenv("JEEVA_WEATHER_CACHE", "weather_cache.db"))
+    return _client
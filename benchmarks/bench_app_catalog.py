@@ -0,0 +1,101 @@
+"""AppCatalog build, search and launch overhead on a synthetic system
+
+Creates ``--dirs`` PATH folders holding ``--executables`` programs in
+total plus ``--desktop`` .desktop launchers, then times the first catalog
+build, a rescan when nothing changed, a rescan after one folder changed,
+prefix searches and name resolution next to ``shutil.which``. Finally it
+compares starting ``true`` through a shell, through a PATH search and from
+the catalog's absolute path, with the synthetic folders in front of PATH.
+
+Usage: python benchmarks/bench_app_catalog.py [--executables N] [--desktop N] [--dirs N] [--root PATH]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.app_catalog import AppCatalog
+
+WORDS = ["text", "editor", "image", "viewer", "music", "player", "web", "browser", "mail", "client", "terminal",
+         "calculator", "office", "writer", "video", "notes", "paint", "files", "system", "monitor"]
+
+
+def generate(root, executables, desktop, dirs):
+    marker = os.path.join(root, f".generated-{executables}-{desktop}-{dirs}")
+    bin_dirs = [os.path.join(root, f"bin{i}") for i in range(dirs)]
+    applications = os.path.join(root, "share", "applications")
+    if os.path.exists(marker):
+        return bin_dirs, applications
+    shutil.rmtree(root, ignore_errors=True)
+    for directory in bin_dirs + [applications]:
+        os.makedirs(directory)
+    for i in range(executables):
+        path = os.path.join(bin_dirs[i % dirs], f"{WORDS[i % len(WORDS)]}-{WORDS[i // 7 % len(WORDS)]}{i}")
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\n")
+        os.chmod(path, 0o755)
+    for i in range(desktop):
+        name = f"{WORDS[i % len(WORDS)].title()} {WORDS[i // 3 % len(WORDS)].title()} {i}"
+        with open(os.path.join(applications, f"app{i}.desktop"), "w") as f:
+            f.write(f"[Desktop Entry]\nType=Application\nName={name}\nExec=true --app {i} %U\n")
+    open(marker, "w").close()
+    return bin_dirs, applications
+
+
+def timed(label, func, repeat=1):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    print(f"{label:<40} {statistics.median(timings) * 1000:>10.3f}ms")
+    return result
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--executables", type=int, default=5000)
+    parser.add_argument("--desktop", type=int, default=1000)
+    parser.add_argument("--dirs", type=int, default=20)
+    parser.add_argument("--root", default=os.path.join(tempfile.gettempdir(), "jeeva-app-catalog"))
+    args = parser.parse_args(argv)
+    bin_dirs, applications = generate(args.root, args.executables, args.desktop, args.dirs)
+    os.environ["PATH"] = os.pathsep.join(bin_dirs + [os.environ.get("PATH", os.defpath)])
+    os.environ["XDG_DATA_HOME"] = os.path.dirname(applications)
+
+    catalog = AppCatalog()
+    stats = timed("first build", catalog.update)
+    print(f"{'':<40} {stats['apps']:,} apps in {stats['directories']} folders")
+    timed("rescan, nothing changed", catalog.update, repeat=20)
+    installed = iter(range(1_000_000))
+
+    def install_and_rescan():
+        # A new program in the first PATH folder changes that folder's mtime
+        path = os.path.join(bin_dirs[0], f"new-tool-{time.time_ns()}-{next(installed)}")
+        with open(path, "w"):
+            pass
+        os.chmod(path, 0o755)
+        return catalog.update()
+
+    timed("rescan after one folder changed", install_and_rescan, repeat=5)
+    for prefix in ["", "te", "web", "calculator-m", "player 1", "zz"]:
+        timed(f"search {prefix!r} (top 20)", lambda: catalog.search(prefix), repeat=200)
+    timed("resolve 'true' (catalog)", lambda: catalog.resolve("true"), repeat=200)
+    timed("resolve 'true' (shutil.which)", lambda: shutil.which("true"), repeat=200)
+
+    true = catalog.resolve("true").command
+    launches = [("launch via shell", lambda: subprocess.Popen("true", shell=True).wait()),
+                ("launch via PATH search", lambda: subprocess.Popen(["true"]).wait()),
+                ("launch from catalog path", lambda: subprocess.Popen(true).wait())]
+    for label, launch in launches:
+        timed(label, launch, repeat=50)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
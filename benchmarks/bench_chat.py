@@ -0,0 +1,142 @@
+"""Streaming chat latency, reply cache and context trimming against a local stub
+
+A minimal OpenAI-compatible server streams chat completions as server-sent
+events, waiting ``--first-token-ms`` before the first token and
+``--token-ms`` between tokens. The benchmark reports time to first token
+and tokens/s for new questions, the same numbers for repeated ones served
+from the on-disk cache, and the cost of keeping a ``--turns`` long
+conversation inside the token budget incrementally versus recounting the
+whole history every turn. The stub records the largest prompt it was sent
+to show the budget holds.
+
+Usage: python benchmarks/bench_chat.py [--questions N] [--first-token-ms MS] [--token-ms MS] [--turns N]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.chat import ChatClient, Conversation, ResponseCache, TokenCounter
+
+REPLY_WORDS = ("Sure, here is a short answer about that topic with a few extra words so the reply has a "
+               "realistic length for a voice assistant that keeps things brief").split()
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 64
+
+    def __init__(self, first_token_ms, token_ms, reply_tokens=40):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.first_token = first_token_ms / 1000
+        self.token_delay = token_ms / 1000
+        self.reply_tokens = reply_tokens
+        self.requests = 0
+        self.largest_prompt = 0  # characters in the biggest messages list received
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests += 1
+        self.server.largest_prompt = max(self.server.largest_prompt,
+                                         sum(len(message["content"]) for message in request["messages"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        time.sleep(self.server.first_token)
+        for i in range(self.server.reply_tokens):
+            if i:
+                time.sleep(self.server.token_delay)
+            word = REPLY_WORDS[i % len(REPLY_WORDS)]
+            self.event({"role": "assistant", "content": word if i == 0 else " " + word}, None, request["model"])
+        self.event({}, "stop", request["model"])
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def event(self, delta, finish_reason, model):
+        chunk = {"id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": int(time.time()),
+                 "model": model, "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+        self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+
+    def log_message(self, *args):
+        pass
+
+
+def report(label, stats):
+    ttft = [s.ttft * 1000 for s in stats]
+    rate = "-" if stats[0].cached else f"{statistics.median(s.tokens_per_second for s in stats):,.0f}"
+    print(f"{label:<34} {statistics.median(ttft):>9.1f}ms {max(ttft):>9.1f}ms {rate:>11}")
+
+
+def trimming(turns, budget, counter):
+    """Time keeping a long conversation within budget, incrementally and by recounting"""
+    question = "Can you tell me something more about the history and culture of the city we talked about?"
+    answer = " ".join(REPLY_WORDS) * 3
+
+    conversation = Conversation(counter=counter)
+    started = time.perf_counter()
+    for _ in range(turns):
+        conversation.add("user", question)
+        conversation.trim(budget)
+        conversation.add("assistant", answer)
+    incremental = time.perf_counter() - started
+
+    history = []
+    started = time.perf_counter()
+    for _ in range(turns):
+        history.append(question)
+        while sum(counter.count(text) for text in history) > budget and len(history) > 1:
+            history.pop(0)
+        history.append(answer)
+    recount = time.perf_counter() - started
+    print(f"{f'keep {turns} turns within {budget} tokens':<34} incremental {incremental * 1000:.1f}ms, "
+          f"recounting every turn {recount * 1000:.1f}ms ({conversation.trimmed} messages trimmed)")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--questions", type=int, default=10)
+    parser.add_argument("--first-token-ms", type=float, default=300)
+    parser.add_argument("--token-ms", type=float, default=20)
+    parser.add_argument("--turns", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    server = StubServer(args.first_token_ms, args.token_ms)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    cache = ResponseCache(os.path.join(tempfile.mkdtemp(prefix="jeeva-chat-"), "chat_cache.db"))
+    client = ChatClient(base_url=f"http://127.0.0.1:{server.server_port}/v1", api_key="stub", cache=cache,
+                        context_tokens=1000, max_tokens=200)
+    questions = [f"Question number {i}: what is the weather usually like in spring?" for i in range(args.questions)]
+
+    print(f"{'':<34} {'ttft med':>11} {'ttft max':>11} {'tokens/s':>11}")
+    for label in ["new questions (streamed)", "same questions (cached)"]:
+        stats = []
+        for question in questions:
+            # A fresh conversation per question, so the same question gives the same context
+            conversation = Conversation()
+            for _ in client.stream(conversation, question):
+                pass
+            stats.append(conversation.last_stats)
+        report(label, stats)
+    print(f"{'requests reaching the server':<34} {server.requests}")
+
+    conversation = Conversation()
+    for i in range(40):
+        client.ask(conversation, f"Follow-up {i}: and what about the summer, and the autumn after that?")
+    print(f"{'40-turn chat, budget 800 tokens':<34} largest prompt {server.largest_prompt} chars, "
+          f"{conversation.trimmed} messages trimmed, {conversation.tokens} tokens kept")
+    counter = TokenCounter()
+    print(f"token counting: {'tiktoken' if counter.exact else 'estimate (tiktoken not installed)'}")
+    trimming(args.turns, 2000, counter)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,81 @@
+"""DirectoryBrowser paging and largest-N cost on one huge directory
+
+Creates ``--entries`` files (default 500,000) in a single folder and
+compares reading it the old way (list, stat and sort everything) with the
+browser: first page latency, next page latency, paging back to a page
+already read, resuming a cursor deep into the listing that has no open
+iterator, and largest-N through a bounded heap. Peak Python
+memory is traced for each.
+
+Usage: python benchmarks/bench_directory_browser.py [--entries N] [--dir PATH]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.directory_browser import DirectoryBrowser, iter_entries
+
+
+def generate(path, entries):
+    marker = os.path.join(path, f".generated-{entries}")
+    if os.path.exists(marker):
+        return
+    os.makedirs(path, exist_ok=True)
+    for i in range(entries):
+        with open(os.path.join(path, f"file_{i:07d}.dat"), "wb") as f:
+            f.write(b"x" * (i % 4096))
+    open(marker, "w").close()
+
+
+def measure(label, func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<34} {seconds * 1000:>10.1f}ms {peak / 1024**2:>9.1f}MB")
+    return result
+
+
+def list_everything(path):
+    entries = list(iter_entries(path))
+    entries.sort(key=lambda entry: entry.size, reverse=True)
+    return entries[:20]
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=500_000)
+    parser.add_argument("--dir", default=os.path.join(tempfile.gettempdir(), "jeeva-big-directory"))
+    args = parser.parse_args(argv)
+    generate(args.dir, args.entries)
+
+    print(f"{'':<34} {'time':>12} {'peak mem':>11}")
+    measure("list + stat + sort everything", lambda: list_everything(args.dir))
+
+    browser = DirectoryBrowser()
+    _, cursor = measure("first page (100)", lambda: browser.first_page(args.dir))
+    timings = []
+    for _ in range(50):
+        started = time.perf_counter()
+        _, cursor = browser.page(cursor)
+        timings.append(time.perf_counter() - started)
+    print(f"{'next page, median of 50':<34} {statistics.median(timings) * 1000:>10.1f}ms")
+
+    measure("first page again (cached)", lambda: browser.first_page(args.dir))
+    deep = cursor._replace(position=args.entries // 2)
+    measure(f"resume evicted cursor at {deep.position}", lambda: browser.page(deep))
+    measure("largest 20 via heap", lambda: browser.top(args.dir, "size", 20).result())
+    measure("largest 20 again (cached)", lambda: browser.top(args.dir, "size", 20).result())
+    browser.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,111 @@
+"""FileIndex build, rescan and search cost on a generated file tree
+
+Creates ``--files`` empty files (default 1,000,000) spread over nested
+folders with word-based names, then reports the initial index build time,
+the on-disk index size, an incremental rescan with nothing changed, a
+rescan after files were added to a few folders, and search latency for a
+mix of queries, including misspelled ones that take the typo-tolerant path.
+
+The tree is generated under ``--tree`` (a temporary folder by default) and
+reused on later runs if it already holds the requested number of files.
+
+Usage: python benchmarks/bench_file_index.py [--files N] [--per-dir N] [--tree PATH]
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.file_index import FileIndex
+
+WORDS = ["report", "invoice", "photo", "backup", "notes", "draft", "budget", "meeting", "project", "resume",
+         "holiday", "scan", "export", "config", "summary", "letter", "contract", "music", "video", "archive"]
+EXTENSIONS = ["txt", "pdf", "jpg", "png", "docx", "xlsx", "mp3", "mp4", "zip", "log"]
+
+QUERIES = ["report", "invoice 2023", "budget_final", "holiday photo", "contract_scan_2019_7", "pdf",
+           "nothing-matches-this", "_99.zip", "meeting notes 12", "backup zip", "reprot 2019", "invoce"]
+
+
+def generate_tree(root, files, per_dir, seed=0):
+    """Create ``files`` empty files, ``per_dir`` to a folder, under root/group/folder"""
+    rng = random.Random(seed)
+    marker = os.path.join(root, f".generated-{files}-{per_dir}")
+    if os.path.exists(marker):
+        return False
+    shutil.rmtree(root, ignore_errors=True)
+    folders = -(-files // per_dir)
+    created = 0
+    for folder in range(folders):
+        path = os.path.join(root, f"group_{folder // 100:03d}", f"{rng.choice(WORDS)}_{folder:05d}")
+        os.makedirs(path, exist_ok=True)
+        for i in range(min(per_dir, files - created)):
+            name = f"{rng.choice(WORDS)}_{rng.choice(WORDS)}_{rng.randint(2015, 2025)}_{i}.{rng.choice(EXTENSIONS)}"
+            open(os.path.join(path, name), "w").close()
+        created += per_dir
+    open(marker, "w").close()
+    return True
+
+
+def time_searches(index, queries, repeat=5):
+    timings = {query: [] for query in queries}
+    for _ in range(repeat):
+        for query in queries:
+            started = time.perf_counter()
+            index.search(query)
+            timings[query].append(time.perf_counter() - started)
+    return timings
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=1_000_000)
+    parser.add_argument("--per-dir", type=int, default=1000)
+    parser.add_argument("--tree", default=os.path.join(tempfile.gettempdir(), "jeeva-file-index-tree"))
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if generate_tree(args.tree, args.files, args.per_dir):
+        print(f"generated {args.files} files in {time.perf_counter() - started:.1f}s under {args.tree}")
+    else:
+        print(f"reusing {args.files} files under {args.tree}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, "file_index.db")
+        index = FileIndex(db_path, [args.tree])
+
+        stats = index.update()
+        dirs, entries = index.count()
+        size = sum(os.path.getsize(db_path + suffix) for suffix in ("", "-wal") if os.path.exists(db_path + suffix))
+        print(f"initial build:     {stats['seconds']:.1f}s  ({entries} entries in {dirs} folders, "
+              f"{size / 1024**2:.0f} MB on disk)")
+
+        stats = index.update()
+        print(f"rescan unchanged:  {stats['seconds'] * 1000:.0f}ms  (listed {stats['listed']}, "
+              f"skipped {stats['skipped']})")
+
+        folders = [os.path.join(group, name) for group in (os.path.join(args.tree, g) for g in os.listdir(args.tree)
+                                                            if g.startswith("group_"))
+                   for name in os.listdir(group)][:10]
+        for folder in folders:
+            open(os.path.join(folder, "added_by_benchmark.txt"), "w").close()
+        stats = index.update()
+        print(f"rescan 10 changed: {stats['seconds'] * 1000:.0f}ms  (listed {stats['listed']}, added {stats['added']})")
+        for folder in folders:
+            os.remove(os.path.join(folder, "added_by_benchmark.txt"))
+        index.update()
+
+        print(f"\n{'query':<24} {'results':>8} {'median':>9} {'max':>9}")
+        for query, timings in time_searches(index, QUERIES).items():
+            print(f"{query:<24} {len(index.search(query)):>8} {statistics.median(timings) * 1000:>7.1f}ms "
+                  f"{max(timings) * 1000:>7.1f}ms")
+        index.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
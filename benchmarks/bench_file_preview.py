@@ -0,0 +1,84 @@
+"""FilePreview latency and memory on a large generated log
+
+Writes a ``--size-mb`` log file (default 2048) and times opening it,
+head/tail, the first jump to a line deep in the file (which extends the
+line index), later jumps through the built index, seeking by byte offset,
+and a full index build. Peak Python heap use is traced throughout to show
+that it does not grow with the file size.
+
+Usage: python benchmarks/bench_file_preview.py [--size-mb N] [--path PATH]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.file_preview import FilePreview
+
+LEVELS = ["DEBUG", "INFO", "INFO", "INFO", "WARNING", "ERROR"]
+
+
+def generate_log(path, size_mb, seed=0):
+    target = size_mb * 1024**2
+    if os.path.exists(path) and os.path.getsize(path) >= target:
+        return False
+    rng = random.Random(seed)
+    # Write a block of varied lines repeatedly so generation stays fast
+    block = "".join(f"2025-01-01 12:{i % 60:02d}:{i % 60:02d} {rng.choice(LEVELS):<7} worker-{rng.randint(1, 16)} "
+                    f"request {i} took {rng.randint(1, 900)}ms{' ' + 'x' * rng.randint(0, 120)}\n"
+                    for i in range(10000)).encode()
+    with open(path, "wb") as f:
+        written = 0
+        while written < target:
+            f.write(block)
+            written += len(block)
+    return True
+
+
+def timed(label, func, repeat=1):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    print(f"{label:<36} {statistics.median(timings) * 1000:>10.2f}ms")
+    return result
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--path", default=os.path.join(tempfile.gettempdir(), "jeeva-preview.log"))
+    args = parser.parse_args(argv)
+    if generate_log(args.path, args.size_mb):
+        print(f"generated {args.path}")
+
+    tracemalloc.start()
+    preview = timed("open + detect text/binary", lambda: FilePreview(args.path))
+    print(f"{'':<36} {os.path.getsize(args.path) / 1024**3:>9.2f}GB, binary={preview.binary}")
+    timed("head 50 lines", lambda: preview.head(50), repeat=20)
+    timed("tail 50 lines", lambda: preview.tail(50), repeat=20)
+    timed("seek to offset size/2", lambda: preview.at_offset(preview.size // 2, 50), repeat=20)
+
+    # Roughly the middle of the file, assuming ~130 bytes per line
+    middle = preview.size // 130 // 2
+    timed(f"first jump to line {middle:,}", lambda: preview.lines(middle, 50))
+    rng = random.Random(1)
+    timed("later jumps into indexed region", lambda: preview.lines(rng.randrange(middle), 50), repeat=50)
+    lines = timed("build the rest of the index", preview.build_index)
+    print(f"{'':<36} {lines:,} lines, {len(preview._offsets):,} checkpoints")
+    timed("random jumps anywhere", lambda: preview.lines(rng.randrange(lines), 50), repeat=50)
+
+    peak = tracemalloc.get_traced_memory()[1]
+    print(f"{'peak Python heap':<36} {peak / 1024**2:>10.2f}MB")
+    preview.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,113 @@
+"""IntentRouter matching latency over a synthetic utterance corpus
+
+Generates ``--utterances`` labelled phrases (default 5,000): weather, app
+and email commands with varied wording, wake words and punctuation, plus
+chit-chat that must not match. The router is built with ``--extra``
+synthetic intents (default 300) placed before the built-in ones, so every
+built-in command has to get past all of them. Per-utterance latency and
+accuracy are compared with trying each template's own compiled regex in
+turn.
+
+Usage: python benchmarks/bench_intents.py [--utterances N] [--extra N]
+"""
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.intents import COMMAND_PREFIX, COMMAND_SUFFIX, INTENTS, IntentRouter, normalize_utterance
+
+CITIES = ["Delhi", "New York", "London", "San Francisco", "Mumbai", "Tokyo", "Paris", "Rio de Janeiro", "Pune"]
+APPS = ["Notepad", "Calculator", "Google Chrome", "Visual Studio Code", "Spotify", "Terminal", "Paint"]
+PEOPLE = ["Rahul", "Priya", "rahul at example dot com", "the team", "Mom"]
+CHATTER = ["Who is the president of the USA?", "Tell me a fun fact.", "How are you today?",
+           "What time is it?", "Thank you Jeeva.", "Play some music",
+           "Weather", "send", "What's the capital of France?"]
+VERBS = ["set", "cancel", "show", "turn on", "turn off", "remind me", "play", "pause", "add", "remove"]
+
+
+def extra_intents(count):
+    """Synthetic intents shaped like real ones: a verb, an object and one slot"""
+    return {f"extra_{i}": [f"{VERBS[i % len(VERBS)]} (?:the )?device{i} (?:to|for) {{value}}",
+                           f"{VERBS[(i + 3) % len(VERBS)]} item{i} {{value}}"] for i in range(count)}
+
+
+def utterance(rng):
+    wake = rng.choice(["", "", "Jeeva, ", "Hey Jeeva ", "Please "])
+    end = rng.choice(["", ".", "?", " please", " now"])
+    kind = rng.random()
+    if kind < 0.3:
+        text = rng.choice(["What's the weather in {}", "How is the weather like in {}", "Weather in {}",
+                           "What is the temperature in {}", "Is it raining in {}", "{} weather"])
+        return wake + text.format(rng.choice(CITIES)) + end, "get_weather"
+    if kind < 0.55:
+        text = rng.choice(["Open {}", "Launch the {} app", "Start {}", "Run {}"])
+        return wake + text.format(rng.choice(APPS)) + end, "open_app"
+    if kind < 0.75:
+        text = rng.choice(["Send an email to {}", "Send a message to {} saying I'm late",
+                           "Write an email to {} about the meeting saying see you at ten", "Email {} saying hi"])
+        return wake + text.format(rng.choice(PEOPLE)) + end, "send_email"
+    return rng.choice(CHATTER), None
+
+
+class LoopRouter:
+    """The straightforward alternative: one compiled regex per template, tried in order"""
+
+    def __init__(self, intents):
+        self.patterns = []
+        for intent, templates in intents.items():
+            for template in templates:
+                body = re.sub(r"\{(\w+)\}", r"(?P<\1>.+?)", template)
+                self.patterns.append((intent, re.compile(f"{COMMAND_PREFIX}{body}{COMMAND_SUFFIX}")))
+
+    def match(self, text):
+        text = normalize_utterance(text)
+        for intent, pattern in self.patterns:
+            match = pattern.fullmatch(text)
+            if match:
+                return intent, match.groupdict()
+        return None
+
+
+def run(label, match, corpus):
+    timings = []
+    correct = 0
+    for text, expected in corpus:
+        started = time.perf_counter()
+        result = match(text)
+        timings.append(time.perf_counter() - started)
+        intent = None if result is None else result[0]
+        correct += intent == expected
+    timings.sort()
+    print(f"{label:<28} {statistics.median(timings) * 1e6:>9.1f}us {timings[int(len(timings) * 0.99)] * 1e6:>9.1f}us "
+          f"{timings[-1] * 1e6:>9.1f}us {len(corpus) / sum(timings):>10,.0f}/s {correct / len(corpus):>8.1%}")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--utterances", type=int, default=5000)
+    parser.add_argument("--extra", type=int, default=300)
+    args = parser.parse_args(argv)
+    rng = random.Random(0)
+    corpus = [utterance(rng) for _ in range(args.utterances)]
+    intents = dict(extra_intents(args.extra), **INTENTS)
+    templates = sum(len(templates) for templates in intents.values())
+
+    started = time.perf_counter()
+    # Slot checks are left out so both routers measure matching alone
+    router = IntentRouter(intents, handlers={}, validators={})
+    print(f"{len(intents)} intents, {templates} templates, compiled in "
+          f"{(time.perf_counter() - started) * 1000:.1f}ms; {len(corpus):,} utterances")
+    print(f"{'':<28} {'median':>11} {'p99':>11} {'max':>11} {'throughput':>12} {'accuracy':>8}")
+    run("combined regex (router)", router.match, corpus)
+    run("one regex per template", LoopRouter(intents).match, corpus)
+    run("built-in intents only", IntentRouter(handlers={}, validators={}).match, corpus)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
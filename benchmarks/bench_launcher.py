@@ -0,0 +1,73 @@
+"""AppLauncher responsiveness with stand-in applications
+
+Launches ``--apps`` dummy programs (Python one-liners that stay open for
+``--lifetime`` seconds) the old way, with a blocking ``subprocess.call``
+per app, and through the AppLauncher. Reports how long the caller is
+blocked, how long until every app is running, and how quickly a crashing
+app and a missing executable are reported as failed.
+
+Usage: python benchmarks/bench_launcher.py [--apps N] [--lifetime SECONDS]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.launcher import FAILED, RUNNING, AppLauncher
+
+
+def dummy_app(lifetime, exit_code=0):
+    return [sys.executable, "-c", f"import time, sys; time.sleep({lifetime}); sys.exit({exit_code})"]
+
+
+def wait_for(records, statuses, timeout=30):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if all(record.status in statuses for record in records):
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--apps", type=int, default=8)
+    parser.add_argument("--lifetime", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    for _ in range(args.apps):
+        subprocess.call(dummy_app(args.lifetime))
+    print(f"{'blocking subprocess.call':<34} {(time.perf_counter() - started) * 1000:>10.1f}ms caller blocked")
+
+    launcher = AppLauncher(max_workers=args.apps)
+    timings = []
+    started = time.perf_counter()
+    records = []
+    for _ in range(args.apps):
+        call_started = time.perf_counter()
+        records.append(launcher.launch(dummy_app(args.lifetime), name="dummy"))
+        timings.append(time.perf_counter() - call_started)
+    print(f"{'launcher.launch, total':<34} {(time.perf_counter() - started) * 1000:>10.1f}ms caller blocked")
+    print(f"{'launcher.launch, median per call':<34} {statistics.median(timings) * 1000:>10.3f}ms")
+    wait_for(records, (RUNNING,))
+    print(f"{'all apps running after':<34} {(time.perf_counter() - started) * 1000:>10.1f}ms")
+    wait_for(records, ("exited",))
+    print(f"{'all exits recorded after':<34} {(time.perf_counter() - started) * 1000:>10.1f}ms")
+
+    for label, app in [("crash reported as failed", dummy_app(0, exit_code=3)),
+                       ("missing executable reported", ["jeeva-no-such-app"])]:
+        started = time.perf_counter()
+        record = launcher.launch(app)
+        record.started.wait()
+        assert record.status == FAILED, record.status
+        print(f"{label:<34} {(time.perf_counter() - started) * 1000:>10.1f}ms")
+    launcher.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,108 @@
+"""Per-call overhead of the metrics instrumentation
+
+Times ``--calls`` calls (default 1,000,000) of an empty function bare,
+through ``instrument`` and inside ``timed``, with metrics disabled and
+enabled, and reports the overhead per call over the bare function. Then
+``--threads`` threads (default 8) record into the per-thread buffers at
+once, compared with the same threads sharing one locked Histogram, and the
+time to render the Prometheus text for ``--names`` call names is measured.
+
+Usage: python benchmarks/bench_metrics.py [--calls N] [--threads N] [--names N]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant import metrics
+from Assistant.metrics import REGISTRY, Histogram, instrument, timed
+
+
+def work():
+    return None
+
+
+instrumented_work = instrument("bench")(work)
+
+
+def per_call(loop, calls):
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        loop(calls)
+        best = min(best, time.perf_counter() - started)
+    return best / calls
+
+
+def bare_loop(calls):
+    for _ in range(calls):
+        work()
+
+
+def decorated_loop(calls):
+    for _ in range(calls):
+        instrumented_work()
+
+
+def timed_loop(calls):
+    for _ in range(calls):
+        with timed("bench"):
+            work()
+
+
+def threaded(target, threads):
+    workers = [threading.Thread(target=target) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--names", type=int, default=50)
+    args = parser.parse_args()
+
+    bare = per_call(bare_loop, args.calls)
+    print(f"bare call:                 {bare * 1e9:7.0f} ns")
+    for state in ("disabled", "enabled"):
+        metrics.enable() if state == "enabled" else metrics.disable()
+        for label, loop in (("instrument", decorated_loop), ("timed", timed_loop)):
+            seconds = per_call(loop, args.calls)
+            print(f"{label:<10} {state:<8}:      {seconds * 1e9:7.0f} ns  (+{(seconds - bare) * 1e9:.0f} ns)")
+
+    metrics.enable()
+    REGISTRY.reset()
+    per_thread = args.calls // args.threads
+    buffered = threaded(lambda: decorated_loop(per_thread), args.threads)
+    histogram = Histogram()
+
+    def locked_loop():
+        for _ in range(per_thread):
+            started = time.perf_counter()
+            work()
+            histogram.observe(time.perf_counter() - started)
+
+    locked = threaded(locked_loop, args.threads)
+    recorded = REGISTRY.collect()["bench"].count
+    print(f"\n{args.threads} threads x {per_thread:,} calls")
+    print(f"  per-thread buffers:  {buffered:6.2f} s  ({recorded:,} recorded)")
+    print(f"  one locked histogram:{locked:6.2f} s  ({histogram.count:,} recorded)")
+
+    for i in range(args.names):
+        REGISTRY.record(f"call_{i}", 0.001 * i, ValueError() if i % 5 == 0 else None)
+    started = time.perf_counter()
+    text = REGISTRY.prometheus()
+    print(f"\nPrometheus text for {args.names + 1} names: {(time.perf_counter() - started) * 1000:.2f} ms, "
+          f"{len(text):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
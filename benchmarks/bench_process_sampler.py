@@ -0,0 +1,85 @@
+"""ProcessSampler cost at 1k and 10k synthetic processes
+
+Reports the CPU time used per tick against the budget, how many ticks a
+full sweep takes, and top-N selection time with a heap versus a full sort.
+
+Usage: python benchmarks/bench_process_sampler.py [process counts...]   (default: 1000 10000)
+"""
+import os
+import random
+import sys
+import time
+from collections import namedtuple
+from operator import attrgetter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.processes import ProcessSampler
+
+CpuTimes = namedtuple("CpuTimes", ["user", "system"])
+MemoryInfo = namedtuple("MemoryInfo", ["rss", "vms"])
+IoCounters = namedtuple("IoCounters", ["read_bytes", "write_bytes"])
+
+
+class SyntheticProvider:
+    """Pretend process table whose counters grow a little on every read"""
+
+    def __init__(self, count, seed=0):
+        rng = random.Random(seed)
+        self.rng = rng
+        self.table = {pid: [rng.random() * 100, rng.randint(1, 2000) * 1024**2, rng.randint(0, 10**9)]
+                      for pid in range(1, count + 1)}
+
+    def pids(self):
+        return list(self.table)
+
+    def read(self, pid):
+        entry = self.table.get(pid)
+        if entry is None:
+            return None
+        entry[0] += self.rng.random() * 0.01
+        entry[2] += self.rng.randint(0, 4096)
+        return {
+            "pid": pid,
+            "name": f"proc-{pid}",
+            "username": "bench",
+            "create_time": 1.0,
+            "cpu_times": CpuTimes(entry[0] * 0.7, entry[0] * 0.3),
+            "memory_info": MemoryInfo(entry[1], entry[1] * 2),
+            "io_counters": IoCounters(entry[2] // 2, entry[2] // 2)
+        }
+
+
+def bench(count, budget):
+    sampler = ProcessSampler(SyntheticProvider(count), budget=budget)
+    tick_costs = []
+    # Two full sweeps so every process has a CPU% value
+    while sampler.sweeps < 2:
+        started = time.process_time()
+        sampler.tick()
+        tick_costs.append(time.process_time() - started)
+
+    stats = list(sampler._stats.values())
+    started = time.perf_counter()
+    for _ in range(20):
+        sampler.top(10, "cpu")
+    heap_ms = (time.perf_counter() - started) / 20 * 1000
+    started = time.perf_counter()
+    for _ in range(20):
+        sorted(stats, key=attrgetter("cpu_percent"), reverse=True)[:10]
+    sort_ms = (time.perf_counter() - started) / 20 * 1000
+    return max(tick_costs), len(tick_costs) // 2, heap_ms, sort_ms
+
+
+def main(argv):
+    counts = [int(arg) for arg in argv] or [1000, 10000]
+    budget = 0.02
+    print(f"budget per tick: {budget * 1000:.0f}ms CPU")
+    print(f"{'processes':>10} {'max tick CPU':>13} {'ticks/sweep':>12} {'top10 heap':>11} {'top10 sort':>11}")
+    for count in counts:
+        worst, ticks, heap_ms, sort_ms = bench(count, budget)
+        print(f"{count:>10} {worst * 1000:>11.2f}ms {ticks:>12} {heap_ms:>9.2f}ms {sort_ms:>9.2f}ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
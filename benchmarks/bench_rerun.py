@@ -0,0 +1,108 @@
+"""Rerun latency of each page through Streamlit's AppTest harness
+
+For every feature the page is opened once to warm it up and then rerun
+``--runs`` times, once with no input and once per interaction (changing a
+filter or a radio). Reports the median and p95 per rerun.
+
+Pass ``--script`` to time another version of the app, e.g. the single-file
+app from an earlier commit:
+
+    git show <commit>:app_new.py > /tmp/app_old.py
+    python benchmarks/bench_rerun.py --script /tmp/app_old.py
+
+The app expects the Streamlit port to answer, so a listening socket is
+opened on localhost:8501 if nothing is there yet. Task data is written to a
+temporary directory.
+
+Usage: python benchmarks/bench_rerun.py [--runs N] [--script PATH] [features...]
+"""
+import argparse
+import logging
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import Assistant
+
+# The app imports the package as "assistant"
+sys.modules.setdefault("assistant", Assistant)
+
+from streamlit.testing.v1 import AppTest
+
+from Assistant.features import FEATURE_PAGES
+
+
+def _set_selectbox(label, value):
+    def interact(at):
+        next(box for box in at.selectbox if box.label == label).set_value(value)
+    return interact
+
+
+def _set_radio(key, value):
+    def interact(at):
+        at.radio(key=key).set_value(value)
+    return interact
+
+
+# Interactions timed per feature, as (name, [steps that alternate between runs])
+INTERACTIONS = {
+    "Task Manager": ("change filter", [_set_selectbox("Filter by Category", "Work"),
+                                       _set_selectbox("Filter by Category", "All")]),
+    "System Info": ("change sort", [_set_radio("process_sort", "Memory"), _set_radio("process_sort", "CPU")])
+}
+
+
+def time_reruns(at, runs, steps=None):
+    timings = []
+    for i in range(runs):
+        if steps:
+            steps[i % len(steps)](at)
+        started = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - started)
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return timings
+
+
+def summary(timings):
+    timings = sorted(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    return f"{statistics.median(timings) * 1000:>8.1f}ms {p95 * 1000:>8.1f}ms"
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--script", default=os.path.join(ROOT, "app_new.py"))
+    parser.add_argument("features", nargs="*")
+    args = parser.parse_args(argv)
+
+    try:
+        server = socket.create_server(("127.0.0.1", 8501))
+    except OSError:
+        server = None  # something is already listening
+
+    # AppTest runs the script without a server, which Streamlit warns about on every run
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(logging.ERROR)
+    os.chdir(tempfile.mkdtemp())
+    print(f"{'feature':<14} {'rerun':<14} {'median':>10} {'p95':>10}")
+    for feature in args.features or list(FEATURE_PAGES):
+        at = AppTest.from_file(os.path.abspath(args.script), default_timeout=60)
+        at.run()
+        at.sidebar.radio[0].set_value(feature)
+        at.run()
+        print(f"{feature:<14} {'idle':<14} {summary(time_reruns(at, args.runs))}")
+        if feature in INTERACTIONS:
+            name, steps = INTERACTIONS[feature]
+            print(f"{'':<14} {name:<14} {summary(time_reruns(at, args.runs, steps))}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
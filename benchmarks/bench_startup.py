@@ -0,0 +1,107 @@
+"""Startup cost of each sidebar feature
+
+For every feature a fresh interpreter is started twice:
+
+- ``python -X importtime`` loads just that feature's dependencies and
+  reports the total import time plus the heaviest top-level imports;
+- Streamlit's AppTest renders the app, switches to the feature (cold: its
+  modules are imported on this rerun) and reruns it (warm: everything is
+  cached in the process).
+
+The app expects the Streamlit port to answer, so a listening socket is
+opened on localhost:8501 if nothing is there yet. Task data is written to a
+temporary directory.
+
+Usage: python benchmarks/bench_startup.py [features...]   (default: all)
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Assistant.features import FEATURE_EXPORTS
+
+# The app imports the package as "assistant"; alias it so this works on
+# case-sensitive file systems too
+ALIAS = "import sys, Assistant; sys.modules.setdefault('assistant', Assistant)"
+
+BASELINE_PROBE = ALIAS + "; import assistant.features"
+IMPORT_PROBE = BASELINE_PROBE + "; assistant.features.load_feature({feature!r})"
+
+RENDER_PROBE = ALIAS + """
+import json, socket, time
+from streamlit.testing.v1 import AppTest
+try:
+    server = socket.create_server(("127.0.0.1", 8501))
+except OSError:
+    server = None  # something is already listening
+at = AppTest.from_file({app!r}, default_timeout=60)
+started = time.perf_counter()
+at.run()
+first = time.perf_counter() - started
+at.sidebar.radio[0].set_value({feature!r})
+started = time.perf_counter()
+at.run()
+cold = time.perf_counter() - started
+started = time.perf_counter()
+at.run()
+warm = time.perf_counter() - started
+print(json.dumps({{"first": first, "cold": cold, "warm": warm, "errors": len(at.exception)}}))
+"""
+
+
+def import_times(feature, cwd):
+    """Import time added by one feature and its heaviest top-level imports, from -X importtime"""
+    baseline = _parse_importtime(_run(["-X", "importtime", "-c", BASELINE_PROBE], cwd).stderr)
+    loaded = _parse_importtime(_run(["-X", "importtime", "-c", IMPORT_PROBE.format(feature=feature)], cwd).stderr)
+    added = {name: times for name, times in loaded.items() if name not in baseline}
+    total_ms = sum(self_us for self_us, _, _ in added.values()) / 1000
+    top_level = min((depth for _, _, depth in added.values()), default=0)
+    heaviest = sorted((cumulative_us, name) for name, (_, cumulative_us, depth) in added.items() if depth == top_level)
+    return total_ms, [name for _, name in heaviest[::-1][:3]]
+
+
+def _parse_importtime(stderr):
+    # "import time: self [us] | cumulative | imported package", nested imports are indented
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = len(name) - len(name.lstrip())
+        imports[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return imports
+
+
+def render_times(feature, cwd):
+    probe = RENDER_PROBE.format(app=os.path.join(ROOT, "app_new.py"), feature=feature)
+    result = _run(["-c", probe], cwd)
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "render failed")
+    return json.loads(lines[-1])
+
+
+def _run(args, cwd):
+    env = dict(os.environ, PYTHONPATH=ROOT, JEEVA_TTS_DRIVER="null")
+    return subprocess.run([sys.executable] + args, cwd=cwd, env=env, capture_output=True, text=True)
+
+
+def main(argv):
+    features = argv or list(FEATURE_EXPORTS)
+    print(f"{'feature':<14} {'imports':>9} {'first render':>13} {'cold':>9} {'warm':>9}  heaviest imports")
+    with tempfile.TemporaryDirectory() as cwd:
+        for feature in features:
+            import_ms, heaviest = import_times(feature, cwd)
+            render = render_times(feature, cwd)
+            note = f"  ({render['errors']} exceptions)" if render["errors"] else ""
+            print(f"{feature:<14} {import_ms:>7.1f}ms {render['first'] * 1000:>11.1f}ms "
+                  f"{render['cold'] * 1000:>7.1f}ms {render['warm'] * 1000:>7.1f}ms  {', '.join(heaviest) or '-'}{note}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,42 @@
+"""Bytes per task for plain dicts, slotted Task records and a columnar TaskTable
+
+Each form is built from its own freshly generated tasks, so every figure
+includes the task description strings it keeps alive.
+
+Usage: python benchmarks/bench_task_memory.py [sizes...]   (default: 10000 100000 1000000)
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.task_model import Task, TaskTable
+from bench_task_store import make_tasks
+
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return obj, used
+
+
+def main(argv):
+    sizes = [int(arg) for arg in argv] or [10000, 100000, 1000000]
+    print(f"{'tasks':>10} {'dict B/task':>12} {'Task B/task':>12} {'TaskTable B/task':>17}")
+    for n in sizes:
+        tasks, dict_bytes = measure(lambda: make_tasks(n))
+        # The source dicts are freed once built, leaving only the strings the compact forms keep
+        records, task_bytes = measure(lambda: [Task.from_dict(t) for t in make_tasks(n)])
+        table, table_bytes = measure(lambda: TaskTable(make_tasks(n)))
+        # Sanity check: both compact forms convert back to the original dicts
+        assert records[0].to_dict() == tasks[0] and table.to_dicts()[:100] == tasks[:100]
+        print(f"{n:>10} {dict_bytes / n:>12.1f} {task_bytes / n:>12.1f} {table_bytes / n:>17.1f}")
+        del tasks, records, table
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
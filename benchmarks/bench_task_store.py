@@ -0,0 +1,88 @@
+"""Compare task add/filter latency of the old pickle file against TaskStore
+
+Usage: python benchmarks/bench_task_store.py [sizes...]   (default: 100 10000 1000000)
+"""
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.task_store import TaskStore
+
+CATEGORIES = ["Work", "Personal", "Shopping", "Health", "Education", "Other"]
+PRIORITIES = ["High", "Medium", "Low"]
+
+
+def make_tasks(n, seed=0):
+    rng = random.Random(seed)
+    return [{
+        "task": f"Task {i}",
+        "priority": rng.choice(PRIORITIES),
+        "category": rng.choice(CATEGORIES),
+        "due_date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:00",
+        "date": "2025-01-01 09:00",
+        "completed": rng.random() < 0.3
+    } for i in range(n)]
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def bench(n, workdir):
+    tasks = make_tasks(n)
+    new_task = make_tasks(1, seed=n)[0]
+    repeat = 3 if n >= 1000000 else 5
+
+    # Old path: append to the list and re-pickle everything, filter with a list scan
+    pickle_path = os.path.join(workdir, f"tasks_{n}.pkl")
+
+    def pickle_add():
+        tasks.append(new_task)
+        with open(pickle_path, "wb") as f:
+            pickle.dump(tasks, f)
+        tasks.pop()
+
+    def pickle_filter():
+        return [t for t in tasks if t["category"] == "Work" and t["priority"] == "High" and not t["completed"]][:50]
+
+    store = TaskStore(os.path.join(workdir, f"tasks_{n}.db"))
+    store.add_many(tasks)
+
+    def store_add():
+        store.add(new_task)
+
+    def store_filter():
+        return store.query(category="Work", priority="High", status="Active", limit=50)
+
+    results = {
+        "pickle_add_ms": timed(pickle_add, repeat),
+        "pickle_filter_ms": timed(pickle_filter, repeat),
+        "store_add_ms": timed(store_add, repeat),
+        "store_filter_ms": timed(store_filter, repeat)
+    }
+    store.close()
+    return results
+
+
+def main(argv):
+    sizes = [int(arg) for arg in argv] or [100, 10000, 1000000]
+    with tempfile.TemporaryDirectory() as workdir:
+        print(f"{'tasks':>10} {'pickle add':>12} {'store add':>12} {'pickle filter':>14} {'store filter':>14}")
+        for n in sizes:
+            r = bench(n, workdir)
+            print(f"{n:>10} {r['pickle_add_ms']:>10.3f}ms {r['store_add_ms']:>10.3f}ms "
+                  f"{r['pickle_filter_ms']:>12.3f}ms {r['store_filter_ms']:>12.3f}ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
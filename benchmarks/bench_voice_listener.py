@@ -0,0 +1,68 @@
+"""End-to-end phrase latency of the continuous VoiceListener, driven from a WAV file
+
+A synthetic WAV with tone bursts separated by silence is streamed in real
+time; a fake recognizer with a fixed delay stands in for the speech service.
+Latency is measured from the moment a phrase finished capturing to the
+moment the consumer receives its text.
+
+Usage: python benchmarks/bench_voice_listener.py [phrases] [recognize_ms]
+"""
+import math
+import os
+import statistics
+import struct
+import sys
+import tempfile
+import time
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.listener import VoiceListener, WavFileSource
+
+SAMPLE_RATE = 16000
+
+
+def write_bursts(path, phrases, tone_seconds=0.6, gap_seconds=1.5):
+    frames = bytearray()
+    silence = struct.pack("<h", 0) * int(SAMPLE_RATE * gap_seconds)
+    frames += silence
+    for _ in range(phrases):
+        for i in range(int(SAMPLE_RATE * tone_seconds)):
+            frames += struct.pack("<h", int(8000 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE)))
+        frames += silence
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(bytes(frames))
+    return len(frames) / 2 / SAMPLE_RATE
+
+
+def main(argv):
+    phrases = int(argv[0]) if argv else 5
+    recognize_seconds = (float(argv[1]) if len(argv) > 1 else 50) / 1000
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "bursts.wav")
+        duration = write_bursts(path, phrases)
+
+        def fake_recognize(recognizer, audio):
+            time.sleep(recognize_seconds)
+            return f"phrase of {len(audio.frame_data) / 2 / SAMPLE_RATE:.2f}s"
+
+        listener = VoiceListener(lambda: WavFileSource(path, realtime=True), fake_recognize,
+                                 calibration_duration=0.5)
+        started = time.perf_counter()
+        latencies = []
+        for phrase in listener.start().phrases():
+            latencies.append(time.perf_counter() - phrase.captured_at)
+        elapsed = time.perf_counter() - started
+
+    print(f"audio: {duration:.1f}s, wall: {elapsed:.1f}s, phrases: {len(latencies)}/{phrases}, stats: {listener.stats}")
+    if latencies:
+        print(f"capture -> consumer latency: median {statistics.median(latencies) * 1000:.1f}ms, "
+              f"max {max(latencies) * 1000:.1f}ms (recognizer delay {recognize_seconds * 1000:.0f}ms)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
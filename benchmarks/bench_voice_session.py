@@ -0,0 +1,123 @@
+"""Pipelined VoiceSession against a sequential listen/answer/speak loop, headless
+
+A synthetic WAV of tone bursts is streamed in real time, a
+ScriptedRecognizer with a fixed delay stands in for speech recognition, a
+fake model streams a multi-sentence reply word by word, and a NullDriver
+"speaks" at a fixed rate. Reported per mode: time from the end of a phrase
+to the first spoken sentence and total wall time, then the session's
+per-stage histograms. A second run uses replies long enough that each new
+phrase arrives mid-reply, to show barge-in cutting the reply short.
+
+Usage: python benchmarks/bench_voice_session.py [--phrases N] [--recognize-ms MS] [--first-token-ms MS]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.listener import ScriptedRecognizer, VoiceListener, WavFileSource
+from Assistant.speech import NullDriver, SpeechService
+from Assistant.voice_session import VoiceSession, iter_sentences
+from bench_voice_listener import write_bursts
+
+SENTENCE = "This is one sentence of a longer spoken answer."
+CHARS_PER_SECOND = 60
+
+
+def fake_model(sentences, first_token_seconds, word_seconds):
+    """Responder that streams a reply of ``sentences`` sentences word by word"""
+    def respond(text):
+        time.sleep(first_token_seconds)
+        for i, word in enumerate(" ".join([SENTENCE] * sentences).split()):
+            if i:
+                time.sleep(word_seconds)
+            yield word + " "
+    return respond
+
+
+def sequential(path, phrases, recognize_seconds, respond):
+    """The old loop: listen() then answer fully then speak() each reply, one after another"""
+    driver = NullDriver(1 / CHARS_PER_SECOND)
+    listener = VoiceListener(lambda: WavFileSource(path, realtime=True), ScriptedRecognizer(
+        ["tell me something"] * phrases, recognize_seconds), calibration_duration=0, max_phrases=1)
+    latencies = []
+    # One phrase at a time: the next is only taken once this reply has been spoken
+    for phrase in listener.start().phrases():
+        reply = list(iter_sentences(respond(phrase.text)))
+        latencies.append(time.perf_counter() - phrase.captured_at)
+        for sentence in reply:
+            driver.speak(sentence, _never)
+    return latencies
+
+
+class _Never:
+    def is_set(self):
+        return False
+
+    def wait(self, timeout):
+        time.sleep(timeout)
+        return False
+
+
+_never = _Never()
+
+
+def pipelined(path, phrases, recognize_seconds, respond):
+    speech = SpeechService(NullDriver(1 / CHARS_PER_SECOND))
+    listener = VoiceListener(lambda: WavFileSource(path, realtime=True), ScriptedRecognizer(
+        ["tell me something"] * phrases, recognize_seconds), calibration_duration=0)
+    session = VoiceSession(listener, respond, speech).start()
+    session.join()
+    speech.close()
+    return session
+
+
+def print_histograms(session):
+    print(f"  {'stage':<10} {'count':>6} {'p50':>9} {'p95':>9} {'max':>9}")
+    for stage, snapshot in session.latency().items():
+        print(f"  {stage:<10} {snapshot['count']:>6} {snapshot['p50'] * 1000:>7.0f}ms "
+              f"{snapshot['p95'] * 1000:>7.0f}ms {snapshot['max'] * 1000:>7.0f}ms")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--phrases", type=int, default=5)
+    parser.add_argument("--recognize-ms", type=float, default=300)
+    parser.add_argument("--first-token-ms", type=float, default=400)
+    parser.add_argument("--word-ms", type=float, default=40)
+    args = parser.parse_args(argv)
+    recognize = args.recognize_ms / 1000
+    respond = fake_model(3, args.first_token_ms / 1000, args.word_ms / 1000)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "bursts.wav")
+        duration = write_bursts(path, args.phrases, gap_seconds=4.0)
+        print(f"{args.phrases} phrases over {duration:.1f}s of audio, 3-sentence replies")
+
+        started = time.perf_counter()
+        latencies = sequential(path, args.phrases, recognize, respond)
+        print(f"{'sequential':<12} end of phrase -> first audio median "
+              f"{statistics.median(latencies) * 1000:.0f}ms, wall {time.perf_counter() - started:.1f}s")
+
+        started = time.perf_counter()
+        session = pipelined(path, args.phrases, recognize, respond)
+        response = session.latency()["response"]
+        print(f"{'pipelined':<12} end of phrase -> first audio median {response['p50'] * 1000:.0f}ms, "
+              f"wall {time.perf_counter() - started:.1f}s, turns {session.stats['turns']}")
+        print_histograms(session)
+
+        # Replies far longer than the gap between phrases: every new phrase interrupts the last reply
+        path = os.path.join(workdir, "barge.wav")
+        write_bursts(path, args.phrases, gap_seconds=1.5)
+        session = pipelined(path, args.phrases, recognize, fake_model(20, 0.05, 0.01))
+        cut = [len(turn.spoken) for turn in session.turns if turn.interrupted]
+        print(f"barge-in: {session.stats['barge_ins']} replies interrupted after {cut} of 20 sentences, "
+              f"{session.stats['turns']} turns")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,150 @@
+"""Multi-city weather fan-out and forecast cache against a local stub server
+
+A wttr.in stand-in serves j1 payloads shaped like the real ones, with a
+per-city delay between ``--min-ms`` and ``--max-ms``. The benchmark times
+fetching ``--cities`` cities one by one, all at once through get_many,
+again from memory, and from the on-disk cache with a fresh client as
+after a restart. It also prints how many requests reached the server and
+the size of a raw payload next to its cached form.
+
+Usage: python benchmarks/bench_weather.py [--cities N] [--min-ms MS] [--max-ms MS]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Assistant.weather import WeatherClient
+
+CONDITIONS = ["Sunny", "Partly cloudy", "Overcast", "Light rain", "Mist", "Clear"]
+
+
+def j1_payload(city, rng):
+    """A payload with the same structure and roughly the size of wttr.in's format=j1"""
+    def desc():
+        return [{"value": rng.choice(CONDITIONS)}]
+
+    def hour(time_of_day):
+        fields = {name: str(rng.randint(0, 100)) for name in [
+            "DewPointC", "DewPointF", "HeatIndexC", "HeatIndexF", "WindChillC", "WindChillF", "WindGustKmph",
+            "WindGustMiles", "chanceoffog", "chanceoffrost", "chanceofhightemp", "chanceofovercast",
+            "chanceofremdry", "chanceofsnow", "chanceofsunshine", "chanceofthunder", "chanceofwindy", "cloudcover",
+            "diffRad", "humidity", "precipInches", "pressure", "pressureInches", "shortRad", "tempF", "uvIndex",
+            "visibility", "visibilityMiles", "winddirDegree", "windspeedMiles"]}
+        fields.update({"time": str(time_of_day), "tempC": str(rng.randint(-5, 35)),
+                       "FeelsLikeC": str(rng.randint(-8, 38)), "chanceofrain": str(rng.randint(0, 100)),
+                       "precipMM": f"{rng.random() * 5:.1f}", "windspeedKmph": str(rng.randint(0, 40)),
+                       "weatherDesc": desc(), "weatherIconUrl": [{"value": ""}], "winddir16Point": "NW",
+                       "weatherCode": "116"})
+        return fields
+
+    return {
+        "current_condition": [{"temp_C": str(rng.randint(-5, 35)), "FeelsLikeC": str(rng.randint(-8, 38)),
+                               "weatherDesc": desc(), "humidity": str(rng.randint(20, 100)),
+                               "windspeedKmph": str(rng.randint(0, 40)), "pressure": "1012", "visibility": "10",
+                               "precipMM": "0.0", "cloudcover": str(rng.randint(0, 100))}],
+        "nearest_area": [{"areaName": [{"value": city}], "country": [{"value": "Nowhere"}]}],
+        "request": [{"query": city, "type": "City"}],
+        "weather": [{"date": f"2025-01-0{day + 1}", "maxtempC": "20", "mintempC": "10",
+                     "astronomy": [{"sunrise": "07:00 AM", "sunset": "05:00 PM"}],
+                     "hourly": [hour(t) for t in range(0, 2400, 300)]} for day in range(3)]
+    }
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, min_ms, max_ms):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def delay(self, city):
+        # Stable per city; "slowest" always takes the maximum
+        if city == "slowest":
+            return self.max_ms / 1000
+        return random.Random(city).uniform(self.min_ms, self.max_ms) / 1000
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        city = unquote(urlparse(self.path).path.strip("/"))
+        with self.server.lock:
+            self.server.requests += 1
+        time.sleep(self.server.delay(city))
+        body = json.dumps(j1_payload(city, random.Random(city))).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def timed(label, func, server):
+    before = server.requests
+    started = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - started
+    print(f"{label:<36} {seconds * 1000:>9.0f}ms {server.requests - before:>9}")
+    return result
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cities", type=int, default=50)
+    parser.add_argument("--min-ms", type=float, default=100)
+    parser.add_argument("--max-ms", type=float, default=600)
+    args = parser.parse_args(argv)
+    cities = ["slowest"] + [f"City {i}" for i in range(1, args.cities)]
+
+    server = StubServer(args.min_ms, args.max_ms)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    cache_path = os.path.join(tempfile.mkdtemp(prefix="jeeva-weather-"), "weather_cache.db")
+    print(f"{len(cities)} cities, slowest takes {args.max_ms:.0f}ms")
+    print(f"{'':<36} {'time':>11} {'requests':>9}")
+
+    client = WeatherClient(base_url, cache_path=None)
+    timed("one by one, no cache", lambda: [client.get(city) for city in cities], server)
+    client.close()
+
+    client = WeatherClient(base_url, pool_size=10, cache_path=None)
+    timed("get_many, 10 at a time", lambda: client.get_many(cities), server)
+    client.close()
+
+    client = WeatherClient(base_url, cache_path=cache_path)
+    results = timed("get_many, cold", lambda: client.get_many(cities), server)
+    failures = [city for city, result in results.items() if not isinstance(result, dict)]
+    timed("get_many, warm (memory)", lambda: client.get_many(cities), server)
+    client.close()
+
+    client = WeatherClient(base_url, cache_path=cache_path)
+    timed("get_many, after restart (disk)", lambda: client.get_many(cities), server)
+    print(f"disk hits {client.stats()['disk_hits']}, failures {failures}")
+    client.close()
+
+    raw = len(json.dumps(j1_payload("slowest", random.Random("slowest"))))
+    cached = len(json.dumps(results["slowest"], separators=(",", ":")))
+    print(f"payload {raw / 1024:.1f}KB raw, {cached / 1024:.1f}KB cached, "
+          f"{len(results['slowest']['hourly']['time'])} forecast hours")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
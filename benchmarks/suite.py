@@ -0,0 +1,367 @@
+"""Benchmark suite for every feature path, with results saved as JSON
+
+Runs each case against local stand-ins: the wttr.in stub from
+bench_weather, a minimal SMTP server and the null speech driver, so
+nothing leaves the machine and no audio device is needed.
+
+  tasks.add/filter/persist[n] TaskStore at each ``--task-sizes`` size
+  weather.get_weather[...]    cold (stub request), memory cache and disk cache after a restart
+  email.send_email            sequential sends over the shared SMTP session, emails/s
+  email.queue_email           messages through the background outbox, emails/s
+  system_info.render[...]     first, cold and warm render of System Info in a fresh interpreter
+  startup.import[feature]     import time a feature adds, from ``python -X importtime``
+  apptest.rerun[feature]      app_new.py rerun latency per sidebar feature (AppTest)
+
+Timings are summarised as min/median/mean/p95 in seconds. Results go to
+``benchmarks/results/<commit>.json`` unless ``--output`` is given. With
+``--compare BASELINE.json`` the run is compared with an earlier one and
+cases whose median (or rate) got worse by more than ``--threshold``
+percent are flagged; ``--input`` compares an existing results file
+instead of running the suite.
+
+    python benchmarks/suite.py --output /tmp/before.json
+    git checkout <branch>
+    python benchmarks/suite.py --compare /tmp/before.json
+
+Usage: python benchmarks/suite.py [--quick] [--only PATTERN] [--output PATH] [--compare BASELINE] [--input RESULTS]
+"""
+import argparse
+import fnmatch
+import json
+import logging
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Stand-ins for the audio stack; set before anything reads them
+os.environ["JEEVA_TTS_DRIVER"] = "null"
+
+from Assistant.features import FEATURE_EXPORTS, FEATURE_PAGES
+from bench_task_store import make_tasks
+from bench_weather import StubServer
+from tests.smtp_stub import SmtpStub
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+CASES = []  # (name, function) in the order they run
+
+
+def case(name):
+    def register(func):
+        CASES.append((name, func))
+        return func
+    return register
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    return {
+        "unit": "s",
+        "rounds": len(samples),
+        "min": samples[0],
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        "max": samples[-1]
+    }
+
+
+def rate(count, seconds, unit):
+    return {"unit": unit, "value": count / seconds if seconds else 0.0, "count": count, "seconds": seconds}
+
+
+def repeat(func, rounds):
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+# Stand-ins
+def serve(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# Cases
+@case("tasks")
+def bench_tasks(args, workdir):
+    from Assistant.task_store import TaskStore
+    results = {}
+    for size in args.task_sizes:
+        tasks = make_tasks(size)
+        new_task = make_tasks(1, seed=size)[0]
+        rounds = max(3, min(args.rounds, 200_000 // size))
+        path = os.path.join(workdir, f"tasks_{size}.db")
+        # Saving a whole task list into a fresh file
+        persist = []
+        for i in range(min(rounds, 5)):
+            store = TaskStore(f"{path}.{i}")
+            started = time.perf_counter()
+            store.add_many(tasks)
+            persist.append(time.perf_counter() - started)
+            store.close()
+        store = TaskStore(path)
+        store.add_many(tasks)
+        results[f"tasks.add[{size}]"] = summarize(repeat(lambda: store.add(new_task), rounds))
+        results[f"tasks.filter[{size}]"] = summarize(repeat(
+            lambda: store.query(category="Work", priority="High", status="Active", limit=50), rounds))
+        results[f"tasks.persist[{size}]"] = summarize(persist)
+        store.close()
+    return results
+
+
+@case("weather")
+def bench_weather(args, workdir):
+    from Assistant import weather
+    from Assistant.assistant import get_weather
+    server = serve(StubServer(args.weather_ms, args.weather_ms))
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    cache_path = os.path.join(workdir, "weather_cache.db")
+    weather._client = weather.WeatherClient(base_url, cache_path=cache_path)
+    try:
+        cities = [f"City {i}" for i in range(args.rounds)]
+        # Every city is new, so each call is a request to the stub
+        cold = []
+        for city in cities:
+            started = time.perf_counter()
+            result = get_weather(city)
+            cold.append(time.perf_counter() - started)
+            if not isinstance(result, dict):
+                raise RuntimeError(result)
+        memory = repeat(lambda: get_weather(cities[0]), args.rounds * 10)
+        weather._client.close()
+        # A new client finds the forecasts on disk, as after a restart
+        weather._client = weather.WeatherClient(base_url, cache_path=cache_path)
+        disk = []
+        for city in cities:
+            started = time.perf_counter()
+            get_weather(city)
+            disk.append(time.perf_counter() - started)
+        return {
+            "weather.get_weather[cold]": summarize(cold),
+            "weather.get_weather[memory]": summarize(memory),
+            "weather.get_weather[disk]": summarize(disk)
+        }
+    finally:
+        weather._client.close()
+        weather._client = None
+        server.shutdown()
+
+
+@case("email")
+def bench_email(args, workdir):
+    from Assistant import mailer
+    from Assistant.assistant import queue_email, send_email
+    server = serve(SmtpStub())
+    mailer._sender = mailer.MailSender("127.0.0.1", server.server_address[1], security="none",
+                                       username="", password="")
+    try:
+        started = time.perf_counter()
+        replies = [send_email("someone@example.com", f"Message {i}", "Hello from the benchmark")
+                   for i in range(args.emails)]
+        sent = rate(args.emails, time.perf_counter() - started, "emails/s")
+        failed = [reply for reply in replies if reply != "Email sent successfully!"]
+        if failed:
+            raise RuntimeError(failed[0])
+
+        started = time.perf_counter()
+        handles = [queue_email("someone@example.com", f"Queued {i}", "Hello from the benchmark")
+                   for i in range(args.emails)]
+        for handle in handles:
+            handle.result(timeout=60)
+        queued = rate(args.emails, time.perf_counter() - started, "emails/s")
+        return {"email.send_email": sent, "email.queue_email": queued}
+    finally:
+        mailer._sender.close()
+        mailer._sender = None
+        server.shutdown()
+
+
+@case("system_info")
+def bench_system_info(args, workdir):
+    from bench_startup import render_times
+    samples = {"first": [], "cold": [], "warm": []}
+    for _ in range(args.subprocess_rounds):
+        times = render_times("System Info", workdir)
+        if times["errors"]:
+            raise RuntimeError("System Info raised while rendering")
+        for phase in samples:
+            samples[phase].append(times[phase])
+    return {f"system_info.render[{phase}]": summarize(values) for phase, values in samples.items()}
+
+
+@case("startup")
+def bench_startup(args, workdir):
+    from bench_startup import import_times
+    results = {}
+    for feature in FEATURE_EXPORTS:
+        samples = [import_times(feature, workdir)[0] / 1000 for _ in range(args.subprocess_rounds)]
+        results[f"startup.import[{feature}]"] = summarize(samples)
+    return results
+
+
+@case("apptest")
+def bench_apptest(args, workdir):
+    import Assistant
+    sys.modules.setdefault("assistant", Assistant)
+    from streamlit.testing.v1 import AppTest
+    from bench_rerun import INTERACTIONS, time_reruns
+    results = {}
+    for feature in FEATURE_PAGES:
+        # AppTest runs the script without a server, which Streamlit warns about; runs reset the level
+        logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(logging.ERROR)
+        at = AppTest.from_file(os.path.join(ROOT, "app_new.py"), default_timeout=60)
+        at.run()
+        at.sidebar.radio[0].set_value(feature)
+        at.run()
+        results[f"apptest.rerun[{feature}]"] = summarize(time_reruns(at, args.rounds))
+        if feature in INTERACTIONS:
+            name, steps = INTERACTIONS[feature]
+            results[f"apptest.rerun[{feature}:{name}]"] = summarize(time_reruns(at, args.rounds, steps))
+    return results
+
+
+# Results
+def environment():
+    def git(*command):
+        try:
+            return subprocess.run(["git", *command], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+        except OSError:
+            return ""
+
+    commit = git("rev-parse", "--short", "HEAD") or "unknown"
+    if git("status", "--porcelain", "--untracked-files=no"):
+        commit += "-dirty"
+    return {
+        "commit": commit,
+        "subject": git("log", "-1", "--format=%s"),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count()
+    }
+
+
+def headline(result):
+    return result["value"] if "value" in result else result["median"]
+
+
+def describe(result):
+    if "value" in result:
+        return f"{result['value']:,.1f} {result['unit']}"
+    return f"{result['median'] * 1000:,.3f} ms"
+
+
+def compare(baseline, current, threshold):
+    """Print every case found in both runs; returns the names that regressed"""
+    print(f"\n{baseline['environment']['commit']} -> {current['environment']['commit']}")
+    print(f"{'case':<48} {'before':>16} {'after':>16} {'change':>9}")
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None or "error" in result or "error" in before:
+            continue
+        old, new = headline(before), headline(result)
+        change = (new - old) / old * 100 if old else 0.0
+        # Rates are better when higher, timings when lower
+        worse = -change if "value" in result else change
+        flag = "  REGRESSION" if worse > threshold else ""
+        if flag:
+            regressions.append(name)
+        print(f"{name:<48} {describe(before):>16} {describe(result):>16} {change:>+8.1f}%{flag}")
+    return regressions
+
+
+def run(args):
+    try:
+        port_8501 = socket.create_server(("127.0.0.1", 8501))  # the app checks that its port answers
+    except OSError:
+        port_8501 = None  # something is already listening
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="jeeva-bench-") as workdir:
+        cwd = os.getcwd()
+        os.chdir(workdir)  # task, weather and chat data of the app land here
+        os.environ.setdefault("JEEVA_WEATHER_CACHE", os.path.join(workdir, "weather_cache.db"))
+        os.environ.setdefault("JEEVA_CHAT_CACHE", os.path.join(workdir, "chat_cache.db"))
+        try:
+            for name, func in CASES:
+                if not fnmatch.fnmatch(name, args.only):
+                    continue
+                print(f"running {name}...", flush=True)
+                started = time.perf_counter()
+                try:
+                    case_results = func(args, workdir)
+                except Exception as e:
+                    case_results = {name: {"error": f"{type(e).__name__}: {e}"}}
+                for case_name, result in case_results.items():
+                    results[case_name] = result
+                    print(f"  {case_name:<46} {result['error'] if 'error' in result else describe(result)}")
+                print(f"  ({time.perf_counter() - started:.1f}s)")
+        finally:
+            os.chdir(cwd)
+            if port_8501 is not None:
+                port_8501.close()
+    return {"environment": environment(), "settings": settings(args), "results": results}
+
+
+def settings(args):
+    return {"rounds": args.rounds, "task_sizes": args.task_sizes, "weather_ms": args.weather_ms,
+            "emails": args.emails, "subprocess_rounds": args.subprocess_rounds, "only": args.only}
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="fewer rounds and smaller task lists")
+    parser.add_argument("--only", default="*", help="run the cases whose name matches this glob")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--task-sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--weather-ms", type=float, default=50, help="stub wttr.in response time")
+    parser.add_argument("--emails", type=int, default=200)
+    parser.add_argument("--subprocess-rounds", type=int, default=3)
+    parser.add_argument("--output")
+    parser.add_argument("--compare", metavar="BASELINE")
+    parser.add_argument("--input", metavar="RESULTS", help="compare this results file instead of running")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent change flagged as a regression")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.rounds = min(args.rounds, 5)
+        args.task_sizes = [size for size in args.task_sizes if size <= 10000]
+        args.emails = min(args.emails, 50)
+        args.subprocess_rounds = 1
+
+    if args.input:
+        with open(args.input, encoding="utf-8") as f:
+            current = json.load(f)
+    else:
+        current = run(args)
+        output = args.output or os.path.join(RESULTS_DIR, f"{current['environment']['commit']}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"\nresults written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0f}%")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
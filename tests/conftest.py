@@ -0,0 +1,72 @@
+import os
+import socket
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def listening_endpoint():
+    """A local port that accepts connections"""
+    server = socket.create_server(("127.0.0.1", 0))
+    yield server.getsockname()[:2]
+    server.close()
+
+
+@pytest.fixture
+def closed_endpoint():
+    """A local port nothing listens on, so connecting is refused at once"""
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        return server.getsockname()[:2]
+
+
+@pytest.fixture
+def hanging_endpoint():
+    """A local port whose accept queue is full, so connecting hangs until the timeout"""
+    server = socket.create_server(("127.0.0.1", 0), backlog=0)
+    endpoint = server.getsockname()[:2]
+    queued = socket.create_connection(endpoint)
+    yield endpoint
+    queued.close()
+    server.close()
+
+
+@pytest.fixture
+def smtp_server():
+    """A local SMTP stub serving on a background thread"""
+    from smtp_stub import SmtpStub
+    server = SmtpStub()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def weather_server():
+    """A local wttr.in stub serving on a background thread"""
+    from weather_stub import StubServer
+    server = StubServer()
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def weather_client():
+    """Factory for WeatherClients that are closed after the test"""
+    from Assistant.weather import WeatherClient
+    clients = []
+
+    def make(base_url, **kwargs):
+        kwargs.setdefault("pool_size", 4)
+        clients.append(WeatherClient(base_url, **kwargs))
+        return clients[-1]
+
+    yield make
+    for client in clients:
+        client.close()
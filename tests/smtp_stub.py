@@ -0,0 +1,73 @@
+"""A minimal SMTP server for the mailer tests and the benchmark suite"""
+import socket
+import socketserver
+import threading
+
+
+class SmtpStubHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: every command is accepted and messages are counted"""
+
+    def handle(self):
+        with self.server.lock:
+            self.server.connections += 1
+            self.server.open.add(self.connection)
+        try:
+            self.converse()
+        finally:
+            with self.server.lock:
+                self.server.open.discard(self.connection)
+
+    def converse(self):
+        self.reply("220 stub ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii", "replace").strip().upper()
+            if command.startswith("EHLO"):
+                self.reply("250-stub\r\n250 8BITMIME")
+            elif command.startswith("RCPT") and self.server.reject_recipients:
+                self.reply("550 No such user")
+            elif command.startswith("DATA"):
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                with self.server.lock:
+                    self.server.messages += 1
+                if self.server.hang_up_after_data:
+                    return
+                self.reply("250 OK")
+            elif command.startswith("QUIT"):
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+    def reply(self, text):
+        self.wfile.write(f"{text}\r\n".encode())
+
+
+class SmtpStub(socketserver.ThreadingTCPServer):
+    """Serves SmtpStubHandler on a free local port
+
+    ``reject_recipients`` refuses every RCPT and ``hang_up_after_data`` drops
+    the connection once a message is received, before it is acknowledged.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SmtpStubHandler)
+        self.messages = 0
+        self.connections = 0
+        self.reject_recipients = False
+        self.hang_up_after_data = False
+        self.open = set()
+        self.lock = threading.Lock()
+
+    def drop_connections(self):
+        """Close every open session from the server side"""
+        with self.lock:
+            for connection in self.open:
+                connection.shutdown(socket.SHUT_RDWR)
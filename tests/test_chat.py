@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+
+import pytest
+
+from Assistant.chat import ChatClient, Conversation
+
+
+def chunk(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+class FakeStream:
+    def __init__(self, pieces, error=None):
+        self.pieces = pieces
+        self.error = error
+        self.closed = False
+
+    def __iter__(self):
+        for piece in self.pieces:
+            yield chunk(piece)
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        self.closed = True
+
+
+class FakeOpenAI:
+    """Stands in for the openai client; ``replies`` are streams or exceptions, used in order"""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, messages, **kwargs):
+        self.requests.append(list(messages))
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+def client_for(*replies):
+    client = ChatClient()
+    client._client = FakeOpenAI(*replies)
+    return client
+
+
+def roles(messages):
+    return [message["role"] for message in messages]
+
+
+def test_reply_is_added_with_its_stats():
+    client = client_for(FakeStream(["Hel", "lo"]))
+    conversation = Conversation()
+    assert "".join(client.stream(conversation, "hi")) == "Hello"
+    assert roles(conversation.history()) == ["user", "assistant"]
+    assert conversation.last_stats.tokens > 0
+    assert not conversation.last_stats.cached
+
+
+def test_failed_request_removes_the_prompt():
+    client = client_for(ConnectionError("offline"), FakeStream(["fine"]))
+    conversation = Conversation()
+    with pytest.raises(ConnectionError):
+        list(client.stream(conversation, "first"))
+    assert len(conversation) == 0
+    assert conversation.tokens == Conversation().tokens
+
+    list(client.stream(conversation, "second"))
+    assert roles(client._client.requests[1]) == ["system", "user"]
+    assert client._client.requests[1][-1]["content"] == "second"
+
+
+def test_failure_mid_stream_removes_the_prompt():
+    stream = FakeStream(["par"], error=ConnectionError("dropped"))
+    client = client_for(stream)
+    conversation = Conversation()
+    with pytest.raises(ConnectionError):
+        list(client.stream(conversation, "hi"))
+    assert len(conversation) == 0
+    assert stream.closed
+
+
+def test_abandoned_reply_removes_the_prompt():
+    client = client_for(FakeStream(["a", "b", "c"]))
+    conversation = Conversation()
+    replies = client.stream(conversation, "hi")
+    next(replies)
+    replies.close()
+    assert len(conversation) == 0
+
+
+def test_stats_are_kept_per_conversation():
+    client = client_for(FakeStream(["one"]), FakeStream(["two", " words"]))
+    first, second = Conversation(), Conversation()
+    list(client.stream(first, "a"))
+    list(client.stream(second, "b"))
+    assert first.last_stats is not second.last_stats
+    assert first.last_stats.tokens < second.last_stats.tokens
@@ -0,0 +1,77 @@
+import time
+
+from Assistant.connectivity import ConnectivityMonitor, probe_endpoints
+
+
+def test_probe_succeeds_when_one_endpoint_listens(listening_endpoint, closed_endpoint):
+    assert probe_endpoints([closed_endpoint, listening_endpoint], timeout=1) is True
+
+
+def test_probe_fails_when_nothing_listens(closed_endpoint):
+    assert probe_endpoints([closed_endpoint, closed_endpoint], timeout=1) is False
+
+
+def test_first_success_does_not_wait_for_hung_endpoints(hanging_endpoint, listening_endpoint):
+    started = time.perf_counter()
+    assert probe_endpoints([hanging_endpoint, hanging_endpoint, listening_endpoint], timeout=3) is True
+    assert time.perf_counter() - started < 1
+
+
+def test_probe_gives_up_after_timeout(hanging_endpoint):
+    started = time.perf_counter()
+    assert probe_endpoints([hanging_endpoint], timeout=0.3) is False
+    assert time.perf_counter() - started < 2
+
+
+def test_status_is_unknown_and_stale_before_first_probe(listening_endpoint):
+    monitor = ConnectivityMonitor(local_endpoints=[listening_endpoint], internet_endpoints=[listening_endpoint])
+    status = monitor.get_status()
+    assert status.local is None and status.internet is None
+    assert status.stale
+
+
+def test_refresh_caches_each_result(listening_endpoint, closed_endpoint):
+    monitor = ConnectivityMonitor(local_endpoints=[listening_endpoint], internet_endpoints=[closed_endpoint],
+                                  local_timeout=0.5, internet_timeout=0.5)
+    monitor.refresh()
+    status = monitor.get_status()
+    assert status.local is True
+    assert status.internet is False
+    assert not status.stale
+
+
+def test_status_goes_stale_after_ttl(listening_endpoint):
+    monitor = ConnectivityMonitor(ttl=0.05, local_endpoints=[listening_endpoint],
+                                  internet_endpoints=[listening_endpoint])
+    monitor.refresh()
+    assert not monitor.get_status().stale
+    time.sleep(0.1)
+    status = monitor.get_status()
+    assert status.stale
+    assert status.local is True  # the last known state is still reported
+
+
+def test_get_status_never_blocks_on_hung_probes(hanging_endpoint):
+    monitor = ConnectivityMonitor(interval=60, local_endpoints=[hanging_endpoint],
+                                  internet_endpoints=[hanging_endpoint], local_timeout=2, internet_timeout=2)
+    monitor.start()
+    try:
+        started = time.perf_counter()
+        status = monitor.get_status()
+        assert time.perf_counter() - started < 0.01
+        assert status.local is None
+    finally:
+        monitor.stop(timeout=0)
+
+
+def test_background_thread_probes_on_start(listening_endpoint):
+    monitor = ConnectivityMonitor(interval=60, local_endpoints=[listening_endpoint],
+                                  internet_endpoints=[listening_endpoint]).start()
+    try:
+        deadline = time.monotonic() + 5
+        while monitor.get_status().checked_at == 0.0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        status = monitor.get_status()
+        assert status.local is True and status.internet is True
+    finally:
+        monitor.stop()
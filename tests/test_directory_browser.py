@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+from Assistant import directory_browser
+from Assistant.directory_browser import DirectoryBrowser
+
+
+@pytest.fixture
+def folder(tmp_path):
+    for i in range(25):
+        (tmp_path / f"file_{i:02d}.txt").write_bytes(b"x" * i)
+    return tmp_path
+
+
+@pytest.fixture
+def browser():
+    browser = DirectoryBrowser()
+    yield browser
+    browser.close()
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Count the os.scandir calls made by the browser"""
+    opened = []
+    real_scandir = os.scandir
+
+    def scandir(path):
+        opened.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(directory_browser.os, "scandir", scandir)
+    return opened
+
+
+def read_all(browser, path, page_size):
+    pages = []
+    entries, cursor = browser.first_page(path, page_size)
+    pages.append(entries)
+    while cursor is not None:
+        entries, cursor = browser.page(cursor, page_size)
+        pages.append(entries)
+    return pages
+
+
+def test_pages_cover_the_folder_once(browser, folder):
+    pages = read_all(browser, folder, 10)
+    assert [len(page) for page in pages] == [10, 10, 5]
+    names = [entry.name for page in pages for entry in page]
+    assert sorted(names) == sorted(os.listdir(folder))
+
+
+def test_next_pages_reuse_one_scan(browser, folder, scans):
+    read_all(browser, folder, 10)
+    assert len(scans) == 1
+
+
+def test_paging_back_does_not_rescan(browser, folder, scans):
+    first, cursor = browser.first_page(folder, 10)
+    second, _ = browser.page(cursor, 10)
+    again, cursor_again = browser.first_page(folder, 10)
+    assert again == first
+    assert cursor_again == cursor
+    assert browser.page(cursor_again, 10)[0] == second
+    assert len(scans) == 1
+
+
+def test_changed_folder_is_listed_again(browser, folder, scans):
+    first, _ = browser.first_page(folder, 10)
+    (folder / "new.txt").write_text("new")
+    os.utime(folder, ns=(0, os.stat(folder).st_mtime_ns + 10**9))
+    pages = read_all(browser, folder, 10)
+    assert len(scans) == 2
+    assert "new.txt" in [entry.name for page in pages for entry in page]
+
+
+def test_cursor_without_an_open_listing_resumes_at_its_position(browser, folder):
+    pages = read_all(browser, folder, 10)
+    other = DirectoryBrowser()
+    try:
+        assert other.page(browser.first_page(folder, 10)[1], 10)[0] == pages[1]
+    finally:
+        other.close()
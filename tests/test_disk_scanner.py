@@ -0,0 +1,114 @@
+import threading
+import time
+from collections import namedtuple
+
+import pytest
+
+from Assistant.disk_scanner import PartitionScanner
+
+Partition = namedtuple("Partition", ["device", "mountpoint", "fstype"])
+Usage = namedtuple("Usage", ["total", "used", "free", "percent"])
+
+
+class FakeProvider:
+    """Partitions whose usage query takes a set delay, fails, or hangs until released"""
+
+    def __init__(self, delays):
+        self.delays = delays  # mountpoint -> seconds, "hang" or an exception
+        self.released = threading.Event()
+        self.calls = {}
+        self.lock = threading.Lock()
+
+    def partitions(self):
+        return [Partition(f"/dev/{i}", mountpoint, "ext4") for i, mountpoint in enumerate(self.delays)]
+
+    def usage(self, mountpoint):
+        with self.lock:
+            self.calls[mountpoint] = self.calls.get(mountpoint, 0) + 1
+        delay = self.delays[mountpoint]
+        if delay == "hang":
+            self.released.wait()
+        elif isinstance(delay, Exception):
+            raise delay
+        else:
+            time.sleep(delay)
+        return Usage(100, 40, 60, 40.0)
+
+
+@pytest.fixture
+def make_scanner():
+    providers = []
+
+    def make(delays, **kwargs):
+        providers.append(FakeProvider(delays))
+        return providers[-1], PartitionScanner(providers[-1], **kwargs)
+
+    yield make
+    for provider in providers:
+        provider.released.set()
+
+
+def test_fast_mounts_are_yielded_first(make_scanner):
+    _, scanner = make_scanner({"/slow": 0.2, "/fast": 0.0, "/medium": 0.1})
+    assert [result.mountpoint for result in scanner.scan()] == ["/fast", "/medium", "/slow"]
+
+
+def test_hung_mount_times_out_without_blocking_others(make_scanner):
+    _, scanner = make_scanner({"/hung": "hang", "/fast": 0.0}, timeout=0.2)
+    started = time.perf_counter()
+    results = {result.mountpoint: result for result in scanner.scan()}
+    assert time.perf_counter() - started < 1
+    assert results["/fast"].status == "ok"
+    assert results["/hung"].status == "timeout"
+    assert results["/hung"].usage is None
+
+
+def test_many_hung_mounts_do_not_starve_the_rest(make_scanner):
+    delays = {f"/hung{i}": "hang" for i in range(20)}
+    delays["/late"] = 0.05
+    _, scanner = make_scanner(delays, timeout=0.3)
+    results = {result.mountpoint: result for result in scanner.scan()}
+    assert results["/late"].status == "ok"
+    assert sum(result.status == "timeout" for result in results.values()) == 20
+
+
+def test_each_mount_gets_the_full_timeout(make_scanner):
+    delays = {f"/hung{i}": "hang" for i in range(10)}
+    delays["/slow"] = 0.15
+    _, scanner = make_scanner(delays, timeout=0.3)
+    assert {result.mountpoint: result.status for result in scanner.scan()}["/slow"] == "ok"
+
+
+def test_still_hanging_mount_is_not_queried_again(make_scanner):
+    provider, scanner = make_scanner({"/hung": "hang", "/fast": 0.0}, timeout=0.1, ttl=0)
+    scanner.scan_all()
+    results = {result.mountpoint: result for result in scanner.scan()}
+    assert results["/hung"].status == "timeout"
+    assert results["/hung"].error == "previous query has not returned yet"
+    assert provider.calls == {"/hung": 1, "/fast": 2}
+
+
+def test_late_result_is_used_once_the_mount_recovers(make_scanner):
+    provider, scanner = make_scanner({"/hung": "hang"}, timeout=0.1)
+    assert scanner.scan_all()[0].status == "timeout"
+    provider.released.set()
+    deadline = time.monotonic() + 2
+    while scanner.scan_all()[0].status != "ok" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert scanner.scan_all()[0].usage.percent == 40.0
+    assert provider.calls == {"/hung": 1}
+
+
+def test_results_are_cached_for_ttl(make_scanner):
+    provider, scanner = make_scanner({"/a": 0.0, "/b": 0.0}, ttl=60)
+    scanner.scan_all()
+    scanner.scan_all()
+    assert provider.calls == {"/a": 1, "/b": 1}
+
+
+def test_failing_mount_is_reported_as_error(make_scanner):
+    _, scanner = make_scanner({"/broken": PermissionError("access denied"), "/fast": 0.0})
+    results = {result.mountpoint: result for result in scanner.scan()}
+    assert results["/broken"].status == "error"
+    assert "access denied" in results["/broken"].error
+    assert results["/fast"].status == "ok"
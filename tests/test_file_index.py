@@ -0,0 +1,110 @@
+import pytest
+
+from Assistant import file_index
+from Assistant.file_index import FileIndex, default_index_path
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "tree"
+    for folder, names in {
+        "work": ["quarterly_report_2024.pdf", "invoice_march.xlsx"],
+        "work/old": ["report_2019.txt", "meeting notes.txt"],
+        "photos": ["holiday_beach.jpg", "report_card.png"]
+    }.items():
+        (root / folder).mkdir(parents=True)
+        for name in names:
+            (root / folder / name).write_text(name)
+    return root
+
+
+@pytest.fixture
+def index(tmp_path, tree):
+    index = FileIndex(str(tmp_path / "index.db"), [str(tree)])
+    index.update()
+    yield index
+    index.close()
+
+
+def names(results):
+    return sorted(result.name for result in results)
+
+
+def test_search_matches_every_word_in_any_order(index):
+    assert names(index.search("report")) == ["quarterly_report_2024.pdf", "report_2019.txt", "report_card.png"]
+    assert names(index.search("2024 REPORT")) == ["quarterly_report_2024.pdf"]
+    assert index.search("re") == []
+
+
+def test_search_under_a_folder(index, tree):
+    assert names(index.search("report", under=str(tree / "work"))) == ["quarterly_report_2024.pdf",
+                                                                       "report_2019.txt"]
+    assert names(index.search("report", under=str(tree / "work" / "old"))) == ["report_2019.txt"]
+    # A sibling whose name starts the same is not inside the folder
+    (tree / "work2").mkdir()
+    (tree / "work2" / "report_x.txt").write_text("")
+    index.update()
+    assert "report_x.txt" not in names(index.search("report", under=str(tree / "work")))
+
+
+def test_typos_fall_back_to_similar_names(index):
+    assert names(index.search("reprot 2019")) == ["report_2019.txt"]
+    assert names(index.search("invoce")) == ["invoice_march.xlsx"]
+    assert index.search("reprot", fuzzy=False) == []
+    assert index.search("zzzqqq") == []
+
+
+def test_add_root_folds_nested_roots(tmp_path, tree):
+    index = FileIndex(str(tmp_path / "index.db"))
+    try:
+        assert index.add_root(str(tree / "work"))
+        index.update()
+        assert names(index.search("report")) == ["quarterly_report_2024.pdf", "report_2019.txt"]
+        assert not index.add_root(str(tree / "work" / "old"))
+        assert index.add_root(str(tree))
+        assert index.roots == [str(tree)]
+        index.update()
+        assert len(index.search("report")) == 3
+
+        # The former root is now reached through its parent on incremental scans
+        (tree / "work" / "report_new.txt").write_text("")
+        assert index.update()["skipped"]
+        assert "report_new.txt" in names(index.search("report"))
+    finally:
+        index.close()
+
+
+def test_skipped_folders_are_not_walked(tmp_path, tree):
+    index = FileIndex(str(tmp_path / "index.db"), [str(tree)], skip=[])
+    try:
+        index.update()
+        assert "report_card.png" in names(index.search("report"))
+        index.skip = {str(tree / "photos")}
+        index.update(full=True)
+        assert "report_card.png" not in names(index.search("report"))
+        assert "photos" in names(index.search("photos"))
+    finally:
+        index.close()
+
+
+def test_scanning_covers_a_requested_refresh(tmp_path, tree):
+    index = FileIndex(str(tmp_path / "index.db"))
+    try:
+        assert not index.covers(str(tree / "work"))
+        index.add_root(str(tree))
+        assert index.covers(str(tree / "work")) and not index.covers(str(tmp_path))
+        # Asked for but not started yet still counts, so a poller never sees a gap
+        assert index.scanning
+        index.update()
+        assert not index.scanning
+    finally:
+        index.close()
+
+
+def test_default_index_path(monkeypatch, tmp_path):
+    monkeypatch.setenv("JEEVA_INDEX_PATH", str(tmp_path / "custom.db"))
+    assert default_index_path() == str(tmp_path / "custom.db")
+    monkeypatch.delenv("JEEVA_INDEX_PATH")
+    monkeypatch.setattr(file_index.platform, "system", lambda: "Linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    assert default_index_path() == str(tmp_path / "cache" / "jeeva" / "file_index.db")
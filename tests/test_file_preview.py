@@ -0,0 +1,132 @@
+import os
+
+import pytest
+
+from Assistant import file_preview
+from Assistant.file_preview import FilePreview, get_preview, looks_binary
+
+LINES = [f"line {i:05d} " + "x" * (i % 40) for i in range(5000)]
+
+
+@pytest.fixture
+def text_file(tmp_path, monkeypatch):
+    # Small checkpoints so the sparse line index is exercised across many chunks
+    monkeypatch.setattr(file_preview, "INDEX_CHUNK", 1024)
+    path = tmp_path / "log.txt"
+    path.write_text("\n".join(LINES) + "\n")
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    yield
+    with file_preview._previews_lock:
+        previews = list(file_preview._previews.values())
+        file_preview._previews.clear()
+    for preview in previews:
+        preview.close()
+
+
+def test_head_and_tail(text_file):
+    with FilePreview(text_file) as preview:
+        assert not preview.binary
+        assert preview.head(3) == LINES[:3]
+        assert preview.tail(3) == LINES[-3:]
+        assert preview.tail(10000) == LINES
+
+
+def test_line_windows(text_file):
+    with FilePreview(text_file) as preview:
+        assert preview.lines(0, 2) == LINES[:2]
+        assert preview.lines(2500, 3) == LINES[2500:2503]
+        assert preview.lines(4999, 5) == LINES[4999:]
+        assert preview.lines(5000) == []
+        assert preview.lines(100, 2) == LINES[100:102]
+        assert preview.build_index() == len(LINES)
+
+
+def test_offset_windows(text_file):
+    data = open(text_file, "rb").read()
+    with FilePreview(text_file) as preview:
+        middle = data.index(LINES[1234].encode()) + 5
+        assert preview.at_offset(middle, 2) == LINES[1234:1236]
+        assert preview.at_offset(0, 1) == LINES[:1]
+        assert preview.read(middle - 5, 10) == data[middle - 5:middle + 5]
+
+
+def test_binary_detection(tmp_path):
+    assert looks_binary(b"abc\x00def")
+    assert not looks_binary("naïve café\n".encode())
+    # A multi-byte character cut off by the sample is still text
+    assert not looks_binary("é".encode() * 10 + "é".encode()[:1])
+    path = tmp_path / "blob.bin"
+    path.write_bytes(bytes(range(256)) * 4)
+    with FilePreview(str(path)) as preview:
+        assert preview.binary
+        assert preview.hex(16, 16).startswith("00000010  10 11 12")
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    with FilePreview(str(path)) as preview:
+        assert preview.head() == [] and preview.tail() == [] and preview.lines(0) == []
+
+
+def test_rejects_what_is_not_a_regular_file(tmp_path):
+    with pytest.raises(OSError):
+        get_preview(str(tmp_path))
+    if hasattr(os, "mkfifo"):
+        fifo = tmp_path / "pipe"
+        os.mkfifo(fifo)
+        # Would block in open() if it were not refused first
+        with pytest.raises(OSError):
+            get_preview(str(fifo))
+
+
+def test_truncated_file_raises_instead_of_crashing(text_file):
+    preview = get_preview(text_file)
+    try:
+        assert preview.head(1) == LINES[:1]
+        os.truncate(text_file, 10)
+        for read in (lambda: preview.head(5), lambda: preview.tail(5), lambda: preview.lines(4000),
+                     lambda: preview.at_offset(50000), lambda: preview.hex(50000)):
+            with pytest.raises(OSError):
+                read()
+    finally:
+        preview.release()
+    reopened = get_preview(text_file)
+    try:
+        assert reopened is not preview
+        assert reopened.head() == [LINES[0][:10]]
+    finally:
+        reopened.release()
+
+
+def test_changed_file_stays_readable_for_sessions_holding_it(text_file):
+    held = get_preview(text_file)
+    with open(text_file, "a") as f:
+        f.write("appended\n")
+    fresh = get_preview(text_file)
+    assert fresh is not held
+    # The first session still reads its mapping after the cache moved on
+    assert held.head(1) == LINES[:1]
+    assert fresh.tail(1) == ["appended"]
+    held.release()
+    with pytest.raises(ValueError):
+        held.head(1)
+    fresh.release()
+    assert fresh.head(1) == LINES[:1]
+
+
+def test_eviction_waits_for_release(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_preview, "MAX_OPEN_PREVIEWS", 1)
+    first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+    first.write_text("a\n")
+    second.write_text("b\n")
+    held = get_preview(str(first))
+    get_preview(str(second)).release()
+    assert held.head() == ["a"]
+    held.release()
+    with pytest.raises(ValueError):
+        held.head()
@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+
+import pytest
+
+from Assistant import app_catalog, assistant
+from Assistant.intents import IntentRouter, normalize_utterance, spoken_email
+
+KNOWN_APPS = {"visual studio code", "google chrome"}
+
+
+@pytest.fixture(autouse=True)
+def catalog(monkeypatch):
+    fake = SimpleNamespace(contains=lambda name: name.strip().lower() in KNOWN_APPS)
+    monkeypatch.setattr(app_catalog, "get_app_catalog", lambda: fake)
+
+
+@pytest.fixture
+def router():
+    return IntentRouter()
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Replace the handlers with ones that record their arguments"""
+    recorded = []
+    for name in ("get_weather", "open_app", "send_email"):
+        def handler(_name=name, **kwargs):
+            recorded.append((_name, kwargs))
+            return "done"
+        monkeypatch.setattr(assistant, name, handler)
+    return recorded
+
+
+@pytest.mark.parametrize("text, intent, slots", [
+    ("What's the weather in New York?", "get_weather", {"city": "new york"}),
+    ("Hey Jeeva, is it raining in Pune", "get_weather", {"city": "pune"}),
+    ("London weather please", "get_weather", {"city": "london"}),
+    ("Open Notepad.", "open_app", {"app_name": "notepad"}),
+    ("please launch the calculator app", "open_app", {"app_name": "calculator"}),
+    ("Start Visual Studio Code", "open_app", {"app_name": "visual studio code"}),
+    ("run firefox-esr now", "open_app", {"app_name": "firefox-esr"}),
+    ("Email rahul at example dot com saying I'm late", "send_email",
+     {"to": "rahul@example.com", "body": "i'm late"}),
+    ("send a message to priya@example.com about lunch saying see you at one", "send_email",
+     {"to": "priya@example.com", "subject": "lunch", "body": "see you at one"}),
+])
+def test_commands_route_to_their_intent(router, text, intent, slots):
+    match = router.match(text)
+    assert match is not None and match.intent == intent
+    assert match.slots == slots
+
+
+@pytest.mark.parametrize("text", [
+    "run a marathon with me",
+    "start the day right",
+    "Can you open up about your feelings",
+    "Who is the president of the USA?",
+    "Tell me a fun fact.",
+    "Weather",
+    "send",
+    "open",
+])
+def test_chit_chat_falls_through(router, text):
+    assert router.match(text) is None
+
+
+def test_dispatch_calls_the_handler(router, calls):
+    match, result = router.dispatch("open notepad")
+    assert match.intent == "open_app" and result == "done"
+    assert calls == [("open_app", {"app_name": "notepad"})]
+
+
+def test_email_without_an_address_asks_instead_of_sending(router, calls):
+    match, result = router.dispatch("send an email to rahul saying hello")
+    assert match.intent == "send_email"
+    assert "full email address" in result
+    assert calls == []
+
+
+def test_email_without_a_body_asks_instead_of_sending(router, calls):
+    _, result = router.dispatch("send an email to rahul at example dot com")
+    assert "What should the email to rahul@example.com say" in result
+    assert calls == []
+
+
+def test_complete_email_is_sent_with_the_default_subject(router, calls):
+    router.dispatch("email rahul at example dot com saying running late")
+    assert calls == [("send_email", {"to": "rahul@example.com", "subject": "Message from JeevaAI",
+                                     "body": "running late"})]
+
+
+def test_chit_chat_reaches_no_handler(router, calls):
+    assert router.dispatch("start the day right") == (None, None)
+    assert calls == []
+
+
+def test_normalizing_spoken_text():
+    assert normalize_utterance("Open   Notepad, please!") == "open notepad please"
+    assert normalize_utterance("It’s a.b@c.com.") == "it's a.b@c.com"
+    assert spoken_email("rahul at example dot co dot uk") == "rahul@example.co.uk"
+    assert spoken_email("the team") == "the team"
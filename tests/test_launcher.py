@@ -0,0 +1,93 @@
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from Assistant import launcher
+from Assistant.launcher import EXITED, FAILED, RUNNING, TIMEOUT, AppLauncher
+
+SLEEPER = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+
+@pytest.fixture
+def app_launcher():
+    app_launcher = AppLauncher(start_timeout=0.2, grace=1.0, poll_interval=0.02)
+    yield app_launcher
+    for record in app_launcher.running():
+        record.process.kill()
+    app_launcher.close()
+
+
+@pytest.fixture
+def slow_popen(monkeypatch):
+    """Hold Popen until ``release`` is set; started processes are collected in ``processes``"""
+    held = SimpleNamespace(release=threading.Event(), processes=[])
+    real_popen = subprocess.Popen
+
+    def popen(*args, **kwargs):
+        held.release.wait(5)
+        held.processes.append(real_popen(*args, **kwargs))
+        return held.processes[-1]
+
+    monkeypatch.setattr(launcher.subprocess, "Popen", popen)
+    yield held
+    for process in held.processes:
+        process.kill()
+        process.wait()
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met")
+        time.sleep(0.01)
+
+
+def test_launch_runs_and_is_watched_until_it_exits(app_launcher):
+    record = app_launcher.launch([sys.executable, "-c", "import time; time.sleep(0.3)"])
+    assert app_launcher.pending()
+    wait_for(lambda: record.status == RUNNING)
+    assert not app_launcher.pending()
+    wait_for(lambda: record.status == EXITED)
+    assert record.returncode == 0
+
+
+def test_error_exit_within_grace_fails(app_launcher):
+    record = app_launcher.launch([sys.executable, "-c", "raise SystemExit(3)"])
+    wait_for(lambda: record.finished)
+    assert record.status == FAILED
+    assert record.returncode == 3
+
+
+def test_missing_executable_fails(app_launcher):
+    record = app_launcher.launch(["jeeva-no-such-program"])
+    wait_for(lambda: record.finished)
+    assert record.status == FAILED
+    assert record.error
+
+
+def test_late_start_after_timeout_is_tracked(app_launcher, slow_popen):
+    record = app_launcher.launch(SLEEPER)
+    wait_for(lambda: record.status == TIMEOUT)
+    slow_popen.release.set()
+    wait_for(lambda: record.status == RUNNING)
+    assert record.error is None and record.ended_at is None
+    assert record.pid == slow_popen.processes[0].pid
+    assert app_launcher.terminate(record.id)
+    wait_for(lambda: record.finished)
+    assert record.returncode is not None
+
+
+def test_late_start_after_clearing_is_terminated(app_launcher, slow_popen):
+    record = app_launcher.launch(SLEEPER)
+    wait_for(lambda: record.status == TIMEOUT)
+    app_launcher.clear_finished()
+    slow_popen.release.set()
+    wait_for(lambda: slow_popen.processes)
+    assert slow_popen.processes[0].wait(5) is not None
+    assert record.process is None
+    assert record.status == TIMEOUT
@@ -0,0 +1,85 @@
+import math
+import struct
+import time
+import wave
+
+import pytest
+
+from Assistant.listener import ScriptedRecognizer, VoiceListener, WavFileSource
+
+SAMPLE_RATE = 16000
+
+
+@pytest.fixture
+def bursts(tmp_path):
+    """Write a WAV with ``count`` tone bursts separated by silence and return its path
+
+    The silence after the last burst is just longer than the recognizer's
+    pause threshold, so the file ends right after the last phrase.
+    """
+    def write(count):
+        silence = struct.pack("<h", 0) * int(SAMPLE_RATE * 1.5)
+        tail = struct.pack("<h", 0) * SAMPLE_RATE
+        tone = b"".join(struct.pack("<h", int(8000 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE)))
+                        for i in range(SAMPLE_RATE // 2))
+        path = str(tmp_path / f"bursts{count}.wav")
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(SAMPLE_RATE)
+            f.writeframes(silence + silence.join([tone] * count) + tail)
+        return path
+    return write
+
+
+def listener_for(path, texts, **kwargs):
+    kwargs.setdefault("calibration_duration", 0.2)
+    return VoiceListener(lambda: WavFileSource(path), ScriptedRecognizer(texts), **kwargs)
+
+
+def wait_until_finished(listener):
+    deadline = time.monotonic() + 10
+    while listener.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    listener.stop()
+
+
+def test_phrases_arrive_in_order(bursts):
+    listener = listener_for(bursts(3), ["one", "two", "three"]).start()
+    assert [phrase.text for phrase in listener.phrases(timeout=10)] == ["one", "two", "three"]
+    assert listener.stats == {"captured": 3, "recognized": 3, "unrecognized": 0, "dropped": 0, "errors": 0}
+    assert listener.calibrated and listener.error is None
+
+
+def test_phrase_timestamps_follow_capture(bursts):
+    listener = listener_for(bursts(1), ["one"]).start()
+    phrase, = listener.phrases(timeout=10)
+    assert phrase.audio.frame_data
+    assert phrase.captured_at <= phrase.recognized_at
+
+
+def test_unrecognized_phrases_are_counted(bursts):
+    listener = listener_for(bursts(2), ["one"]).start()
+    assert [phrase.text for phrase in listener.phrases(timeout=10)] == ["one"]
+    assert listener.stats["unrecognized"] == 1
+
+
+def test_end_of_input_keeps_the_newest_phrase(bursts):
+    texts = ["one", "two", "three"]
+    listener = listener_for(bursts(3), texts, max_phrases=1).start()
+    wait_until_finished(listener)
+    phrases = list(listener.phrases(timeout=1))
+    assert len(phrases) == 1
+    assert phrases[0].text == texts[listener.stats["recognized"] - 1]
+    assert listener.stats["dropped"] == 2
+
+
+def test_source_errors_are_reported(tmp_path):
+    errors = []
+    listener = VoiceListener(lambda: WavFileSource(str(tmp_path / "missing.wav")), ScriptedRecognizer([]),
+                             on_error=errors.append).start()
+    assert list(listener.phrases(timeout=10)) == []
+    assert isinstance(listener.error, FileNotFoundError)
+    assert errors == [listener.error]
+    assert listener.stats["errors"] == 1
+    assert not listener.running
@@ -0,0 +1,66 @@
+import smtplib
+
+import pytest
+
+from Assistant.mailer import MailSender, build_message
+
+
+@pytest.fixture
+def sender(smtp_server):
+    sender = MailSender("127.0.0.1", smtp_server.server_address[1], security="none", username="", password="",
+                        timeout=5)
+    yield sender
+    sender.close()
+
+
+def message(i=0):
+    return build_message("someone@example.com", f"Message {i}", "Hello", sender="me@example.com")
+
+
+def test_messages_share_one_session(sender, smtp_server):
+    assert sender.send_many([message(i) for i in range(3)]) == [None, None, None]
+    sender.send(message(3))
+    assert smtp_server.messages == 4
+    assert smtp_server.connections == 1
+    assert sender.stats == {"connects": 1, "sent": 4, "failed": 0}
+
+
+def test_reconnects_once_when_the_session_was_dropped(sender, smtp_server):
+    sender.send(message(1))
+    stale = sender._server
+    smtp_server.drop_connections()
+    sender.send(message(2))
+    assert smtp_server.messages == 2
+    assert sender.stats["connects"] == 2
+    # The dropped session is closed before the new one is opened
+    assert stale.sock is None and sender._server is not stale
+
+
+def test_no_resend_when_the_server_may_have_the_message(sender, smtp_server):
+    smtp_server.hang_up_after_data = True
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        sender.send(message())
+    assert smtp_server.messages == 1
+    assert sender.stats["connects"] == 1
+    assert sender._server is None
+
+
+def test_refused_message_keeps_the_session(sender, smtp_server):
+    smtp_server.reject_recipients = True
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        sender.send(message(1))
+    smtp_server.reject_recipients = False
+    sender.send(message(2))
+    assert smtp_server.messages == 1
+    assert smtp_server.connections == 1
+
+
+def test_outbox_resolves_each_handle(sender, smtp_server):
+    handles = [sender.submit(message(i)) for i in range(5)]
+    assert [handle.result(timeout=5) for handle in handles] == ["Email sent successfully!"] * 5
+
+    smtp_server.reject_recipients = True
+    failed = sender.submit(message(5))
+    assert isinstance(failed.exception(timeout=5), smtplib.SMTPRecipientsRefused)
+    assert smtp_server.messages == 5
+    assert sender.stats == {"connects": 1, "sent": 5, "failed": 1}
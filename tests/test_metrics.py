@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+
+from Assistant.metrics import MetricsRegistry
+
+
+def in_other_thread(func):
+    thread = threading.Thread(target=func)
+    thread.start()
+    thread.join()
+
+
+def test_calls_are_merged_across_threads():
+    registry = MetricsRegistry()
+    registry.record("call", 0.002)
+    in_other_thread(lambda: registry.record("call", 0.2, ValueError()))
+    stats = registry.collect()["call"]
+    assert stats.count == 2
+    assert stats.errors == {"ValueError": 1}
+    assert stats.max == 0.2
+
+
+def test_reset_starts_from_zero():
+    registry = MetricsRegistry()
+    registry.record("call", 0.5, ValueError())
+    in_other_thread(lambda: registry.record("call", 0.2))
+    registry.reset()
+    stats = registry.collect()["call"]
+    assert (stats.count, stats.sum, stats.max, stats.errors) == (0, 0.0, 0.0, {})
+
+    registry.record("call", 0.01, KeyError())
+    stats = registry.collect()["call"]
+    assert stats.count == 1 and stats.errors == {"KeyError": 1}
+    assert stats.sum == pytest.approx(0.01) and stats.max == 0.01
+
+
+def test_reset_keeps_calls_in_flight_on_other_threads():
+    registry = MetricsRegistry()
+    started, finish = threading.Event(), threading.Event()
+
+    def slow_call():
+        stats = registry.stats("slow")
+        stats.in_flight += 1
+        started.set()
+        finish.wait(5)
+        stats.observe(0.3)
+        stats.in_flight -= 1
+
+    worker = threading.Thread(target=slow_call)
+    worker.start()
+    started.wait(5)
+    registry.reset()
+    assert registry.collect()["slow"].in_flight == 1
+    finish.set()
+    worker.join()
+
+    stats = registry.collect()["slow"]
+    assert stats.in_flight == 0
+    assert stats.count == 1
+
+
+def test_summary_after_reset_and_retired_threads():
+    registry = MetricsRegistry()
+    in_other_thread(lambda: registry.record("call", 0.1))
+    registry.reset()
+    in_other_thread(lambda: registry.record("call", 0.02))
+    row, = registry.summary()
+    assert row["calls"] == 1 and row["in_flight"] == 0
+    assert row["max_ms"] == 20.0
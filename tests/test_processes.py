@@ -0,0 +1,99 @@
+import time
+from types import SimpleNamespace
+
+from Assistant.processes import ProcessSampler
+
+
+class FakeProvider:
+    """Processes described by dicts; each read burns ``read_cost`` seconds of CPU"""
+
+    def __init__(self, processes, read_cost=0.0):
+        self.processes = processes
+        self.read_cost = read_cost
+        self.forgotten = []
+        self.reads = []
+
+    def pids(self):
+        return list(self.processes)
+
+    def read(self, pid):
+        self.reads.append(pid)
+        started = time.thread_time()
+        while time.thread_time() - started < self.read_cost:
+            pass
+        process = self.processes.get(pid)
+        if process is None:
+            return None
+        return {
+            "pid": pid,
+            "name": process.get("name", f"proc{pid}"),
+            "username": "user",
+            "create_time": process.get("create_time", 1.0),
+            "cpu_times": SimpleNamespace(user=process.get("cpu", 0.0), system=0.0),
+            "memory_info": SimpleNamespace(rss=process.get("rss", 0)),
+            "io_counters": SimpleNamespace(read_bytes=process.get("io", 0), write_bytes=0)
+        }
+
+    def forget(self, pid):
+        self.forgotten.append(pid)
+
+
+def test_sweep_is_spread_over_ticks():
+    provider = FakeProvider({pid: {} for pid in range(20)}, read_cost=0.002)
+    sampler = ProcessSampler(provider, budget=0.005)
+    reads = [sampler.tick()]
+    assert 1 <= reads[0] < 20
+    assert len(sampler) == reads[0] and sampler.sweeps == 0
+    while sampler.sweeps == 0:
+        reads.append(sampler.tick())
+    assert sum(reads) == 20
+    assert len(sampler) == 20
+    assert sampler.last_sweep_seconds is not None
+
+    # The next tick starts a new sweep from the first pid
+    provider.reads.clear()
+    sampler.tick()
+    assert provider.reads[0] == 0
+
+
+def test_vanished_processes_are_dropped_after_a_sweep():
+    provider = FakeProvider({1: {}, 2: {}, 3: {}})
+    sampler = ProcessSampler(provider, budget=1.0)
+    sampler.tick()
+    del provider.processes[2]
+    sampler.tick()
+    assert len(sampler) == 2
+    assert provider.forgotten == [2]
+
+
+def test_top_orders_by_the_requested_measure():
+    processes = {
+        1: {"name": "editor", "cpu": 1.0, "rss": 300 * 1024**2, "io": 0},
+        2: {"name": "compiler", "cpu": 1.0, "rss": 100 * 1024**2, "io": 0},
+        3: {"name": "backup", "cpu": 1.0, "rss": 200 * 1024**2, "io": 0}
+    }
+    provider = FakeProvider(processes)
+    sampler = ProcessSampler(provider, budget=1.0)
+    sampler.tick()
+    time.sleep(0.01)
+    processes[1]["cpu"] += 0.001
+    processes[2]["cpu"] += 0.005
+    processes[2]["io"] += 1024**2
+    processes[3]["io"] += 50 * 1024**2
+    sampler.tick()
+
+    assert [p["name"] for p in sampler.top(by="cpu")] == ["compiler", "editor", "backup"]
+    assert [p["name"] for p in sampler.top(by="memory")] == ["editor", "backup", "compiler"]
+    assert [p["name"] for p in sampler.top(2, by="io")] == ["backup", "compiler"]
+    assert sampler.top(1, by="memory")[0]["memory_mb"] == 300.0
+
+
+def test_restarted_pid_starts_fresh():
+    processes = {1: {"cpu": 5.0, "create_time": 1.0}}
+    sampler = ProcessSampler(FakeProvider(processes), budget=1.0)
+    sampler.tick()
+    time.sleep(0.01)
+    # Same pid, new process with less CPU time than the old one
+    processes[1] = {"cpu": 0.5, "create_time": 2.0}
+    sampler.tick()
+    assert sampler.top()[0]["cpu_percent"] == 0.0
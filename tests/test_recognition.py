@@ -0,0 +1,110 @@
+import os
+import wave
+
+import pytest
+import speech_recognition as sr
+
+from Assistant.recognition import (BACKENDS, AutoBackend, ModelBackend, RecognizerBackend, SetupError, VoskBackend,
+                                   WhisperBackend, batch_transcribe)
+
+
+class FakeModelBackend(ModelBackend):
+    name = "fake"
+
+    def __init__(self, present=True):
+        super().__init__()
+        self.present = present
+        self.loads = 0
+
+    def model_present(self):
+        return self.present
+
+    def load_model(self):
+        self.loads += 1
+        return f"model {self.loads}"
+
+    def recognize(self, recognizer, audio):
+        return f"heard with {self.model()}"
+
+
+class FailingBackend(RecognizerBackend):
+    def __init__(self, error):
+        self.error = error
+        self.calls = 0
+
+    def recognize(self, recognizer, audio):
+        self.calls += 1
+        raise self.error
+
+
+class EchoBackend(RecognizerBackend):
+    def recognize(self, recognizer, audio):
+        return f"{len(audio.frame_data)} bytes"
+
+
+def offline():
+    return type("Status", (), {"internet": False})()
+
+
+def online():
+    return type("Status", (), {"internet": True})()
+
+
+def test_backend_without_recognize_cannot_be_created():
+    class Incomplete(RecognizerBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_model_is_loaded_once():
+    backend = FakeModelBackend()
+    assert [backend.recognize(None, None) for _ in range(3)] == ["heard with model 1"] * 3
+    assert backend.loads == 1
+
+
+def test_missing_model_is_unavailable_and_raises_setup_error(tmp_path):
+    backend = FakeModelBackend(present=False)
+    assert not backend.available()
+    with pytest.raises(SetupError):
+        backend.recognize(None, None)
+    assert not VoskBackend(model_path=str(tmp_path / "missing")).model_present()
+    assert not WhisperBackend("base", download_root=str(tmp_path)).model_present()
+    (tmp_path / "base.pt").write_bytes(b"")
+    assert WhisperBackend("base", download_root=str(tmp_path)).model_present()
+
+
+def test_offline_engine_that_cannot_be_set_up_is_skipped():
+    broken = FailingBackend(SetupError("no model"))
+    auto = AutoBackend(status=offline, offline_backends=[broken, FakeModelBackend()])
+    assert auto.recognize(None, None) == "heard with model 1"
+    assert auto.recognize(None, None) == "heard with model 1"
+    assert broken.calls == 1
+
+
+def test_no_usable_offline_engine_is_a_request_error():
+    auto = AutoBackend(status=online, online_backend=FailingBackend(sr.RequestError("offline")),
+                       offline_backends=[FailingBackend(SetupError("no model"))])
+    with pytest.raises(sr.RequestError):
+        auto.recognize(None, None)
+    assert auto.offline_backend is None
+
+
+def test_batch_reports_unreadable_files_and_keeps_going(tmp_path, monkeypatch):
+    # Registered before the worker processes fork, so they find it too
+    monkeypatch.setitem(BACKENDS, "echo", EchoBackend)
+    with wave.open(str(tmp_path / "good.wav"), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(16000)
+        f.writeframes(b"\0\0" * 8000)
+    (tmp_path / "broken.wav").write_bytes(b"not audio at all")
+
+    results, stats = batch_transcribe(str(tmp_path), "echo", workers=1)
+    by_name = {os.path.basename(path): (text, seconds, error) for path, text, seconds, error in results}
+    assert by_name["good.wav"] == ("16000 bytes", 0.5, None)
+    text, seconds, error = by_name["broken.wav"]
+    assert text is None and seconds == 0.0 and "ValueError" in error
+    assert stats["files"] == 2 and stats["failed"] == 1
+    assert stats["audio_seconds"] == 0.5
@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+from Assistant.speech import NullDriver, SpeechService
+
+
+class BlockingDriver(NullDriver):
+    """NullDriver that holds each utterance until released or cancelled"""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def speak(self, text, cancelled):
+        self.started.set()
+        while not self.release.is_set() and not cancelled.wait(0.01):
+            pass
+        super().speak(text, cancelled)
+
+
+@pytest.fixture
+def service():
+    services = []
+
+    def make(driver=None, **kwargs):
+        services.append(SpeechService(driver or NullDriver(), **kwargs))
+        return services[-1]
+
+    yield make
+    for created in services:
+        created.close()
+
+
+def test_speak_waits_until_spoken(service):
+    speech = service()
+    assert speech.speak("hello", timeout=5) is True
+    assert speech.driver.spoken == ["hello"]
+
+
+def test_speak_returns_false_when_dropped_by_interrupt(service):
+    driver = BlockingDriver()
+    speech = service(driver)
+    speech.speak_async("current")
+    assert driver.started.wait(5)
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(speech.speak("queued", timeout=5)))
+    waiter.start()
+    while not speech.pending():
+        time.sleep(0.01)
+    speech.speak_async("urgent", interrupt=True)
+    waiter.join(5)
+    driver.release.set()
+    assert result == [False]
+
+
+def test_speak_returns_false_when_dropped_for_space(service):
+    driver = BlockingDriver()
+    speech = service(driver, max_pending=1)
+    speech.speak_async("current")
+    assert driver.started.wait(5)
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(speech.speak("old", timeout=5)))
+    waiter.start()
+    while not speech.pending():
+        time.sleep(0.01)
+    newer = speech.speak_async("new", priority=1)
+    waiter.join(5)
+    driver.release.set()
+    assert result == [False]
+    assert newer.result(5) is True
+
+
+def test_oldest_is_dropped_within_a_priority(service):
+    driver = BlockingDriver()
+    speech = service(driver, max_pending=2)
+    speech.speak_async("busy")
+    assert driver.started.wait(5)
+    futures = [speech.speak_async(text) for text in ("one", "two", "three")]
+    driver.release.set()
+    assert futures[0].cancelled()
+    assert [future.result(5) for future in futures[1:]] == [True, True]
+    assert driver.spoken == ["busy", "two", "three"]
+
+
+def test_interrupt_reports_the_cut_off_utterance(service):
+    speech = service(NullDriver(seconds_per_char=0.01))
+    first = speech.speak_async("a long sentence that takes a while to say")
+    time.sleep(0.05)
+    speech.speak_async("stop", interrupt=True)
+    assert first.result(5) is False
+
+
+def test_queued_order_is_kept_within_a_priority(service):
+    driver = BlockingDriver()
+    speech = service(driver)
+    speech.speak_async("busy")
+    assert driver.started.wait(5)
+    futures = [speech.speak_async(text) for text in ("one", "two")]
+    urgent = speech.speak_async("urgent", priority=1)
+    driver.release.set()
+    for future in futures + [urgent]:
+        future.result(5)
+    assert driver.spoken == ["busy", "urgent", "one", "two"]
+
+
+def test_queue_latency(service):
+    speech = service()
+    speech.speak("warm up", timeout=5)
+    latencies = []
+    for _ in range(50):
+        started = time.perf_counter()
+        speech.speak("hi", timeout=5)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    # Handing an utterance to the speech thread and back is a condition notify each way
+    assert latencies[len(latencies) // 2] < 0.01
+
+
+def test_throughput(service):
+    count = 2000
+    speech = service(max_pending=count)
+    started = time.perf_counter()
+    futures = [speech.speak_async(f"line {i}") for i in range(count)]
+    for future in futures:
+        future.result(10)
+    seconds = time.perf_counter() - started
+    assert len(speech.driver.spoken) == count
+    assert speech.stats["spoken"] == count
+    assert count / seconds > 1000
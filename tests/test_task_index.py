@@ -0,0 +1,89 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from Assistant.task_index import TaskIndex
+from Assistant.task_model import CATEGORIES, PRIORITIES
+
+
+def make_task(task_id, due, category="Work", priority="High", completed=False):
+    return {"id": task_id, "task": f"Task {task_id}", "priority": priority, "category": category,
+            "due_date": due, "date": "2025-01-01 09:00", "completed": completed}
+
+
+@pytest.fixture
+def tasks():
+    rng = random.Random(4)
+    return [make_task(i, f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:00",
+                      rng.choice(CATEGORIES), rng.choice(PRIORITIES), rng.random() < 0.3)
+            for i in range(1, 501)]
+
+
+def expected(tasks, category="All", priority="All", status="All"):
+    """The filter worked out the slow way: scan every task, then sort"""
+    matching = [t for t in tasks
+                if category in ("All", t["category"]) and priority in ("All", t["priority"])
+                and status in ("All", "Completed" if t["completed"] else "Active")]
+    return [t["id"] for t in sorted(matching, key=lambda t: (t["due_date"], t["id"]))]
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"status": "Active"},
+    {"status": "Completed"},
+    {"category": "Work"},
+    {"category": "Health", "priority": "Low"},
+    {"category": "Shopping", "priority": "High", "status": "Active"},
+    {"category": "Nowhere"},
+])
+@pytest.mark.parametrize("offset, limit", [(0, None), (0, 5), (10, 20), (0, 1000), (400, 50)])
+def test_filter_matches_a_full_scan(tasks, filters, offset, limit):
+    index = TaskIndex(tasks)
+    ids = [t["id"] for t in index.filter(limit=limit, offset=offset, **filters)]
+    want = expected(tasks, **filters)
+    assert ids == want[offset:] if limit is None else ids == want[offset:offset + limit]
+    assert index.count(**filters) == len(want)
+
+
+def test_equal_due_dates_are_ordered_by_id():
+    index = TaskIndex([make_task(i, "2025-03-01 10:00") for i in (3, 1, 2)])
+    assert [t["id"] for t in index.filter(category="Work", limit=2)] == [1, 2]
+
+
+def test_overdue_uses_active_tasks_only():
+    index = TaskIndex([
+        make_task(1, "2025-01-01 08:00"),
+        make_task(2, "2025-01-02 08:00", completed=True),
+        make_task(3, "2025-01-03 08:00"),
+        make_task(4, "2025-02-01 08:00")
+    ])
+    now = datetime(2025, 1, 10)
+    assert [t["id"] for t in index.overdue(now)] == [1, 3]
+    assert index.overdue_count(now) == 2
+
+
+def test_completion_updates_the_active_index():
+    index = TaskIndex([make_task(i, f"2025-01-0{i} 08:00") for i in range(1, 5)])
+    now = datetime(2025, 1, 10)
+    assert index.set_completed(2)
+    assert index.set_completed(2)  # already completed, nothing changes
+    assert [t["id"] for t in index.overdue(now)] == [1, 3, 4]
+    assert [t["id"] for t in index.filter(status="Active", limit=2)] == [1, 3]
+    assert index.count(status="Completed") == 1
+
+    assert index.set_completed(2, completed=False)
+    assert index.overdue_count(now) == 4
+    assert not index.set_completed(99)
+
+
+def test_readding_and_removing_keep_the_indexes_consistent():
+    index = TaskIndex([make_task(1, "2025-01-01 08:00"), make_task(2, "2025-01-02 08:00")])
+    index.add(make_task(1, "2025-01-05 08:00", category="Health"))
+    assert len(index) == 2
+    assert [t["id"] for t in index.filter()] == [2, 1]
+    assert index.count(category="Work") == 1
+
+    assert index.remove(1) and not index.remove(1)
+    assert [t["id"] for t in index.overdue(datetime(2025, 2, 1))] == [2]
+    assert index.get(1) is None and index.get(2)["due_date"] == "2025-01-02 08:00"
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+import pytest
+
+from Assistant.task_model import Task, TaskTable, decode_date, encode_date, encode_datetime
+
+
+def make_task(task_id=None, due="2025-03-01 17:30", completed=False, category="Work"):
+    task = {"task": "Write report", "priority": "High", "category": category, "due_date": due,
+            "date": "2025-01-01 09:00", "completed": completed}
+    return task if task_id is None else dict(id=task_id, **task)
+
+
+@pytest.mark.parametrize("value", ["1970-01-01 00:00", "2025-03-01 17:30", "2024-02-29 23:59", "1969-12-31 23:59"])
+def test_dates_round_trip(value):
+    assert decode_date(encode_date(value)) == value
+
+
+def test_dates_count_minutes_from_1970():
+    assert encode_date("1970-01-02 00:01") == 24 * 60 + 1
+    assert encode_date("2025-03-01 17:30") == encode_datetime(datetime(2025, 3, 1, 17, 30, 59))
+
+
+@pytest.mark.parametrize("value", [
+    "2025-03-01 17:30:45",
+    "2025-03-01T17:30",
+    "2025-03-01 17:30+02:00",
+    "2025-03-01",
+    "2025-W09-6 17:30",
+    "2025-13-01 17:30",
+    "01/03/2025 17:30"
+])
+def test_other_date_formats_are_rejected(value):
+    with pytest.raises(ValueError):
+        encode_date(value)
+
+
+def test_task_round_trip():
+    for data in (make_task(), make_task(7, completed=True), make_task(8, category="Gardening")):
+        task = Task.from_dict(data)
+        assert task.to_dict() == data
+        assert Task.from_dict(task.to_dict()) == task
+
+
+def test_task_table_round_trip_and_selection():
+    tasks = [make_task(1), make_task(2, "2025-02-01 08:00", completed=True), make_task(None, category="Health")]
+    table = TaskTable(tasks)
+    assert table.to_dicts() == tasks
+    assert table.select(category="Work") == [0, 1]
+    assert table.select(status="Active", category="Work") == [0]
+    assert table.due_before(datetime(2025, 3, 1, 17, 31)) == [0, 2]
+    table.set_completed(0)
+    assert table.row(0).completed and table.due_before(datetime(2025, 3, 2)) == [2]
@@ -0,0 +1,72 @@
+import os
+import pickle
+
+import pytest
+
+from Assistant.task_store import TaskStore
+
+
+def make_task(name, due, category="Work", priority="High", completed=False):
+    return {"task": name, "priority": priority, "category": category, "due_date": due,
+            "date": "2025-01-01 09:00", "completed": completed}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TaskStore(str(tmp_path / "tasks.db"))
+    yield store
+    store.close()
+
+
+def test_add_and_get_round_trip(store):
+    task = make_task("Write report", "2025-03-01 17:00")
+    task_id = store.add(task)
+    assert store.get(task_id) == dict(task, id=task_id)
+    assert store.get(task_id + 1) is None
+
+
+def test_query_filters_and_orders(store):
+    store.add_many([
+        make_task("c", "2025-03-03 09:00"),
+        make_task("a", "2025-03-01 09:00", category="Health"),
+        make_task("b", "2025-03-02 09:00", priority="Low", completed=True),
+        make_task("d", "2025-03-01 09:00")
+    ])
+    assert [t["task"] for t in store.query()] == ["a", "d", "b", "c"]
+    assert [t["task"] for t in store.query(order_by="id")] == ["c", "a", "b", "d"]
+    assert [t["task"] for t in store.query(category="Work", status="Active")] == ["d", "c"]
+    assert [t["task"] for t in store.query(priority="Low")] == ["b"]
+    assert [t["task"] for t in store.query(limit=2, offset=1)] == ["d", "b"]
+    assert store.count() == 4 and store.count(status="Completed") == 1 and store.count(category="Nowhere") == 0
+    with pytest.raises(ValueError):
+        store.query(order_by="task; DROP TABLE tasks")
+
+
+def test_completion_updates(store):
+    task_id = store.add(make_task("Call the bank", "2025-03-01 09:00"))
+    assert store.set_completed(task_id)
+    assert store.get(task_id)["completed"] is True
+    assert store.count(status="Active") == 0
+    assert store.set_completed(task_id, False)
+    assert store.get(task_id)["completed"] is False
+    assert not store.set_completed(task_id + 1)
+    with pytest.raises(ValueError):
+        store.update(task_id, owner="me")
+
+
+def test_pickle_is_migrated_once(tmp_path, store):
+    pickle_path = str(tmp_path / "tasks.pkl")
+    tasks = [make_task("old one", "2024-12-01 09:00"), make_task("old two", "2024-12-02 09:00", completed=True)]
+    with open(pickle_path, "wb") as f:
+        pickle.dump(tasks, f)
+
+    assert store.migrate_from_pickle(pickle_path) == 2
+    assert not os.path.exists(pickle_path) and os.path.exists(pickle_path + ".migrated")
+    assert [{k: v for k, v in t.items() if k != "id"} for t in store.query()] == tasks
+
+    # A pickle that shows up again is not imported twice
+    with open(pickle_path, "wb") as f:
+        pickle.dump(tasks, f)
+    assert store.migrate_from_pickle(pickle_path) == 0
+    assert store.count() == 2
+    assert store.migrate_from_pickle(str(tmp_path / "missing.pkl")) == 0
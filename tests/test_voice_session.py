@@ -0,0 +1,175 @@
+import queue
+import threading
+import time
+
+import pytest
+
+from Assistant.listener import Phrase
+from Assistant.speech import NullDriver, SpeechService
+from Assistant.voice_session import Turn, VoiceSession, iter_sentences
+
+
+class FakeListener:
+    """Stands in for VoiceListener: phrases are handed over with say()"""
+
+    def __init__(self):
+        self._phrases = queue.Queue()
+
+    def say(self, text):
+        now = time.perf_counter()
+        self._phrases.put(Phrase(text, None, now, now))
+
+    def finish(self):
+        self._phrases.put(None)
+
+    def start(self):
+        return self
+
+    def stop(self, wait=True):
+        self.finish()
+
+    def phrases(self):
+        while True:
+            phrase = self._phrases.get()
+            if phrase is None:
+                return
+            yield phrase
+
+
+class SlowDriver(NullDriver):
+    """NullDriver that reports when it starts speaking"""
+
+    def __init__(self, seconds_per_char=0.0):
+        super().__init__(seconds_per_char)
+        self.started = threading.Event()
+
+    def speak(self, text, cancelled):
+        self.started.set()
+        super().speak(text, cancelled)
+
+
+@pytest.fixture
+def session():
+    sessions = []
+
+    def make(respond, driver=None):
+        listener = FakeListener()
+        speech = SpeechService(driver or NullDriver())
+        sessions.append((VoiceSession(listener, respond, speech).start(), speech))
+        return listener, sessions[-1][0]
+
+    yield make
+    for created, speech in sessions:
+        created.stop()
+        speech.close()
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def finish(listener, voice_session):
+    listener.finish()
+    voice_session.join(5)
+
+
+@pytest.mark.parametrize("chunks, sentences", [
+    ("One. Two? Three!", ["One.", "Two?", "Three!"]),
+    (["It is sun", "ny. Tomor", "row rain."], ["It is sunny.", "Tomorrow rain."]),
+    ("First line\n\nSecond line", ["First line", "Second line"]),
+    (["Version 1.5 is out", " now"], ["Version 1.5 is out now"]),
+    (["  ", ""], []),
+])
+def test_sentence_splitting(chunks, sentences):
+    assert list(iter_sentences(chunks)) == sentences
+
+
+def test_closing_the_sentences_closes_the_stream():
+    closed = threading.Event()
+
+    def stream():
+        try:
+            while True:
+                yield "More words. "
+        finally:
+            closed.set()
+
+    sentences = iter_sentences(stream())
+    assert next(sentences) == "More words."
+    sentences.close()
+    assert closed.is_set()
+
+
+def test_replies_are_spoken_in_order(session):
+    listener, voice_session = session(lambda text: f"You said {text}. That is all.")
+    listener.say("hello")
+    # Saying the next phrase while the reply plays would cut it off
+    assert wait_for(lambda: voice_session.turns)
+    listener.say("goodbye")
+    finish(listener, voice_session)
+
+    assert voice_session.speech.driver.spoken == ["You said hello.", "That is all.",
+                                                  "You said goodbye.", "That is all."]
+    assert list(voice_session.turns) == [Turn(1, "hello", ["You said hello.", "That is all."], False),
+                                         Turn(2, "goodbye", ["You said goodbye.", "That is all."], False)]
+    latency = voice_session.latency()
+    assert latency["respond"]["count"] == 2 and latency["speak"]["count"] == 4
+
+
+def test_first_sentence_is_spoken_while_the_reply_streams(session):
+    release = threading.Event()
+
+    def respond(text):
+        yield "Right away. "
+        release.wait(5)
+        yield "Later."
+
+    listener, voice_session = session(respond)
+    listener.say("go")
+    assert wait_for(lambda: voice_session.speech.driver.spoken)
+    assert voice_session.speech.driver.spoken == ["Right away."]
+    release.set()
+    finish(listener, voice_session)
+    assert voice_session.speech.driver.spoken == ["Right away.", "Later."]
+
+
+def test_new_phrase_barges_in(session):
+    closed = threading.Event()
+
+    def respond(text):
+        if text == "second":
+            return "Short."
+        return long_reply()
+
+    def long_reply():
+        try:
+            while True:
+                yield "This sentence takes a long time to say. "
+        finally:
+            closed.set()
+
+    driver = SlowDriver(seconds_per_char=0.02)
+    listener, voice_session = session(respond, driver)
+    listener.say("first")
+    assert driver.started.wait(5)
+    listener.say("second")
+    finish(listener, voice_session)
+
+    assert closed.is_set()
+    assert driver.spoken == ["Short."]
+    assert list(voice_session.turns) == [Turn(1, "first", [], True), Turn(2, "second", ["Short."], False)]
+    assert voice_session.stats["barge_ins"] == 1
+
+
+def test_failed_reply_is_apologised_for(session):
+    def respond(text):
+        raise RuntimeError("model unavailable")
+
+    listener, voice_session = session(respond)
+    listener.say("hello")
+    finish(listener, voice_session)
+    assert voice_session.speech.driver.spoken == ["Sorry, something went wrong."]
+    assert voice_session.stats["errors"] == 1
@@ -0,0 +1,102 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from Assistant.weather import WeatherError
+
+
+def test_get_parses_current_conditions_and_forecast(weather_server, weather_client):
+    weather = weather_client(weather_server.url).get("London")
+    assert weather["temperature"] == "21"
+    assert weather["condition"] == "Sunny"
+    assert weather["hourly"]["time"] == ["2025-01-01 00:00"]
+
+
+def test_second_lookup_is_served_from_cache(weather_server, weather_client):
+    client = weather_client(weather_server.url)
+    client.get("London")
+    client.get("  london ")
+    assert weather_server.requests == ["London"]
+    stats = client.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_expired_entry_is_fetched_again(weather_server, weather_client):
+    client = weather_client(weather_server.url, ttl=0.05, serve_stale=False)
+    client.get("London")
+    time.sleep(0.1)
+    client.get("London")
+    assert len(weather_server.requests) == 2
+
+
+def test_stale_entry_is_served_while_upstream_is_slow(weather_server, weather_client):
+    client = weather_client(weather_server.url, ttl=0.05, stale_wait=0.05)
+    first = client.get("London")
+    time.sleep(0.1)
+    weather_server.delay = 0.5
+    started = time.perf_counter()
+    assert client.get("London") == first
+    assert time.perf_counter() - started < 0.4
+    assert client.stats()["stale_hits"] == 1
+
+
+def test_least_recently_used_city_is_evicted(weather_server, weather_client):
+    client = weather_client(weather_server.url, max_entries=2)
+    for city in ["London", "Paris", "London", "Tokyo"]:
+        client.get(city)
+    client.get("Paris")
+    assert weather_server.requests == ["London", "Paris", "Tokyo", "Paris"]
+
+
+def test_concurrent_lookups_share_one_request(weather_server, weather_client):
+    client = weather_client(weather_server.url)
+    weather_server.delay = 0.2
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.get("London"))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 5
+    assert weather_server.requests == ["London"]
+    assert client.stats()["coalesced"] == 4
+
+
+def test_connection_is_reused_between_requests(weather_server, weather_client):
+    client = weather_client(weather_server.url)
+    for city in ["London", "Paris", "Tokyo"]:
+        client.get(city)
+    assert len(weather_server.requests) == 3
+    assert len(weather_server.client_ports) == 1
+
+
+def test_error_status_raises_and_is_not_cached(weather_server, weather_client):
+    client = weather_client(weather_server.url)
+    weather_server.status = 503
+    with pytest.raises(WeatherError):
+        client.get("London")
+    weather_server.status = 200
+    assert client.get("London")["temperature"] == "21"
+    assert len(weather_server.requests) == 2
+    assert client.stats()["errors"] == 1
+
+
+def test_slow_response_hits_read_timeout(weather_server, weather_client):
+    client = weather_client(weather_server.url, read_timeout=0.1)
+    weather_server.delay = 0.5
+    with pytest.raises(requests.Timeout):
+        client.get("London")
+
+
+def test_unreachable_server_raises_connection_error(closed_endpoint, weather_client):
+    client = weather_client(f"http://{closed_endpoint[0]}:{closed_endpoint[1]}", connect_timeout=0.5)
+    with pytest.raises(requests.ConnectionError):
+        client.get("London")
+
+
+def test_empty_city_is_rejected(weather_server, weather_client):
+    with pytest.raises(WeatherError):
+        weather_client(weather_server.url).get("   ")
+    assert weather_server.requests == []
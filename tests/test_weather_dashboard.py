@@ -0,0 +1,18 @@
+from Assistant.weather import WeatherError
+
+
+def test_get_many_returns_errors_per_city(weather_server, weather_client):
+    client = weather_client(weather_server.url)
+    results = client.get_many(["London", "", "Paris"])
+    assert results["London"]["temperature"] == "21"
+    assert isinstance(results[""], WeatherError)
+    assert sorted(weather_server.requests) == ["London", "Paris"]
+
+
+def test_disk_cache_survives_a_new_client(weather_server, weather_client, tmp_path):
+    cache_path = str(tmp_path / "weather_cache.db")
+    weather_client(weather_server.url, cache_path=cache_path).get("London")
+    client = weather_client(weather_server.url, cache_path=cache_path)
+    assert client.get("London")["temperature"] == "21"
+    assert weather_server.requests == ["London"]
+    assert client.stats()["disk_hits"] == 1
@@ -0,0 +1,62 @@
+"""A local wttr.in stand-in for the weather tests"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+
+def j1_payload(city):
+    hour = {"time": "0", "tempC": "20", "FeelsLikeC": "19", "weatherDesc": [{"value": "Sunny"}],
+            "chanceofrain": "10", "precipMM": "0.0", "windspeedKmph": "5"}
+    return {
+        "current_condition": [{"temp_C": "21", "FeelsLikeC": "20", "weatherDesc": [{"value": "Sunny"}],
+                               "humidity": "40", "windspeedKmph": "7", "pressure": "1012", "visibility": "10",
+                               "precipMM": "0.0", "cloudcover": "5"}],
+        "nearest_area": [{"areaName": [{"value": city}]}],
+        "weather": [{"date": "2025-01-01", "hourly": [hour]}]
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        city = unquote(urlparse(self.path).path.strip("/"))
+        with server.lock:
+            server.requests.append(city)
+            server.client_ports.add(self.client_address[1])
+        time.sleep(server.delay)
+        if server.status != 200:
+            body = b"unavailable"
+        else:
+            body = json.dumps(j1_payload(city)).encode()
+        self.send_response(server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """wttr.in stand-in that records each request and the client port it came from"""
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.requests = []
+        self.client_ports = set()
+        self.delay = 0.0
+        self.status = 200
+        self.lock = threading.Lock()
+
+    def handle_error(self, request, client_address):
+        pass  # the client hung up on purpose in the timeout tests
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"